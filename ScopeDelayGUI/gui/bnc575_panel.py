@@ -447,6 +447,10 @@ class BNC575Panel(QWidget):
         conn_layout.addWidget(self.btn_connect)
         conn_layout.addWidget(self.btn_disconnect)
         conn_layout.addWidget(self.btn_fire)
+        # Rebuild the driver's shadow state after front-panel edits
+        self.btn_resync = QPushButton("Resync")
+        self.btn_resync.setToolTip("Re-read all settings from the unit after front-panel changes")
+        conn_layout.addWidget(self.btn_resync)
         conn_layout.addStretch()
         main_layout.addLayout(conn_layout)
         
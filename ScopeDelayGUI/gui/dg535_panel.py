@@ -202,6 +202,10 @@ class DG535Panel(QGroupBox):
         conn_row.addWidget(self.btn_connect)
         conn_row.addWidget(self.btn_disconnect)
         conn_row.addWidget(self.btn_clear)
+        # Rebuild the driver's shadow state after front-panel edits
+        self.btn_resync = QPushButton("Resync")
+        self.btn_resync.setToolTip("Re-read delays and trigger mode after front-panel changes")
+        conn_row.addWidget(self.btn_resync)
         layout.addLayout(conn_row)
 
         # Tab widget for organized controls
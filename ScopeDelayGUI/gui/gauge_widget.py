@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout
 from PyQt6.QtGui import QPainter, QPen, QColor
-from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtCore import Qt, QRectF, QObject, QTimer
 
 
 class GaugeWidget(QWidget):
@@ -24,9 +24,14 @@ class GaugeWidget(QWidget):
         layout.addWidget(self.text_label)
 
     def update_value(self, val):
-        self.value = max(self.min_value, min(self.max_value, val))
-        self.text_label.setText(f"{self.value:.1f} {self.label}")
-        self.repaint()
+        value = max(self.min_value, min(self.max_value, val))
+        text = f"{value:.1f} {self.label}"
+        if text == self.text_label.text() and value == self.value:
+            return
+        self.value = value
+        self.text_label.setText(text)
+        # update() schedules one coalesced repaint (repaint() draws immediately)
+        self.update()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -63,3 +68,36 @@ class GaugeWidget(QWidget):
         painter.drawArc(rect, start_angle, int(angle))
 
         painter.end()
+
+
+class GaugeRefreshTimer(QObject):
+    """
+    Latest-value store for gauges, pushed to the widgets at a fixed frame rate.
+
+    Data handlers call set(gauge, value) at any rate (cheap dict write);
+    a QTimer applies only the newest value of each gauge ~fps times per
+    second, so fast streams never drive repaints directly.
+    """
+
+    def __init__(self, fps: float = 30.0, parent=None):
+        super().__init__(parent)
+        self._pending = {}
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(1000 / fps))
+        self._timer.timeout.connect(self.refresh)
+
+    def set(self, gauge, value):
+        """Store the latest value for a gauge (shown on the next frame)."""
+        self._pending[gauge] = value
+
+    def refresh(self):
+        """Apply the stored values to their gauges."""
+        pending, self._pending = self._pending, {}
+        for gauge, value in pending.items():
+            gauge.update_value(value)
+
+    def start(self):
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
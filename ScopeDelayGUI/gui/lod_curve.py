@@ -0,0 +1,166 @@
+"""
+Level-of-detail curve for long scope records.
+
+MinMaxPyramid precomputes min/max envelopes of a waveform at 4x, 16x, 64x...
+decimation when the data arrives. LODCurveItem is a PlotCurveItem that keeps
+the full-resolution arrays and, whenever its view range changes, draws only
+the visible span at the pyramid level matching the plot's pixel width:
+a few thousand points at any zoom, with narrow spikes kept in the envelope.
+"""
+
+import numpy as np
+from pyqtgraph import PlotCurveItem
+
+
+class MinMaxPyramid:
+    """
+    Min/max envelope pyramid for one channel.
+
+    levels[k] = (bucket_size, mins, maxs) with bucket_size = FACTOR**(k+1);
+    mins[j]/maxs[j] cover samples [j*bucket_size, (j+1)*bucket_size).
+    """
+
+    FACTOR = 4
+
+    # Stop building levels once a level has fewer buckets than this
+    MIN_BUCKETS = 512
+
+    def __init__(self, x, y):
+        """
+        Args:
+            x: Monotonic time array
+            y: Value array (same length as x)
+        """
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        self.levels = []
+
+        mins = maxs = self.y
+        size = 1
+        while len(mins) > self.MIN_BUCKETS:
+            mins = self._reduce(mins, np.minimum)
+            maxs = self._reduce(maxs, np.maximum)
+            size *= self.FACTOR
+            self.levels.append((size, mins, maxs))
+
+    @classmethod
+    def _reduce(cls, a, func):
+        """Combine every FACTOR consecutive values (last bucket may be short)."""
+        pad = -len(a) % cls.FACTOR
+        if pad:
+            a = np.concatenate((a, np.repeat(a[-1:], pad)))
+        return func.reduce(a.reshape(-1, cls.FACTOR), axis=1)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def bounds(self, axis: int) -> tuple:
+        """Full-record (min, max) along x (axis 0) or y (axis 1)."""
+        if len(self.x) == 0:
+            return (None, None)
+        if axis == 0:
+            return (float(self.x[0]), float(self.x[-1]))
+        if self.levels:
+            _, mins, maxs = self.levels[-1]
+        else:
+            mins = maxs = self.y
+        return (float(np.nanmin(mins)), float(np.nanmax(maxs)))
+
+    def render(self, x0: float, x1: float, pixels: int) -> tuple:
+        """
+        Points to draw for the x range [x0, x1] on a plot `pixels` wide.
+
+        Returns the raw samples when they fit in ~2 points per pixel,
+        otherwise interleaved (min, max) pairs from the coarsest level that
+        still has at least one bucket per pixel. One sample beyond each
+        edge is included so the line runs off the plot instead of stopping.
+
+        Returns:
+            (x, y) arrays
+        """
+        n = len(self.x)
+        if n == 0:
+            return self.x, self.y
+
+        i0 = max(int(np.searchsorted(self.x, x0, 'left')) - 1, 0)
+        i1 = min(int(np.searchsorted(self.x, x1, 'right')) + 1, n)
+        count = i1 - i0
+
+        chosen = None
+        for size, mins, maxs in self.levels:
+            if count / size < pixels:
+                break
+            chosen = (size, mins, maxs)
+
+        if chosen is None or count <= 2 * pixels:
+            return self.x[i0:i1], self.y[i0:i1]
+
+        size, mins, maxs = chosen
+        j0 = i0 // size
+        j1 = -(-i1 // size)
+
+        xs = np.repeat(self.x[np.arange(j0, j1) * size], 2)
+        ys = np.column_stack((mins[j0:j1], maxs[j0:j1])).ravel()
+        return xs, ys
+
+
+class LODCurveItem(PlotCurveItem):
+    """
+    PlotCurveItem that draws a decimated view of full-resolution data.
+
+    setData(x, y) stores the full arrays and builds a MinMaxPyramid; the
+    item then re-renders the visible span on every view-range change.
+    dataBounds() reports the full record, so auto-range still shows all
+    of it. Drop-in replacement for PlotCurveItem in the scope plots.
+    """
+
+    # Pixel width used before the view has been laid out
+    DEFAULT_PIXELS = 2000
+
+    def setData(self, *args, **kargs):
+        """Accepts the same (x, y) forms as PlotCurveItem.setData()."""
+        x = kargs.pop('x', None)
+        y = kargs.pop('y', None)
+        if len(args) == 2:
+            x, y = args
+        elif len(args) == 1:
+            y = args[0]
+
+        if y is None:
+            # Style-only update (pen, name, ...)
+            super().setData(**kargs)
+            return
+
+        y = np.asarray(y)
+        x = np.arange(len(y)) if x is None else np.asarray(x)
+        self._pyramid = MinMaxPyramid(x, y) if len(y) else None
+        self._lod_kargs = kargs
+        self._update_lod()
+
+    def _update_lod(self):
+        pyramid = getattr(self, '_pyramid', None)
+        kargs = getattr(self, '_lod_kargs', {})
+        if pyramid is None:
+            super().setData([], [], **kargs)
+            return
+
+        vb = self.getViewBox()
+        if vb is None:
+            x0, x1 = pyramid.bounds(0)
+            pixels = self.DEFAULT_PIXELS
+        else:
+            (x0, x1), _ = vb.viewRange()
+            pixels = int(vb.width()) or self.DEFAULT_PIXELS
+
+        x, y = pyramid.render(x0, x1, pixels)
+        super().setData(x, y, **kargs)
+
+    def viewRangeChanged(self):
+        super().viewRangeChanged()
+        self._update_lod()
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        pyramid = getattr(self, '_pyramid', None)
+        if pyramid is None:
+            return super().dataBounds(ax, frac, orthoRange)
+        return pyramid.bounds(ax)
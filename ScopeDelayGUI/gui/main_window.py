@@ -2,7 +2,7 @@
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QMessageBox, QPushButton, QSizePolicy, QGridLayout,
 )
-from PyQt6.QtCore import QThread, Qt
+from PyQt6.QtCore import QThread, Qt, QTimer
 from PyQt6.QtWidgets import QFileDialog, QProgressDialog, QMessageBox
 from PyQt6.QtCore import Qt
 import time
@@ -12,21 +12,30 @@ from gui.bnc575_panel import BNC575Panel
 from gui.rigol_panel import RigolPanel
 from gui.sf6_window import SF6Window
 from gui.wj_panel import WJPanel
-from gui.scope_plot_window import ScopePlotWindow
-from gui.wj_plot_window import WJPlotWindow
+from gui.gauge_widget import GaugeRefreshTimer
 
 from utils.logger import LogPanel
 from utils.status_lamp import StatusLamp
 from utils.serial_tools import list_serial_ports
 from utils.capture_single_worker import CaptureSingleWorker, CaptureFourChannelWorker
+from utils.multi_capture_worker import MultiScopeCaptureWorker
 from utils.connect_memory import load_memory, save_memory
-from utils.pressure_stream_worker import PressureStreamWorker
+from utils.pressure_stream_worker import PressureCalibration, PressureStreamWorker
 from utils.data_logger import DataLogger
 from utils.csv_export_worker import CSVExportWorker
+from utils.archive_export_worker import ArchiveExportWorker
+from utils.auto_export_worker import AutoExportWorker
+from utils.shot_archive import ARCHIVE_EXTENSIONS
+from utils.ring_buffer import RingBuffer
+from utils.wj_scheduler import WJScheduler
+from utils.connect_worker import DeviceConnectWorker, DeviceJob
+from utils.startup_timer import startup
 
 from instruments.dg535 import DG535Controller
 from instruments.bnc575 import BNC575Controller, SystemMode, TriggerMode, TriggerEdge
 from instruments.rigol import RigolScope
+from instruments.visa_manager import get_session_pool
+from instruments.waveform import channel_points
 from instruments.arduino import ArduinoController
 from instruments.wj import WJPowerSupply
 
@@ -40,10 +49,15 @@ class ScopeDelayMainWindow(QMainWindow):
         self.setMinimumSize(800, 600)
         self.conn = load_memory()
         self.wj_plot_window = None
+        self._scope_window = None   # created on first use, see scope_window
 
         # Initialize data logger
         self.data_logger = DataLogger()
 
+        # Gauges show the latest value at ~30 Hz, whatever the data rate
+        self.gauge_refresh = GaugeRefreshTimer(fps=30, parent=self)
+        self.gauge_refresh.start()
+
         # --- instruments ---
         self.dg = DG535Controller()
         self.bnc = BNC575Controller()
@@ -54,6 +68,12 @@ class ScopeDelayMainWindow(QMainWindow):
         self.rigol2 = RigolScope(resource_name="USB0::0x1AB1::0x0514::DS7A230800035::0::INSTR")  # Physical scope 1
         self.rigol3 = RigolScope(resource_name="USB0::0x1AB1::0x0514::DS7A233300256::0::INSTR")  # Physical scope 2
         self.rigol1 = RigolScope(resource_name="USB0::0x1AB1::0x0514::DS7A232900210::0::INSTR")  # Physical scope 3
+
+        # Last known VISA address per scope serial; connects use these
+        # instead of scanning the USB bus
+        get_session_pool().seed(
+            addr for key, addr in self.conn.items()
+            if key.startswith("Rigol") and key.endswith("_VISA") and addr)
     
         # Multiple WJ supplies
         self.wj_units = [
@@ -61,6 +81,10 @@ class ScopeDelayMainWindow(QMainWindow):
             WJPowerSupply(vmax_kv=100.0, imax_ma=6.0)
         ]
 
+        # One I/O scheduler per WJ port; all serial traffic goes through it
+        # (started in start_wj_readers, runs jobs inline until then)
+        self.wj_schedulers = [WJScheduler(wj) for wj in self.wj_units]
+
         # Panel now supports 2 units
         self.wj_panel = WJPanel(num_units=2)
 
@@ -74,6 +98,7 @@ class ScopeDelayMainWindow(QMainWindow):
         self.rigol1_connected = False
         self.rigol2_connected = False
         self.rigol3_connected = False
+        startup.mark("instrument drivers")
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -82,13 +107,24 @@ class ScopeDelayMainWindow(QMainWindow):
 
         # Remove tabs - just use main layout for Scope + Delay controls
         self.build_scope_controls(main_layout)
+        startup.mark("control panels")
+
+        # Pressure calibration file (built-in table if missing or bad)
+        self.load_pressure_calibration()
 
         # Create SF6 window as separate top-level window (now includes WJ plots)
+        # (needed right away: it holds the Arduino/WJ controls, lamps and gauges)
         self.sf6_window = SF6Window()
+        startup.mark("SF6 window")
 
         # Populate WJ COM ports (after sf6_window is created so it gets populated too)
         self.refresh_wj_ports()
 
+        # Start WJ schedulers and connect to SF6 window plot. Before
+        # auto-connect: a connected supply is only ever touched by its
+        # running scheduler thread
+        self.start_wj_readers()
+
         # Attempt auto-connect
         self.auto_connect_all()
         # Populate COM list initially
@@ -96,15 +132,14 @@ class ScopeDelayMainWindow(QMainWindow):
 
         # Connect SF6 window controls
         self.connect_sf6_window()
+        startup.mark("auto-connect started")
 
-        # Create scope plot window (now with 4-channel support)
-        self.scope_window = ScopePlotWindow(parent=self)
-
-        # Start WJ reader threads and connect to SF6 window plot
-        self.start_wj_readers()
+        # Scope plot window is created on first use (see scope_window);
+        # position_and_show_windows() builds it after the first paint
 
         # Position and show all windows on startup
         self.position_and_show_windows()
+        startup.mark("main + SF6 windows shown")
 
         # Log the data file location
         self.log(f"[DATA LOGGER] Saving to: {self.data_logger.get_log_file_path()}")
@@ -112,6 +147,9 @@ class ScopeDelayMainWindow(QMainWindow):
         # Write a test log entry to verify logging is working
         self.data_logger.log_info("SYSTEM", "GUI started successfully")
         self.current_data = None
+        self.scope_captures = {}  # scope_id -> 4-channel Waveform tuple
+        self.last_shot = None
+        self.multi_capture_worker = None
         self.export_worker = None
         self.export_progress = None
 
@@ -144,28 +182,31 @@ class ScopeDelayMainWindow(QMainWindow):
                 combo.blockSignals(False)
     
 
+    # WJ plot redraw rate (samples arrive faster and are only buffered)
+    WJ_PLOT_REFRESH_MS = 100
+
     def start_wj_readers(self):
-        """Start WJ reader threads and connect to SF6 window plot"""
-        from gui.wj_plot_window import WJReaderThread
+        """Start the WJ port schedulers (telemetry polling) and connect to SF6 window plot"""
         import time
 
-        self.wj_workers = []
         self.wj_start_time = time.time()
-        self.wj_t_buf = []
-        self.wj_kv1_buf = []
-        self.wj_ma1_buf = []
-        self.wj_kv2_buf = []
-        self.wj_ma2_buf = []
         self.wj_max_points = 3000  # Store ~5 minutes of history at ~10 Hz
 
-        for idx, wj in enumerate(self.wj_units):
-            worker = WJReaderThread(wj)
-            worker.new_data.connect(lambda t, kv, ma, i=idx: self.handle_wj_plot_data(i, t, kv, ma))
-            worker.start()
-            self.wj_workers.append(worker)
+        # One (t, kV, mA) ring buffer per unit
+        self.wj_buffers = [RingBuffer(self.wj_max_points, width=3) for _ in self.wj_units]
+        self.wj_plot_dirty = False
+        self.wj_last_t = 0.0
+
+        self.wj_plot_timer = QTimer(self)
+        self.wj_plot_timer.timeout.connect(self.refresh_wj_plots)
+        self.wj_plot_timer.start(self.WJ_PLOT_REFRESH_MS)
+
+        for idx, scheduler in enumerate(self.wj_schedulers):
+            scheduler.new_data.connect(lambda t, kv, ma, i=idx: self.handle_wj_plot_data(i, t, kv, ma))
+            scheduler.start()
 
     def handle_wj_plot_data(self, unit_index, t, kv, ma):
-        """Handle incoming WJ data for plotting in SF6 window"""
+        """Handle incoming WJ data: gauges, logging and plot buffers"""
         import time
 
         # Normalize time to shared reference
@@ -175,11 +216,11 @@ class ScopeDelayMainWindow(QMainWindow):
         if hasattr(self, "sf6_window"):
             try:
                 if unit_index == 0:
-                    self.sf6_window.kv1_gauge.update_value(kv)
-                    self.sf6_window.ma1_gauge.update_value(ma)
+                    self.gauge_refresh.set(self.sf6_window.kv1_gauge, kv)
+                    self.gauge_refresh.set(self.sf6_window.ma1_gauge, ma)
                 elif unit_index == 1:
-                    self.sf6_window.kv2_gauge.update_value(kv)
-                    self.sf6_window.ma2_gauge.update_value(ma)
+                    self.gauge_refresh.set(self.sf6_window.kv2_gauge, kv)
+                    self.gauge_refresh.set(self.sf6_window.ma2_gauge, ma)
             except Exception:
                 pass
 
@@ -189,45 +230,32 @@ class ScopeDelayMainWindow(QMainWindow):
         except Exception as e:
             self.log(f"[DataLogger ERROR] Failed to log WJ{unit_index+1} plot data: {e}")
 
-        # Store data with separate time arrays for each unit
-        # Unit 1
-        if unit_index == 0:
-            if not hasattr(self, 'wj_t1_buf'):
-                self.wj_t1_buf = []
-            self.wj_t1_buf.append(t)
-            self.wj_kv1_buf.append(kv)
-            self.wj_ma1_buf.append(ma)
-
-            # Rolling window for unit 1 (keep more points for history)
-            if len(self.wj_t1_buf) > self.wj_max_points:
-                self.wj_t1_buf = self.wj_t1_buf[-self.wj_max_points:]
-                self.wj_kv1_buf = self.wj_kv1_buf[-self.wj_max_points:]
-                self.wj_ma1_buf = self.wj_ma1_buf[-self.wj_max_points:]
-
-            # Update curves for unit 1
-            self.sf6_window.kv1_curve.setData(self.wj_t1_buf, self.wj_kv1_buf)
-            self.sf6_window.ma1_curve.setData(self.wj_t1_buf, self.wj_ma1_buf)
-
-        # Unit 2
-        elif unit_index == 1:
-            if not hasattr(self, 'wj_t2_buf'):
-                self.wj_t2_buf = []
-            self.wj_t2_buf.append(t)
-            self.wj_kv2_buf.append(kv)
-            self.wj_ma2_buf.append(ma)
-
-            # Rolling window for unit 2 (keep more points for history)
-            if len(self.wj_t2_buf) > self.wj_max_points:
-                self.wj_t2_buf = self.wj_t2_buf[-self.wj_max_points:]
-                self.wj_kv2_buf = self.wj_kv2_buf[-self.wj_max_points:]
-                self.wj_ma2_buf = self.wj_ma2_buf[-self.wj_max_points:]
-
-            # Update curves for unit 2
-            self.sf6_window.kv2_curve.setData(self.wj_t2_buf, self.wj_kv2_buf)
-            self.sf6_window.ma2_curve.setData(self.wj_t2_buf, self.wj_ma2_buf)
+        # Buffer only; refresh_wj_plots() redraws on the timer
+        if 0 <= unit_index < len(self.wj_buffers):
+            self.wj_buffers[unit_index].append((t, kv, ma))
+            self.wj_last_t = t
+            self.wj_plot_dirty = True
+
+    def refresh_wj_plots(self):
+        """Redraw the SF6 window WJ curves from the ring buffers (timer slot)"""
+        if not self.wj_plot_dirty or not hasattr(self, "sf6_window"):
+            return
+        self.wj_plot_dirty = False
+
+        curves = [
+            (self.sf6_window.kv1_curve, self.sf6_window.ma1_curve),
+            (self.sf6_window.kv2_curve, self.sf6_window.ma2_curve),
+        ]
+        for buf, (kv_curve, ma_curve) in zip(self.wj_buffers, curves):
+            if not len(buf):
+                continue
+            # Copies: pyqtgraph keeps the arrays, appends overwrite the views
+            t, kv, ma = buf.columns(copy=True)
+            kv_curve.setData(t, kv)
+            ma_curve.setData(t, ma)
 
         # Auto-scroll the plot to show the last 60 seconds
-        self.sf6_window.update_wj_scroll(t)
+        self.sf6_window.update_wj_scroll(self.wj_last_t)
 
     def position_and_show_windows(self):
         """Position windows on appropriate monitors and show them"""
@@ -236,8 +264,8 @@ class ScopeDelayMainWindow(QMainWindow):
         screens = QGuiApplication.screens()
         if not screens:
             # Fallback: just show windows normally
-            self.scope_window.showMaximized()
             self.sf6_window.showMaximized()
+            QTimer.singleShot(0, self._show_scope_window)
             return
 
         # Sort screens left-to-right by x coordinate
@@ -262,10 +290,34 @@ class ScopeDelayMainWindow(QMainWindow):
         self.sf6_window.move(left_screen.availableGeometry().topLeft())
         self.sf6_window.showMaximized()
 
-        # Scope window on right screen
-        self.scope_window.setScreen(right_screen)
-        self.scope_window.move(right_screen.availableGeometry().topLeft())
-        self.scope_window.showMaximized()
+        # Scope window on right screen, built once the event loop is running
+        # so the main and SF6 windows paint without waiting for pyqtgraph
+        QTimer.singleShot(0, lambda: self._show_scope_window(right_screen))
+
+    @property
+    def scope_window(self):
+        """Scope plot window (4-channel), created on first use"""
+        if self._scope_window is None:
+            from gui.scope_plot_window import ScopePlotWindow
+            self._scope_window = ScopePlotWindow(parent=self)
+        return self._scope_window
+
+    def _show_scope_window(self, screen=None):
+        """Create and show the scope window, then log the startup timing report"""
+        window = self.scope_window
+        if screen is not None:
+            window.setScreen(screen)
+            window.move(screen.availableGeometry().topLeft())
+        window.showMaximized()
+        startup.mark("scope window")
+        self.log_startup_report()
+
+    def log_startup_report(self):
+        """Log how long each startup phase took"""
+        self.log("=== Startup timing ===")
+        for line in startup.report():
+            self.log(f"[STARTUP] {line}")
+        self.data_logger.log_info("SYSTEM", f"Startup took {startup.elapsed():.2f} s")
 
     def build_scope_controls(self, main_layout):
         layout = QHBoxLayout()
@@ -321,6 +373,7 @@ class ScopeDelayMainWindow(QMainWindow):
         # --------------------------------
         self.dg_panel.btn_connect.clicked.connect(self.on_dg_connect)
         self.dg_panel.btn_fire.clicked.connect(self.on_dg_fire)
+        self.dg_panel.btn_resync.clicked.connect(self.on_dg_resync)
 
         # BNC575 connections
         self.bnc_panel.btn_connect.clicked.connect(self.on_bnc_connect)
@@ -328,6 +381,7 @@ class ScopeDelayMainWindow(QMainWindow):
         self.bnc_panel.btn_fire.clicked.connect(self.on_bnc_fire)
         self.bnc_panel.btn_apply.clicked.connect(self.on_bnc_apply)
         self.bnc_panel.btn_read.clicked.connect(self.on_bnc_read)
+        self.bnc_panel.btn_resync.clicked.connect(self.on_bnc_resync)
         self.bnc_panel.btn_arm.clicked.connect(self.on_bnc_arm)
         
         # Channel enable buttons
@@ -365,6 +419,7 @@ class ScopeDelayMainWindow(QMainWindow):
         self.rigol_panel.btn_r2_single.clicked.connect(self.on_r2_single)
         self.rigol_panel.btn_r3_single.clicked.connect(self.on_r3_single)
         self.rigol_panel.btn_export.clicked.connect(self.on_export_csv)
+        self.rigol_panel.btn_refresh_settings.clicked.connect(self.on_rigol_refresh_settings)
 
         self.rigol_panel.btn_r1_capture.clicked.connect(self.on_capture_r1)
         self.rigol_panel.btn_r2_capture.clicked.connect(self.on_capture_r2)
@@ -389,196 +444,220 @@ class ScopeDelayMainWindow(QMainWindow):
             row.disconnect.clicked.connect(lambda _, i=idx: self.on_wj_disconnect(i))
 
 
+    # Per-device bring-up timeouts (s) for auto_connect_all
+    CONNECT_TIMEOUTS = {
+        "DG535": 5.0,
+        "BNC575": 5.0,
+        "Arduino": 5.0,
+        "WJ": 3.0,
+        "Rigol": 10.0,
+    }
+
     def auto_connect_all(self):
+        """
+        Open every instrument in parallel (DeviceConnectWorker).
+
+        The blocking connect/*IDN? work runs in worker threads; lamps,
+        logging and follow-up setup happen in _on_device_connected() as
+        each device finishes.
+        """
         self.log("=== Auto-connect starting ===")
+        t = self.CONNECT_TIMEOUTS
 
-        # ------------------------------
-        # DG535
-        # ------------------------------
-        try:
-            port = self.conn.get("DG535_COM", "COM4")
-            self.dg.connect(port=port, gpib_addr=15)
-            save_memory("DG535_COM", port)
-            self.log(f"[DG535] Connected on {port}")
-            self.dg_panel.lamp.set_status("green", "Connected")
-        except Exception as e:
-            self.log(f"[DG535] NOT CONNECTED: {e}")
-            self.dg_panel.lamp.set_status("red", "Not Connected")
+        jobs = [
+            DeviceJob("DG535", self._connect_dg535, t["DG535"], cleanup=self.dg.close),
+            DeviceJob("BNC575", self._connect_bnc575, t["BNC575"], cleanup=self.bnc.close),
+            DeviceJob("Arduino", self._connect_arduino, t["Arduino"], cleanup=self.arduino.close),
+        ]
+        default_wj_ports = ["COM6", "COM11"]
+        for i in range(len(self.wj_units)):
+            port = self.conn.get(f"WJ{i+1}_COM", default_wj_ports[i])
+            jobs.append(DeviceJob(
+                f"WJ{i+1}", lambda i=i, port=port: self._connect_wj(i, port), t["WJ"],
+                cleanup=lambda i=i: self.wj_schedulers[i].call(self.wj_units[i].close)))
+        for key, (_, scope, _) in self._rigol_connect_map().items():
+            jobs.append(DeviceJob(key, lambda key=key, scope=scope: self._connect_rigol(key, scope),
+                                  t["Rigol"], cleanup=scope.disconnect))
+
+        # Connecting...
+        self.dg_panel.lamp.set_status("yellow", "Connecting...")
+        self.bnc_panel.lamp.set_status("yellow", "Connecting...")
+        self.sf6_window.sf6_panel.lamp.set_status("yellow", "Connecting...")
+        for row in self.wj_panel.rows:
+            row.lamp.set_status("yellow", "Connecting...")
+        for _, _, lamp in self._rigol_connect_map().values():
+            lamp.set_status("yellow", "Connecting...")
+
+        self.connect_worker = DeviceConnectWorker(jobs, parent=self)
+        self.connect_worker.device_done.connect(self._on_device_connected)
+        self.connect_worker.device_late.connect(
+            lambda name, msg: self.log(f"[AutoConnect] {name} {msg}"))
+        self.connect_worker.all_done.connect(
+            lambda elapsed: self.log(f"=== Auto-connect done ({elapsed:.1f} s) ==="))
+        self.connect_worker.start()
+
+    def _rigol_connect_map(self):
+        """Memory key -> (connected flag name, scope, lamp)"""
+        return {
+            "Rigol1_VISA": ("rigol1_connected", self.rigol1, self.rigol_panel.lamp_r1),
+            "Rigol2_VISA": ("rigol2_connected", self.rigol2, self.rigol_panel.lamp_r2),
+            "Rigol3_VISA": ("rigol3_connected", self.rigol3, self.rigol_panel.lamp_r3),
+        }
 
-        # ------------------------------
-        # BNC575
-        # ------------------------------
-        try:
-            port = self.conn.get("BNC575_COM", "COM5")
-            self.bnc.connect(port=port)
-            self.bnc_connected = True
-            save_memory("BNC575_COM", port)
-            idn = self.bnc.identify()
-            self.log(f"[BNC575] Connected on {port}: {idn}")
-            self.bnc_panel.lamp.set_status("green", "Connected")
-            self.bnc_panel.set_connected(True, idn)
-            
-            # Read current settings from device
-            self._bnc_read_all_settings()
-            
-        except Exception as e:
-            self.bnc_connected = False
-            self.log(f"[BNC575] NOT CONNECTED: {e}")
-            self.bnc_panel.lamp.set_status("red", "Not Connected")
-            self.bnc_panel.set_connected(False)
+    # --- blocking connect functions (worker threads, no widget access) ---
+
+    def _connect_dg535(self):
+        port = self.conn.get("DG535_COM", "COM4")
+        self.dg.connect(port=port, gpib_addr=15)
+        return port
+
+    def _connect_bnc575(self):
+        port = self.conn.get("BNC575_COM", "COM5")
+        self.bnc.connect(port=port)
+        idn = self.bnc.identify()
+        # Read current settings from device while still off the GUI thread
+        snap = self.bnc.read_snapshot(max_age=0)
+        return port, idn, snap
+
+    def _connect_arduino(self):
+        port = self.conn.get("Arduino_COM", "COM8")
+        self.arduino.connect(port)
+        return port
+
+    def _connect_wj(self, index, port):
+        self.wj_schedulers[index].call(self.wj_units[index].connect, port)
+        return port
+
+    def _connect_rigol(self, key, scope):
+        visa_addr = self.conn.get(key, "")
+        if visa_addr:
+            scope.resource_name = visa_addr
+        scope.connect()
+        return scope._query("*IDN?")
+
+    # --- completion (GUI thread) ---
+
+    def _on_device_connected(self, name, ok, result):
+        """Update lamps/state for one device finished by DeviceConnectWorker"""
+        if name == "DG535":
+            if ok:
+                save_memory("DG535_COM", result)
+                self.log(f"[DG535] Connected on {result}")
+                self.dg_panel.lamp.set_status("green", "Connected")
+            else:
+                self.log(f"[DG535] NOT CONNECTED: {result}")
+                self.dg_panel.lamp.set_status("red", "Not Connected")
+
+        elif name == "BNC575":
+            self.bnc_connected = ok
+            if ok:
+                port, idn, snap = result
+                save_memory("BNC575_COM", port)
+                self.log(f"[BNC575] Connected on {port}: {idn}")
+                self.bnc_panel.lamp.set_status("green", "Connected")
+                self.bnc_panel.set_connected(True, idn)
+                self._bnc_read_all_settings(snap)
+            else:
+                self.log(f"[BNC575] NOT CONNECTED: {result}")
+                self.bnc_panel.lamp.set_status("red", "Not Connected")
+                self.bnc_panel.set_connected(False)
 
-        # ------------------------------
-        # Arduino / SF6
-        # ------------------------------
+        elif name == "Arduino":
+            if ok:
+                self._on_arduino_auto_connected(result)
+            else:
+                self.log(f"[Arduino] NOT CONNECTED: {result}")
+                self.sf6_window.sf6_panel.lamp.set_status("red", "Not Connected")
 
-        # ------------------------------
-        # Arduino / SF6
-        # ------------------------------
-        try:
-            port = self.conn.get("Arduino_COM", "COM8")
-            self.arduino.connect(port)
-            save_memory("Arduino_COM", port)
-            self.log(f"[Arduino] Connected on {port}")
-            self.sf6_window.sf6_panel.lamp.set_status("green", "Connected")
+        elif name.startswith("WJ"):
+            i = int(name[2:]) - 1
+            if ok:
+                self.wj_panel.rows[i].lamp.set_status("green", "Connected")
+                self.log(f"[WJ{i+1}] Connected on {result}")
+            else:
+                self.wj_panel.rows[i].lamp.set_status("red", "Not Connected")
+                self.log(f"[WJ{i+1}] NOT CONNECTED: {result}")
+
+        elif name in self._rigol_connect_map():
+            flag_name, scope, lamp = self._rigol_connect_map()[name]
+            setattr(self, flag_name, ok)
+            if ok:
+                save_memory(name, scope.resource_name)
+                self.log(f"[AutoConnect] {name} CONNECTED → {result}")
+                lamp.set_status("green", "Connected")
+            else:
+                self.log(f"[AutoConnect] {name} NOT CONNECTED: {result}")
+                lamp.set_status("red", "Not Connected")
+
+    def _on_arduino_auto_connected(self, port):
+        """Start the pressure stream and set startup valve/pressure state"""
+        save_memory("Arduino_COM", port)
+        self.log(f"[Arduino] Connected on {port}")
+        self.sf6_window.sf6_panel.lamp.set_status("green", "Connected")
 
-            # Start Arduino stream worker for continuous data reading
+        # Start Arduino stream worker for continuous data reading
+        try:
             self.arduino_stream = PressureStreamWorker(self.arduino)
-            self.arduino_stream.data_signal.connect(self.on_pressure_data)
+            self.arduino_stream.batch_signal.connect(self.on_pressure_batch)
             self.arduino_stream.error_signal.connect(lambda msg: self.log(f"[Arduino Stream ERROR] {msg}"))
             self.arduino_stream.start()
             self.log("[Arduino] Pressure stream worker started")
-
-            # Auto-close Marx1 Supply (DO0) and Marx1 Return (DO4) on connect
-            try:
-                self.arduino.set_digital_output(0, 1)  # Marx1 Supply ON (closed)
-                self.arduino.set_digital_output(4, 1)  # Marx1 Return ON (closed)
-                self.sf6_window.sf6_panel.switches[0].setChecked(True)
-                self.sf6_window.sf6_panel.switches[1].setChecked(True)
-                self.log("[Arduino] Auto-closed Marx1 Supply and Marx1 Return")
-            except Exception as e:
-                self.log(f"[Arduino] Failed to auto-close Marx1 valves: {e}")
-
-            # ─────────────────────────────────────────────
-            # Set initial pressure to 12 PSI on startup
-            # ─────────────────────────────────────────────
-            try:
-                initial_psi = 12.0
-                initial_voltage = (initial_psi / 148.0) * 10.0  # 0.811V
-                self.arduino.set_pressure_voltage(initial_voltage)
-                self.log(f"[Pressure] Initialized to {initial_psi} PSI ({initial_voltage:.3f}V)")
-                
-                # Update GUI display if pressure panel exists
-                if hasattr(self.sf6_window, 'pressure_panel'):
-                    self.sf6_window.pressure_panel.update_output_display(initial_voltage)
-                    self.sf6_window.pressure_panel.spin_value.setValue(initial_psi)
-            except Exception as e:
-                self.log(f"[Pressure] Init failed: {e}")
-
         except Exception as e:
             self.log(f"[Arduino] NOT CONNECTED: {e}")
             self.sf6_window.sf6_panel.lamp.set_status("red", "Not Connected")
-        # try:
-        #     port = self.conn.get("Arduino_COM", "COM8")
-        #     self.arduino.connect(port)
-        #     save_memory("Arduino_COM", port)
-        #     self.log(f"[Arduino] Connected on {port}")
-        #     self.sf6_window.sf6_panel.lamp.set_status("green", "Connected")
-
-        #     # Start Arduino stream worker for continuous data reading
-        #     self.arduino_stream = ArduinoStreamWorker(self.arduino)
-        #     self.arduino_stream.data_signal.connect(self.on_analog_data)
-        #     self.arduino_stream.error_signal.connect(lambda msg: self.log(f"[Arduino Stream ERROR] {msg}"))
-        #     self.arduino_stream.start()
-        #     self.log("[Arduino] Stream worker started")
-            
-
-        # except Exception as e:
-        #     self.log(f"[Arduino] NOT CONNECTED: {e}")
-        #     self.sf6_window.sf6_panel.lamp.set_status("red", "Not Connected")
-
-        # ------------------------------
-        # WJ HIGH VOLTAGE SUPPLIES
-        # ------------------------------
-        default_wj_ports = ["COM6", "COM11"]
-        for i, wj in enumerate(self.wj_units):
-            try:
-                port = self.conn.get(f"WJ{i+1}_COM", default_wj_ports[i])
-                wj.connect(port)
-                self.wj_panel.rows[i].lamp.set_status("green", "Connected")
-                self.log(f"[WJ{i+1}] Connected on {port}")
-            except Exception as e:
-                self.wj_panel.rows[i].lamp.set_status("red", "Not Connected")
-                self.log(f"[WJ{i+1}] NOT CONNECTED: {e}")
-
-        # ------------------------------
-        # Rigol Oscilloscopes
-        # ------------------------------
-        rigol_state_map = {
-            "Rigol1_VISA": ("rigol1_connected", self.rigol1),
-            "Rigol2_VISA": ("rigol2_connected", self.rigol2),
-            "Rigol3_VISA": ("rigol3_connected", self.rigol3),
-        }
-
-        for key, (flag_name, scope) in rigol_state_map.items():
-            try:
-                visa_addr = self.conn.get(key, "")
-                if visa_addr:
-                    scope.resource_name = visa_addr
-
-                scope.connect()
-                idn = scope._query("*IDN?")
-
-                setattr(self, flag_name, True)
-                save_memory(key, scope.resource_name)
-
-                self.log(f"[AutoConnect] {key} CONNECTED → {idn}")
-                if key == "Rigol1_VISA":
-                    self.rigol_panel.lamp_r1.set_status("green", "Connected")
-                elif key == "Rigol2_VISA":
-                    self.rigol_panel.lamp_r2.set_status("green", "Connected")
-                elif key == "Rigol3_VISA":
-                    self.rigol_panel.lamp_r3.set_status("green", "Connected")
+            return
 
-            except Exception as e:
-                setattr(self, flag_name, False)
-                self.log(f"[AutoConnect] {key} NOT CONNECTED: {e}")
-                if key == "Rigol1_VISA":
-                    self.rigol_panel.lamp_r1.set_status("red", "Not Connected")
-                elif key == "Rigol2_VISA":
-                    self.rigol_panel.lamp_r2.set_status("red", "Not Connected")
-                elif key == "Rigol3_VISA":
-                    self.rigol_panel.lamp_r3.set_status("red", "Not Connected")
+        # Auto-close Marx1 Supply (DO0) and Marx1 Return (DO4) on connect
+        try:
+            self.arduino.set_digital_output(0, 1)  # Marx1 Supply ON (closed)
+            self.arduino.set_digital_output(4, 1)  # Marx1 Return ON (closed)
+            self.sf6_window.sf6_panel.switches[0].setChecked(True)
+            self.sf6_window.sf6_panel.switches[1].setChecked(True)
+            self.log("[Arduino] Auto-closed Marx1 Supply and Marx1 Return")
+        except Exception as e:
+            self.log(f"[Arduino] Failed to auto-close Marx1 valves: {e}")
 
-        self.log("=== Auto-connect done ===")
+        # ─────────────────────────────────────────────
+        # Set initial pressure to 12 PSI on startup
+        # ─────────────────────────────────────────────
+        try:
+            initial_psi = 12.0
+            initial_voltage = (initial_psi / 148.0) * 10.0  # 0.811V
+            self.arduino.set_pressure_voltage(initial_voltage)
+            self.log(f"[Pressure] Initialized to {initial_psi} PSI ({initial_voltage:.3f}V)")
+            
+            # Update GUI display if pressure panel exists
+            if hasattr(self.sf6_window, 'pressure_panel'):
+                self.sf6_window.pressure_panel.update_output_display(initial_voltage)
+                self.sf6_window.pressure_panel.spin_value.setValue(initial_psi)
+        except Exception as e:
+            self.log(f"[Pressure] Init failed: {e}")
 
 
-    def _bnc_read_all_settings(self):
-        """Read all BNC575 settings and update panel"""
+    def _bnc_read_all_settings(self, snap=None):
+        """Read all BNC575 settings (or use a snapshot already read) and update panel"""
         try:
-            # Read timing settings
-            wA, dA, wB, dB, wC, dC, wD, dD = self.bnc.read_settings()
-            self.bnc_panel.set_widthA(wA)
-            self.bnc_panel.set_delayA(dA)
-            self.bnc_panel.set_widthB(wB)
-            self.bnc_panel.set_delayB(dB)
-            self.bnc_panel.set_widthC(wC)
-            self.bnc_panel.set_delayC(dC)
-            self.bnc_panel.set_widthD(wD)
-            self.bnc_panel.set_delayD(dD)
-            
-            # Read period
-            period = self.bnc.get_period()
-            self.bnc_panel.set_period(period)
-            
-            # Read channel states
-            for ch in ['A', 'B', 'C', 'D']:
-                enabled = self.bnc.get_channel_state(ch)
-                self.bnc_panel.set_channel_enabled(ch, enabled)
-            
-            # Read system mode
-            mode = self.bnc.get_system_mode()
-            if mode:
-                self.bnc_panel.set_system_mode(mode.value)
+            # One readback of everything (may be served from cache)
+            if snap is None:
+                snap = self.bnc.read_snapshot()
+
+            # Timing settings and channel states
+            for ch, name in zip((1, 2, 3, 4), "ABCD"):
+                c = snap.channel(ch)
+                if c.width is not None:
+                    getattr(self.bnc_panel, f"set_width{name}")(c.width)
+                if c.delay is not None:
+                    getattr(self.bnc_panel, f"set_delay{name}")(c.delay)
+                if c.enabled is not None:
+                    self.bnc_panel.set_channel_enabled(name, c.enabled)
+
+            # Period
+            if snap.period is not None:
+                self.bnc_panel.set_period(snap.period)
+
+            # System mode
+            if snap.mode:
+                self.bnc_panel.set_system_mode(snap.mode.value)
             
             self.log("[BNC575] Read all settings from device")
         except Exception as e:
@@ -656,12 +735,16 @@ class ScopeDelayMainWindow(QMainWindow):
             self,
             "Export CSV",
             "",
-            "CSV Files (*.csv);;All Files (*)"
+            "CSV Files (*.csv);;Shot Archive (*.h5 *.npz);;All Files (*)"
         )
         
         if not filename:
             return  # User cancelled
         
+        if filename.lower().endswith(ARCHIVE_EXTENSIONS):
+            self.export_shot_archive(filename)
+            return
+        
         # Show progress dialog
         self.export_progress = QProgressDialog(
             "Exporting to CSV...",
@@ -686,6 +769,58 @@ class ScopeDelayMainWindow(QMainWindow):
         self.export_worker.start()
         
         self.log(f"[EXPORT] Starting CSV export to {filename}...")
+
+    def export_shot_archive(self, filename):
+        """Export the retained captures (all scopes) to an HDF5/NPZ shot archive."""
+        if not self.scope_captures:
+            QMessageBox.warning(self, "No Data", "No waveform data captured yet!\n\nCapture from a scope first.")
+            return
+        captures = self.scope_captures
+        if self.last_shot is not None:
+            settings, timestamp = self.last_shot.settings, self.last_shot.timestamp
+        else:
+            settings, timestamp = self._collect_shot_settings(), None
+
+        self.export_progress = QProgressDialog("Writing shot archive...", "Cancel", 0, 100, self)
+        self.export_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.export_progress.setWindowTitle("Shot Archive Export")
+        self.export_progress.setMinimumWidth(400)
+
+        self.export_worker = ArchiveExportWorker(captures, filename, settings, timestamp)
+        self.export_worker.progress.connect(self.export_progress.setValue)
+        self.export_worker.finished.connect(self.on_export_finished)
+        self.export_worker.error.connect(self.on_export_error)
+        self.export_progress.canceled.connect(self.export_worker.terminate)
+        self.export_worker.start()
+
+        self.log(f"[EXPORT] Writing shot archive to {filename}...")
+
+    def _collect_shot_settings(self) -> dict:
+        """Snapshot DG535/BNC575 settings from the panels (no instrument I/O)."""
+        settings = {}
+        try:
+            settings["dg535"] = {
+                "delayA": self.dg_panel.get_delayA(),
+                "widthA": self.dg_panel.get_widthA(),
+                "state": self.dg.get_state_snapshot(),
+            }
+        except Exception as e:
+            settings["dg535"] = {"error": str(e)}
+        try:
+            p = self.bnc_panel
+            settings["bnc575"] = {
+                "widthA": p.get_widthA(), "delayA": p.get_delayA(),
+                "widthB": p.get_widthB(), "delayB": p.get_delayB(),
+                "widthC": p.get_widthC(), "delayC": p.get_delayC(),
+                "widthD": p.get_widthD(), "delayD": p.get_delayD(),
+                "period": p.get_period(),
+                "trigger_source": p.get_trigger_source(),
+                "trigger_slope": p.get_trigger_slope(),
+                "trigger_level": p.get_trigger_level(),
+            }
+        except Exception as e:
+            settings["bnc575"] = {"error": str(e)}
+        return settings
     def on_export_finished(self, filename):
         """Handle successful CSV export."""
         if self.export_progress:
@@ -821,11 +956,12 @@ class ScopeDelayMainWindow(QMainWindow):
 
             self.log(f"[DG535] Config pulse A: delay={delayA:.3e}, width={widthA:.3e}")
             self.set_status("yellow", "Configuring DG535...")
-            self.dg.configure_pulse_A(delayA, widthA)
+            with self.dg.batch():
+                self.dg.configure_pulse_A(delayA, widthA)
+                self.dg.set_single_shot()
+                self.dg.fire()
             self.data_logger.log_dg535_config(delayA, widthA)
 
-            self.dg.set_single_shot()
-            self.dg.fire()
             self.data_logger.log_dg535_pulse(delayA, widthA)
 
             self.set_status("green", "DG535 pulse fired")
@@ -836,6 +972,21 @@ class ScopeDelayMainWindow(QMainWindow):
             self.data_logger.log_error("DG535", str(e))
             self.error_popup("DG535 Fire Error", str(e))
 
+    def on_dg_resync(self):
+        """Re-read delays/trigger mode into the DG535 shadow (front panel was touched)"""
+        if not self.dg.is_connected():
+            self.error_popup("DG535", "Not connected")
+            return
+
+        try:
+            self.dg.resync(read_back=True)
+            self.set_status("green", "DG535 resynced")
+            self.log("[DG535] Shadow state re-read from instrument")
+        except Exception as e:
+            self.set_status("red", "DG535 resync failed")
+            self.log(f"[DG535 ERROR] {e}")
+            self.error_popup("DG535 Resync Error", str(e))
+
     def on_dg_disconnect(self):
         try:
             self.dg.close()
@@ -899,10 +1050,12 @@ class ScopeDelayMainWindow(QMainWindow):
             wD = self.bnc_panel.get_widthD()
             dD = self.bnc_panel.get_delayD()
 
-            self.bnc.apply_settings(wA, dA, wB, dB, wC, dC, wD, dD)
-            
             period = self.bnc_panel.get_period()
-            self.bnc.set_period(period)
+            if not self.bnc.apply_settings(wA, dA, wB, dB, wC, dC, wD, dD, period=period):
+                for r in self.bnc.last_results:
+                    if not r.ok:
+                        reply = r.response if r.answered else "no reply"
+                        self.log(f"[BNC575 ERROR] {r.command} -> {reply}")
             
             self.data_logger.log_bnc575_config(wA, dA, wB, dB, wC, dC, wD, dD)
 
@@ -934,6 +1087,22 @@ class ScopeDelayMainWindow(QMainWindow):
             self.log(f"[BNC575 ERROR] {e}")
             self.error_popup("BNC575 Read Error", str(e))
 
+    def on_bnc_resync(self):
+        """Drop the BNC575 shadow and rebuild it from a fresh readback"""
+        if not self.bnc_connected:
+            self.error_popup("BNC575", "Not connected")
+            return
+
+        try:
+            self.bnc.resync()
+            self._bnc_read_all_settings(self.bnc.read_snapshot(max_age=0))
+            self.set_status("green", "BNC575 resynced")
+            self.log("[BNC575] Shadow state re-read from instrument")
+        except Exception as e:
+            self.set_status("red", "BNC575 resync failed")
+            self.log(f"[BNC575 ERROR] {e}")
+            self.error_popup("BNC575 Resync Error", str(e))
+
     def on_bnc_arm(self):
         if not self.bnc_connected:
             self.error_popup("BNC575", "Not connected")
@@ -1204,24 +1373,25 @@ class ScopeDelayMainWindow(QMainWindow):
 
     def on_four_channel_capture_finished(self, data, name, scope_id):
         """Handle 4-channel capture completion"""
-        (t1, v1), (t2, v2), (t3, v3), (t4, v4) = data
-        # Store data for export
-        self.current_data = data  # ← ADD THIS LINE
+        # Store data for export (raw Waveforms, scaled on demand)
+        self.current_data = data
+        self.scope_captures[scope_id] = data
 
         # Update the appropriate plot
-        if scope_id == 1:
-            self.scope_window.update_r1(t1, v1, t2, v2, t3, v3, t4, v4)
-        elif scope_id == 2:
-            self.scope_window.update_r2(t1, v1, t2, v2, t3, v3, t4, v4)
-        elif scope_id == 3:
-            self.scope_window.update_r3(t1, v1, t2, v2, t3, v3, t4, v4)
+        self.scope_window.update_scope(scope_id, data)
 
         # Log capture (count non-empty channels)
-        ch_counts = [len(t1), len(t2), len(t3), len(t4)]
+        ch_counts = [channel_points(ch) for ch in data]
         self.data_logger.log_scope_capture(scope_id, ch_counts[0], ch_counts[1])
 
         self.set_status("green", f"{name} captured (4 ch)")
-        self.log(f"[{name}] 4-channel capture complete. Points: CH1={len(t1)}, CH2={len(t2)}, CH3={len(t3)}, CH4={len(t4)}")
+        self.log(f"[{name}] 4-channel capture complete. Points: CH1={ch_counts[0]}, CH2={ch_counts[1]}, CH3={ch_counts[2]}, CH4={ch_counts[3]}")
+
+    def on_rigol_refresh_settings(self):
+        """Forget cached settings on every scope (after front-panel changes)"""
+        for scope in (self.rigol1, self.rigol2, self.rigol3):
+            scope.invalidate_settings_cache()
+        self.log("[Rigol] Settings cache cleared - next capture re-reads scope setup")
 
     def on_r1_disconnect(self):
         try:
@@ -1257,8 +1427,25 @@ class ScopeDelayMainWindow(QMainWindow):
         self.log(f"[{name} ERROR] {msg}")
 
 
+    def disarm_scopes(self):
+        """Stop every connected Rigol (abandons a SINGLE armed for a capture)"""
+        for scope_id, scope, connected in ((1, self.rigol1, self.rigol1_connected),
+                                           (2, self.rigol2, self.rigol2_connected),
+                                           (3, self.rigol3, self.rigol3_connected)):
+            if not connected:
+                continue
+            try:
+                scope.stop()
+            except Exception as e:
+                self.log(f"[Rigol{scope_id} ERROR] Stop failed: {e}")
+        self.log("[CAPTURE] Capture aborted - scopes stopped")
+
     def on_capture_all_scopes(self):
         """Capture all 4 channels from all connected scopes"""
+        if self.multi_capture_worker is not None and self.multi_capture_worker.isRunning():
+            self.log("[CAPTURE] Previous capture still in progress - ignored")
+            return
+
         self.set_status("yellow", "Preparing for 4-channel capture...")
         self.log("[CAPTURE] Starting 4-channel capture sequence...")
 
@@ -1304,16 +1491,20 @@ class ScopeDelayMainWindow(QMainWindow):
         try:
             delayA = self.dg_panel.get_delayA()
             widthA = self.dg_panel.get_widthA()
-            self.dg.configure_pulse_A(delayA, widthA)
+            # One Prologix write; returns once the adapter has sent it
+            # (TimeoutError if the adapter does not answer)
+            with self.dg.batch():
+                self.dg.configure_pulse_A(delayA, widthA)
+                self.dg.set_single_shot()
             self.data_logger.log_dg535_config(delayA, widthA)
-            self.dg.set_single_shot()
         except Exception as e:
+            self.disarm_scopes()
+            self.set_status("red", "DG535 configuration failed")
+            self.log(f"[DG535 ERROR] {e}")
             self.error_popup("DG535 Error", str(e))
             self.data_logger.log_error("DG535", str(e))
             return
 
-        time.sleep(0.2)
-
         # 4. FIRE DG535 (MASTER TRIGGER)
         self.log("[CAPTURE] Firing DG535...")
         try:
@@ -1321,11 +1512,16 @@ class ScopeDelayMainWindow(QMainWindow):
             self.data_logger.log_dg535_pulse(delayA, widthA)
             self.log("[DG535] Trigger pulse fired.")
         except Exception as e:
+            # Not confirmed on the bus: do not wait on a trigger that may not exist
+            self.disarm_scopes()
+            self.set_status("red", "DG535 fire failed")
+            self.log(f"[DG535 ERROR] {e}")
             self.error_popup("DG535 Fire Error", str(e))
             self.data_logger.log_error("DG535", str(e))
             return
 
-        time.sleep(0.5)
+        # No fixed settle delay here: the capture worker waits for every
+        # scope's trigger to complete in parallel
 
         # 5. CAPTURE waveforms (4 channels each)
         self.set_status("yellow", "Capturing 4-channel waveforms...")
@@ -1355,33 +1551,48 @@ class ScopeDelayMainWindow(QMainWindow):
 
         # self.set_status("green", "4-channel capture complete")
         # self.log("[CAPTURE] Done.")
+        scopes = {}
         if self.rigol1_connected:
-            data = self.rigol1.wait_and_capture_four()
-            self.current_data = data  # ← ADD THIS
-            (t1, v1), (t2, v2), (t3, v3), (t4, v4) = data
-            self.scope_window.update_r1(t1, v1, t2, v2, t3, v3, t4, v4)
-            self.data_logger.log_scope_capture(1, len(t1), len(t2))
-            self.log(f"[Rigol1] Captured: CH1={len(t1)}, CH2={len(t2)}, CH3={len(t3)}, CH4={len(t4)} pts")
-
+            scopes[1] = self.rigol1
         if self.rigol2_connected:
-            data = self.rigol2.wait_and_capture_four()
-            self.current_data = data  # ← ADD THIS
-            (t1, v1), (t2, v2), (t3, v3), (t4, v4) = data
-            self.scope_window.update_r2(t1, v1, t2, v2, t3, v3, t4, v4)
-            self.data_logger.log_scope_capture(2, len(t1), len(t2))
-            self.log(f"[Rigol2] Captured: CH1={len(t1)}, CH2={len(t2)}, CH3={len(t3)}, CH4={len(t4)} pts")
-
+            scopes[2] = self.rigol2
         if self.rigol3_connected:
-            data = self.rigol3.wait_and_capture_four()
-            self.current_data = data  # ← ADD THIS
-            (t1, v1), (t2, v2), (t3, v3), (t4, v4) = data
-            self.scope_window.update_r3(t1, v1, t2, v2, t3, v3, t4, v4)
-            self.data_logger.log_scope_capture(3, len(t1), len(t2))
-            self.log(f"[Rigol3] Captured: CH1={len(t1)}, CH2={len(t2)}, CH3={len(t3)}, CH4={len(t4)} pts")
+            scopes[3] = self.rigol3
 
+        # Wait for and read all scopes at the same time in the background.
+        # Scopes were armed in step 1, so the worker must not re-send :SINGle.
+        self.multi_capture_worker = MultiScopeCaptureWorker(
+            scopes, timeout=300.0, arm=False, settings=self._collect_shot_settings()
+        )
+        self.multi_capture_worker.scope_done.connect(self.on_multi_capture_scope_done)
+        self.multi_capture_worker.error.connect(
+            lambda msg, scope_id: self.on_single_capture_error(msg, f"Rigol #{scope_id}")
+        )
+        self.multi_capture_worker.finished.connect(self.on_multi_capture_finished)
+        self.multi_capture_worker.start()
+
+    def on_multi_capture_scope_done(self, scope_id, data):
+        """Handle one scope finishing inside a multi-scope capture"""
+        self.current_data = data
+        self.scope_captures[scope_id] = data
+
+        self.scope_window.update_scope(scope_id, data)
+
+        n1, n2, n3, n4 = [channel_points(ch) for ch in data]
+        self.data_logger.log_scope_capture(scope_id, n1, n2)
+        self.log(f"[Rigol{scope_id}] Captured: CH1={n1}, CH2={n2}, CH3={n3}, CH4={n4} pts")
+
+    def on_multi_capture_finished(self, shot):
+        """Handle completion of a multi-scope capture (one ScopeShot)"""
+        self.last_shot = shot
         self.data_logger.log_scope_all_capture()
-        self.set_status("green", "4-channel capture complete")
-        self.log("[CAPTURE] Done.")
+
+        if shot.ok:
+            self.set_status("green", "4-channel capture complete")
+        else:
+            failed = ", ".join(f"Rigol{i}" for i in sorted(shot.errors))
+            self.set_status("red", f"Capture incomplete ({failed})")
+        self.log(f"[CAPTURE] Done in {shot.elapsed:.2f} s.")
 
 
     def on_r1_single(self):
@@ -1440,7 +1651,7 @@ class ScopeDelayMainWindow(QMainWindow):
             sf6_panel.lamp.set_status("green", "Connected")
 
             self.arduino_stream = PressureStreamWorker(self.arduino)
-            self.arduino_stream.data_signal.connect(self.on_pressure_data)
+            self.arduino_stream.batch_signal.connect(self.on_pressure_batch)
             self.arduino_stream.error_signal.connect(lambda msg: self.log(f"[Arduino Stream ERROR] {msg}"))
             self.arduino_stream.start()
 
@@ -1460,26 +1671,31 @@ class ScopeDelayMainWindow(QMainWindow):
             sf6_panel.lamp.set_status("red", "Error")
             self.error_popup("Arduino Error", str(e))
 
-    def on_pressure_data(self, psi0: float, psi1: float, psi2: float, voltage: float):
+    def load_pressure_calibration(self):
+        """Load pressure_calibration.json; on any error keep the built-in table"""
+        try:
+            if PressureCalibration.load_default():
+                self.log("[Pressure] Calibration loaded from pressure_calibration.json")
+        except Exception as e:
+            self.log(f"[Pressure ERROR] Bad calibration file, using built-in table: {e}")
+            self.data_logger.log_error("Pressure", f"Calibration file: {e}")
+
+    def on_pressure_batch(self, batch):
         """
-        Handle pressure data from PressureStreamWorker.
+        Handle one PressureBatch from PressureStreamWorker.
 
-        Args:
-            psi0: PSI from AI0 (4-20mA sensor, 0-200 PSI)
-            psi1: PSI from AI1 (4-20mA sensor, 0-200 PSI)
-            psi2: PSI from AI2 (calibrated pressure sensor, 0-80 PSI)
-            voltage: Output voltage to regulator (0-10V)
+        Every sample is logged; the gauges show the latest one.
         """
         try:
-            self.data_logger.log_arduino_psi(psi0, psi1, psi2)
+            for psi0, psi1, psi2 in zip(batch.psi0.tolist(), batch.psi1.tolist(), batch.psi2.tolist()):
+                self.data_logger.log_arduino_psi(psi0, psi1, psi2)
         except Exception as e:
             self.log(f"[DataLogger ERROR] Failed to log Arduino data: {e}")
 
         sf6_panel = self.sf6_window.sf6_panel
-        sf6_panel.ai_ch0.update_value(psi0)
-        sf6_panel.ai_ch1.update_value(psi1)
-        sf6_panel.ai_ch2.update_value(psi2)
-
+        self.gauge_refresh.set(sf6_panel.ai_ch0, float(batch.psi0[-1]))
+        self.gauge_refresh.set(sf6_panel.ai_ch1, float(batch.psi1[-1]))
+        self.gauge_refresh.set(sf6_panel.ai_ch2, float(batch.psi2[-1]))
 
     def on_sf6_switch_changed(self, index: int, state: int):
         try:
@@ -1522,10 +1738,12 @@ class ScopeDelayMainWindow(QMainWindow):
         self.log(f"[SAFETY] Turning off HV on {len(connected_units)} connected WJ supply(ies)...")
         self.set_status("yellow", "Turning off HV supplies...")
 
-        # Send HV OFF to all connected units
-        for i, wj in connected_units:
+        # Send HV OFF to all connected units (ahead of any queued polls/commands)
+        pending = [(i, self.wj_schedulers[i].submit(wj.hv_off_pulse, priority=WJScheduler.SAFETY))
+                   for i, wj in connected_units]
+        for i, future in pending:
             try:
-                resp = wj.hv_off_pulse()
+                resp = future.result(WJScheduler.CALL_TIMEOUT)
                 self.log(f"[WJ{i+1}] HV OFF command sent: {resp}")
             except Exception as e:
                 self.log(f"[WJ{i+1} ERROR] Failed to send HV OFF: {e}")
@@ -1541,7 +1759,7 @@ class ScopeDelayMainWindow(QMainWindow):
 
             for attempt in range(max_retries):
                 try:
-                    data = wj.query()
+                    data = self.wj_schedulers[i].call(wj.query, priority=WJScheduler.SAFETY)
 
                     if data.get("type") != "R":
                         self.log(f"[WJ{i+1}] Query returned non-R packet: {data}")
@@ -1557,7 +1775,7 @@ class ScopeDelayMainWindow(QMainWindow):
                     else:
                         self.log(f"[WJ{i+1}] HV still ON, retrying... (attempt {attempt + 1}/{max_retries})")
                         # Send another HV OFF command
-                        wj.hv_off_pulse()
+                        self.wj_schedulers[i].call(wj.hv_off_pulse, priority=WJScheduler.SAFETY)
                         time.sleep(retry_delay)
 
                 except Exception as e:
@@ -1588,7 +1806,7 @@ class ScopeDelayMainWindow(QMainWindow):
 
         try:
             self.log(f"[WJ{index+1}] Connecting on {port}...")
-            self.wj_units[index].connect(port)
+            self.wj_schedulers[index].call(self.wj_units[index].connect, port)
             save_memory(f"WJ{index+1}_COM", port)
             row.lamp.set_status("green", "Connected")
         except Exception as e:
@@ -1613,7 +1831,7 @@ class ScopeDelayMainWindow(QMainWindow):
     def on_wj_hv_on(self):
         for i, wj in enumerate(self.wj_units):
             try:
-                resp = wj.hv_on_pulse()
+                resp = self.wj_schedulers[i].call(wj.hv_on_pulse)
                 self.data_logger.log_wj_command(i+1, "HV_ON")
                 self.log(f"[WJ{i+1}] HV ON → {resp}")
             except Exception as e:
@@ -1623,7 +1841,7 @@ class ScopeDelayMainWindow(QMainWindow):
     def on_wj_hv_off(self):
         for i, wj in enumerate(self.wj_units):
             try:
-                resp = wj.hv_off_pulse()
+                resp = self.wj_schedulers[i].call(wj.hv_off_pulse, priority=WJScheduler.SAFETY)
                 self.data_logger.log_wj_command(i+1, "HV_OFF")
                 self.log(f"[WJ{i+1}] HV OFF → {resp}")
             except Exception as e:
@@ -1634,7 +1852,7 @@ class ScopeDelayMainWindow(QMainWindow):
     def on_wj_reset(self):
         for i, wj in enumerate(self.wj_units):
             try:
-                wj.reset_pulse()
+                self.wj_schedulers[i].call(wj.reset_pulse, priority=WJScheduler.SAFETY)
                 self.data_logger.log_wj_command(i+1, "RESET")
                 self.log(f"[WJ{i+1}] Reset OK")
             except Exception as e:
@@ -1649,7 +1867,7 @@ class ScopeDelayMainWindow(QMainWindow):
 
         for i, wj in enumerate(self.wj_units):
             try:
-                resp = wj.set_program(kv, ma)
+                resp = self.wj_schedulers[i].call(wj.set_program, kv, ma)
                 self.data_logger.log_wj_command(i+1, "SET_PROGRAM", f"{kv}kV_{ma}mA")
                 self.log(f"[WJ{i+1}] Set → {kv} kV, {ma} mA ({resp})")
             except Exception as e:
@@ -1659,7 +1877,7 @@ class ScopeDelayMainWindow(QMainWindow):
 
     def on_wj_disconnect(self, index):
         try:
-            self.wj_units[index].close()
+            self.wj_schedulers[index].call(self.wj_units[index].close)
         except:
             pass
 
@@ -1670,7 +1888,7 @@ class ScopeDelayMainWindow(QMainWindow):
     def on_wj_read(self):
         for i, wj in enumerate(self.wj_units):
             try:
-                data = wj.query()
+                data = self.wj_schedulers[i].call(wj.query)
                 self.log(f"[WJ{i+1}] Readback: {data}")
 
                 row = self.wj_panel.rows[i]
@@ -1707,106 +1925,69 @@ class ScopeDelayMainWindow(QMainWindow):
         self.scope_window.raise_()
         self.scope_window.activateWindow()
 
+    # Max time closeEvent waits for the background auto-export to flush
+    AUTO_EXPORT_TIMEOUT_MS = 30000
+
     def _has_scope_data(self):
-        """Check if any scope plot has data that hasn't been exported"""
-        if not hasattr(self, 'scope_window') or not self.scope_window:
-            return False
-
-        # Check all curves for data
-        for curves in [self.scope_window.r1_curves, self.scope_window.r2_curves, self.scope_window.r3_curves]:
-            for curve in curves:
-                if curve is not None:
-                    x, y = curve.getData()
-                    if x is not None and len(x) > 0:
-                        return True
-        return False
+        """Check if any scope capture has been retained for export"""
+        return bool(getattr(self, 'scope_captures', None))
 
     def _auto_export_scope_data(self):
-        """Auto-export all scope data to CSV files on close"""
-        import csv
-        from datetime import datetime
-
-        if not hasattr(self, 'scope_window') or not self.scope_window:
-            return []
-
-        saved_files = []
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        # Helper to export one scope's data
-        def export_scope(curves, scope_name):
-            # Get data from all 4 channels
-            data = []
-            for curve in curves:
-                if curve is not None:
-                    x, y = curve.getData()
-                    if x is not None and y is not None:
-                        data.append((list(x), list(y)))
-                    else:
-                        data.append(([], []))
-                else:
-                    data.append(([], []))
-
-            # Check if any channel has data
-            has_data = any(len(d[0]) > 0 for d in data)
-            if not has_data:
-                return None
-
-            (t1, v1), (t2, v2), (t3, v3), (t4, v4) = data
-            filename = f"{scope_name}_auto_{timestamp}.csv"
-
-            # Find max length among all channels
-            max_len = max(len(t1), len(t2), len(t3), len(t4))
-
-            with open(filename, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(["time_s", "ch1_v", "ch2_v", "ch3_v", "ch4_v"])
-                for i in range(max_len):
-                    row = [
-                        t1[i] if i < len(t1) else "",
-                        v1[i] if i < len(v1) else "",
-                        v2[i] if i < len(v2) else "",
-                        v3[i] if i < len(v3) else "",
-                        v4[i] if i < len(v4) else "",
-                    ]
-                    writer.writerow(row)
-            return filename
-
-        # Export each scope
-        f1 = export_scope(self.scope_window.r1_curves, "rigol1")
-        if f1:
-            saved_files.append(f1)
-
-        f2 = export_scope(self.scope_window.r2_curves, "rigol2")
-        if f2:
-            saved_files.append(f2)
-
-        f3 = export_scope(self.scope_window.r3_curves, "rigol3")
-        if f3:
-            saved_files.append(f3)
-
-        return saved_files
+        """
+        Start the background auto-export of all retained scope captures.
+
+        Writes a binary shot archive (all scopes) and one CSV per scope
+        from self.scope_captures, not from the plot curves.
+
+        Returns:
+            The started AutoExportWorker
+        """
+        settings = self.last_shot.settings if self.last_shot is not None else {}
+        self.auto_export_worker = AutoExportWorker(self.scope_captures, settings=settings)
+        self.auto_export_worker.error.connect(lambda msg: self.log(f"[AUTO-EXPORT ERROR] {msg}"))
+        self.auto_export_worker.start()
+        return self.auto_export_worker
 
     def closeEvent(self, event):
-        # Auto-export scope data if any exists
+        # Auto-export scope data if any exists (background, bounded wait).
+        # The shot archive is written first, so a timeout only cuts the CSVs
         if self._has_scope_data():
             try:
-                saved_files = self._auto_export_scope_data()
-                if saved_files:
-                    self.log(f"[AUTO-EXPORT] Saved scope data on close: {', '.join(saved_files)}")
+                self.set_status("yellow", "Saving scope data...")
+                worker = self._auto_export_scope_data()
+                if not worker.wait(self.AUTO_EXPORT_TIMEOUT_MS):
+                    self.log(f"[AUTO-EXPORT ERROR] Not finished after "
+                             f"{self.AUTO_EXPORT_TIMEOUT_MS / 1000:.0f} s; export stopped, "
+                             f"remaining files not written")
+                    # Must not be destroyed while running
+                    worker.terminate()
+                    worker.wait()
+                if worker.saved_files:
+                    self.log(f"[AUTO-EXPORT] Saved scope data on close: {', '.join(worker.saved_files)}")
             except Exception as e:
                 self.log(f"[AUTO-EXPORT ERROR] Failed to save scope data: {e}")
 
-        if hasattr(self, 'wj_workers'):
-            for worker in self.wj_workers:
-                if worker.isRunning():
-                    worker.stop()
+        if hasattr(self, 'connect_worker') and self.connect_worker.isRunning():
+            # Bounded by the per-device timeouts
+            self.connect_worker.wait()
+
+        if hasattr(self, 'wj_plot_timer'):
+            self.wj_plot_timer.stop()
 
-        if hasattr(self, 'scope_window') and self.scope_window:
-            self.scope_window.close()
+        if hasattr(self, 'wj_schedulers'):
+            for scheduler in self.wj_schedulers:
+                if scheduler.isRunning():
+                    scheduler.stop()
+
+        if self._scope_window is not None:
+            self._scope_window.close()
 
         if hasattr(self, 'sf6_window') and self.sf6_window:
             self.sf6_window.close()
 
+        # Release any VISA sessions still open (scopes left connected)
+        get_session_pool().close_all()
+
         if hasattr(self, 'data_logger') and self.data_logger:
             self.data_logger.close()
 
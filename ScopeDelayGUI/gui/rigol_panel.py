@@ -232,5 +232,9 @@ class RigolPanel(QGroupBox):
         # Capture all button
         layout.addWidget(self.btn_capture, 3, 0, 1, 3)
 
+        # Drop cached scope settings after front-panel changes
+        self.btn_refresh_settings = QPushButton("Re-read Scope Settings")
+        layout.addWidget(self.btn_refresh_settings, 3, 3, 1, 3)
+
         self.btn_export = QPushButton("Export Waveforms to CSV")
         layout.addWidget(self.btn_export)
@@ -6,14 +6,20 @@ Uses pyqtgraph for fast plotting with 4 separate Y-axes:
 - Left inner axis: CH1 (yellow)
 - Right inner axis: CH2 (cyan)
 - Right outer axis: CH4 (indigo)
+
+Curves are LODCurveItems: full 1M-point records are kept per channel and
+only a min/max-decimated view of the visible span is drawn.
 """
 
 import pyqtgraph as pg
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QHBoxLayout, QCheckBox, QGroupBox
 from PyQt6.QtGui import QFont
-from pyqtgraph import ViewBox, PlotCurveItem, AxisItem
+from pyqtgraph import ViewBox, AxisItem
 import numpy as np
 
+from instruments.waveform import as_time_voltage
+from gui.lod_curve import LODCurveItem
+
 
 class ScopePlotWindow(QWidget):
     """
@@ -204,7 +210,8 @@ class ScopePlotWindow(QWidget):
         ch4_pen = pg.mkPen(self.CH4_COLOR, width=2)
 
         # CH1 uses the default left axis
-        ch1 = pw.plot([], [], pen=ch1_pen, name='CH1')
+        ch1 = LODCurveItem(pen=ch1_pen, name='CH1')
+        pw.addItem(ch1)
 
         # Style the default left axis for CH1 (yellow)
         ax_ch1 = pw.getAxis('left')
@@ -225,7 +232,7 @@ class ScopePlotWindow(QWidget):
         plotItem.scene().addItem(vb_ch2)
         vb_ch2.setXLink(pw)
 
-        ch2 = PlotCurveItem(pen=ch2_pen, name='CH2')
+        ch2 = LODCurveItem(pen=ch2_pen, name='CH2')
         vb_ch2.addItem(ch2)
 
         # Create ViewBox and axis for CH3 (right middle - magenta)
@@ -240,7 +247,7 @@ class ScopePlotWindow(QWidget):
         vb_ch3.setXLink(pw)
         plotItem.layout.addItem(ax_ch3, 2, 4)
 
-        ch3 = PlotCurveItem(pen=ch3_pen, name='CH3')
+        ch3 = LODCurveItem(pen=ch3_pen, name='CH3')
         vb_ch3.addItem(ch3)
 
         # Create ViewBox and axis for CH4 (right outer - indigo)
@@ -255,7 +262,7 @@ class ScopePlotWindow(QWidget):
         vb_ch4.setXLink(pw)
         plotItem.layout.addItem(ax_ch4, 2, 5)
 
-        ch4 = PlotCurveItem(pen=ch4_pen, name='CH4')
+        ch4 = LODCurveItem(pen=ch4_pen, name='CH4')
         vb_ch4.addItem(ch4)
 
         # Store axis references
@@ -361,20 +368,39 @@ class ScopePlotWindow(QWidget):
         else:
             self.r3_ch4.setData([], [])
 
+    def _unpack_four(self, data):
+        """
+        Convert a 4-channel tuple to (t1, v1, ..., t4, v4) arrays.
+
+        Accepts Waveform objects or old-style (t, v) tuples. Voltage is
+        scaled as float32 for plotting (half the memory of float64).
+        """
+        arrays = []
+        for ch in data:
+            t, v = as_time_voltage(ch, dtype=np.float64)
+            arrays.extend((t, v.astype(np.float32, copy=False)))
+        return arrays
+
     def update_r1_four(self, data):
-        """Update Rigol #1 with 4-channel data tuple"""
-        (t1, v1), (t2, v2), (t3, v3), (t4, v4) = data
-        self.update_r1(t1, v1, t2, v2, t3, v3, t4, v4)
+        """Update Rigol #1 with 4-channel data tuple (Waveforms or (t, v) pairs)"""
+        self.update_r1(*self._unpack_four(data))
 
     def update_r2_four(self, data):
-        """Update Rigol #2 with 4-channel data tuple"""
-        (t1, v1), (t2, v2), (t3, v3), (t4, v4) = data
-        self.update_r2(t1, v1, t2, v2, t3, v3, t4, v4)
+        """Update Rigol #2 with 4-channel data tuple (Waveforms or (t, v) pairs)"""
+        self.update_r2(*self._unpack_four(data))
 
     def update_r3_four(self, data):
-        """Update Rigol #3 with 4-channel data tuple"""
-        (t1, v1), (t2, v2), (t3, v3), (t4, v4) = data
-        self.update_r3(t1, v1, t2, v2, t3, v3, t4, v4)
+        """Update Rigol #3 with 4-channel data tuple (Waveforms or (t, v) pairs)"""
+        self.update_r3(*self._unpack_four(data))
+
+    def update_scope(self, scope_id, data):
+        """Update the plot for scope_id (1-3) with a 4-channel data tuple"""
+        if scope_id == 1:
+            self.update_r1_four(data)
+        elif scope_id == 2:
+            self.update_r2_four(data)
+        elif scope_id == 3:
+            self.update_r3_four(data)
 
     # ------------------------------------------------------------
     # CLEAR PLOTS
@@ -7,11 +7,12 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QDoubleSpinBox, QTextEdit, QComboBox, QGroupBox
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 
 import pyqtgraph as pg
 
 from instruments.wj import WJPowerSupply
+from utils.wj_scheduler import WJPollPolicy, WJScheduler
 
 
 class WJDebugWindow(QWidget):
@@ -22,7 +23,7 @@ class WJDebugWindow(QWidget):
       - COM port selection + Connect
       - Set Voltage (kV) / Current (mA)
       - HV ON / HV OFF / RESET
-      - Auto-poll status (timer) to prevent 1.5 s timeout
+      - Auto-poll status (WJScheduler, 500 ms) to prevent 1.5 s timeout
       - Live decoded readout (kV, mA, HV ON, Fault, Mode)
       - Live plot of V and I vs time
       - Console log of all traffic
@@ -34,13 +35,18 @@ class WJDebugWindow(QWidget):
         self.setWindowTitle("WJ100P6.0 Debug")
         self.wj = WJPowerSupply(vmax_kv=100.0, imax_ma=6.0)
 
+        # All port traffic goes through the scheduler thread; poll every
+        # 500 ms and show every reading (no deadband/heartbeat filtering)
+        self.scheduler = WJScheduler(
+            self.wj, policy=WJPollPolicy(fast_interval=0.5, idle_interval=0.5, heartbeat=0))
+
         self._t0 = time.time()
         self.time_buf = deque(maxlen=500)
         self.v_buf = deque(maxlen=500)
         self.i_buf = deque(maxlen=500)
 
         self._build_ui()
-        self._setup_timer()
+        self._setup_polling()
 
     # ------------------------------------------------------------------
     def _build_ui(self):
@@ -141,10 +147,11 @@ class WJDebugWindow(QWidget):
         layout.addWidget(self.console, stretch=0)
 
     # ------------------------------------------------------------------
-    def _setup_timer(self):
-        self.timer = QTimer(self)
-        self.timer.setInterval(500)  # ms
-        self.timer.timeout.connect(self._on_poll)
+    def _setup_polling(self):
+        # Polling runs in the scheduler; readings arrive as signals
+        self.scheduler.status.connect(self._on_poll)
+        self.scheduler.reply.connect(self._on_poll)
+        self.scheduler.start()
 
     # ------------------------------------------------------------------
     def _refresh_ports(self):
@@ -166,9 +173,8 @@ class WJDebugWindow(QWidget):
             return
 
         try:
-            self.wj.connect(port)
+            self.scheduler.call(self.wj.connect, port)
             self.log(f"[OK] Connected to {port}")
-            self.timer.start()
         except Exception as e:
             self.log(f"[ERROR] Connect failed: {e}")
 
@@ -181,7 +187,7 @@ class WJDebugWindow(QWidget):
         ma = self.spn_ma.value()
 
         try:
-            result = self.wj.set_program(kv, ma)
+            result = self.scheduler.call(self.wj.set_program, kv, ma)
             self.log(f">> SET {kv:.2f} kV, {ma:.3f} mA → {result}")
         except Exception as e:
             self.log(f"[ERROR] SET failed: {e}")
@@ -191,7 +197,7 @@ class WJDebugWindow(QWidget):
             self.log("[WARN] Not connected.")
             return
         try:
-            result = self.wj.hv_on_pulse()
+            result = self.scheduler.call(self.wj.hv_on_pulse)
             self.log(f">> HV ON → {result}")
         except Exception as e:
             self.log(f"[ERROR] HV ON failed: {e}")
@@ -201,7 +207,7 @@ class WJDebugWindow(QWidget):
             self.log("[WARN] Not connected.")
             return
         try:
-            result = self.wj.hv_off_pulse()
+            result = self.scheduler.call(self.wj.hv_off_pulse, priority=WJScheduler.SAFETY)
             self.log(f">> HV OFF → {result}")
         except Exception as e:
             self.log(f"[ERROR] HV OFF failed: {e}")
@@ -211,7 +217,7 @@ class WJDebugWindow(QWidget):
             self.log("[WARN] Not connected.")
             return
         try:
-            result = self.wj.reset_pulse()
+            result = self.scheduler.call(self.wj.reset_pulse, priority=WJScheduler.SAFETY)
             self.log(f">> RESET → {result}")
         except Exception as e:
             self.log(f"[ERROR] RESET failed: {e}")
@@ -219,15 +225,8 @@ class WJDebugWindow(QWidget):
     # ------------------------------------------------------------------
     # Polling
     # ------------------------------------------------------------------
-    def _on_poll(self):
-        if not self.wj.is_connected:
-            return
-        try:
-            data = self.wj.query()
-        except Exception as e:
-            self.log(f"[ERROR] Query failed: {e}")
-            return
-
+    def _on_poll(self, data: dict):
+        """One polled reply from the scheduler (status or reply signal)"""
         if data.get("type") == "E":
             self.log(f"<< ERROR {data['code']}: {data['message']}")
             self.lbl_fault.setText(f"Fault: ERROR {data['code']}")
@@ -258,3 +257,9 @@ class WJDebugWindow(QWidget):
 
         self.curve_v.setData(list(self.time_buf), list(self.v_buf))
         self.curve_i.setData(list(self.time_buf), list(self.i_buf))
+
+    # ------------------------------------------------------------------
+    def closeEvent(self, event):
+        if self.scheduler.isRunning():
+            self.scheduler.stop()
+        super().closeEvent(event)
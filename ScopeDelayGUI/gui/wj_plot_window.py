@@ -166,51 +166,32 @@
 #         if self.worker.isRunning():
 #             self.worker.stop()
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPushButton
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QFont
 import pyqtgraph as pg
 import time
 import csv
 from datetime import datetime
 
+from utils.ring_buffer import RingBuffer
+from utils.wj_scheduler import WJScheduler
+
 
 
 # from PyQt6.QtCore import QThread, pyqtSignal
 # import time
 
-class WJReaderThread(QThread):
-    new_data = pyqtSignal(float, float, float)   # time, kV, mA
-
-    def __init__(self, wj, poll_interval=0.05):
-        super().__init__()
-        self.wj = wj
-        self.poll_interval = poll_interval
-        self.running = True
-        self.t0 = time.time()
-
-    def run(self):
-        while self.running:
-            try:
-                data = self.wj.query()
-                if data.get("type") == "R":
-                    kv = data["kv"]
-                    ma = data["ma"]
-                    t = time.time() - self.t0
-                    self.new_data.emit(t, kv, ma)
-            except Exception:
-                pass
-
-            self.msleep(int(self.poll_interval * 1000))
-
-    def stop(self):
-        self.running = False
-        self.wait()
-
 class WJPlotWindow(QWidget):
-    def __init__(self, wj_units, data_logger=None):
+    # Curve redraw interval; samples in between are only buffered
+    REFRESH_MS = 100
+
+    def __init__(self, wj_units, data_logger=None, schedulers=None):
         """
         wj_units = [WJ1, WJ2]
         data_logger = DataLogger instance (optional)
+        schedulers = the WJScheduler of each unit, if the caller already
+                     runs them; otherwise this window starts its own.
+                     Either way the scheduler is the only code on the port.
         """
         super().__init__()
         self.setWindowTitle("WJ Live Voltage / Current Monitor (Both Units)")
@@ -247,26 +228,32 @@ class WJPlotWindow(QWidget):
         # Apply Times New Roman bold font
         self._apply_font_styling()
 
-        # Buffers for rolling window
+        # Rolling window: one (t, kV, mA) ring buffer per unit
         self.max_points = 500
-        self.t_buf = []
+        self.buffers = [RingBuffer(self.max_points, width=3) for _ in self.wj_units]
+        self.curves = [(self.kv1_curve, self.ma1_curve), (self.kv2_curve, self.ma2_curve)]
+        self._dirty = False
 
-        self.kv1_buf = []
-        self.ma1_buf = []
-        self.kv2_buf = []
-        self.ma2_buf = []
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh_plot)
+        self.refresh_timer.start(self.REFRESH_MS)
 
         # ─────────────────────────────────────────────
-        # START WORKER THREADS FOR EACH WJ UNIT
+        # SUBSCRIBE TO EACH UNIT'S SCHEDULER READINGS
         # ─────────────────────────────────────────────
-        self.workers = []
         self.start_time = time.time()
-
-        for idx, wj in enumerate(self.wj_units):
-            worker = WJReaderThread(wj)
-            worker.new_data.connect(lambda t, kv, ma, i=idx: self.handle_unit_data(i, t, kv, ma))
-            worker.start()
-            self.workers.append(worker)
+        self._own_schedulers = schedulers is None
+        if schedulers is None:
+            schedulers = [WJScheduler(wj) for wj in self.wj_units]
+        self.schedulers = list(schedulers)
+
+        self._slots = []
+        for idx, scheduler in enumerate(self.schedulers):
+            slot = lambda t, kv, ma, i=idx: self.handle_unit_data(i, t, kv, ma)
+            scheduler.new_data.connect(slot)
+            self._slots.append(slot)
+            if self._own_schedulers:
+                scheduler.start()
 
         # Stop threads on close
         self.destroyed.connect(self.on_close)
@@ -299,31 +286,22 @@ class WJPlotWindow(QWidget):
             # The main window's on_wj_read will log full status
             pass  # Already logged by main window's on_wj_read
 
-        self.t_buf.append(t)
-
-        # Unit 1
-        if unit_index == 0:
-            self.kv1_buf.append(kv)
-            self.ma1_buf.append(ma)
+        if 0 <= unit_index < len(self.buffers):
+            self.buffers[unit_index].append((t, kv, ma))
+            self._dirty = True
 
-        # Unit 2
-        elif unit_index == 1:
-            self.kv2_buf.append(kv)
-            self.ma2_buf.append(ma)
-
-        # Rolling window
-        if len(self.t_buf) > self.max_points:
-            self.t_buf = self.t_buf[-self.max_points:]
-            self.kv1_buf = self.kv1_buf[-self.max_points:]
-            self.ma1_buf = self.ma1_buf[-self.max_points:]
-            self.kv2_buf = self.kv2_buf[-self.max_points:]
-            self.ma2_buf = self.ma2_buf[-self.max_points:]
+    def refresh_plot(self):
+        """Redraw the curves from the ring buffers (timer slot)"""
+        if not self._dirty:
+            return
+        self._dirty = False
 
-        # Update curves
-        self.kv1_curve.setData(self.t_buf, self.kv1_buf)
-        self.ma1_curve.setData(self.t_buf, self.ma1_buf)
-        self.kv2_curve.setData(self.t_buf, self.kv2_buf)
-        self.ma2_curve.setData(self.t_buf, self.ma2_buf)
+        for buf, (kv_curve, ma_curve) in zip(self.buffers, self.curves):
+            if len(buf):
+                # Copies: pyqtgraph keeps the arrays, appends overwrite the views
+                t, kv, ma = buf.columns(copy=True)
+                kv_curve.setData(t, kv)
+                ma_curve.setData(t, ma)
 
     def export_csv(self):
         """Save time-stamped data for ALL WJ units into a CSV file."""
@@ -346,6 +324,11 @@ class WJPlotWindow(QWidget):
     # Cleanup
     # ---------------------------------------------------------
     def on_close(self):
-        for w in self.workers:
-            if w.isRunning():
-                w.stop()
+        self.refresh_timer.stop()
+        for scheduler, slot in zip(self.schedulers, self._slots):
+            try:
+                scheduler.new_data.disconnect(slot)
+            except TypeError:
+                pass
+            if self._own_schedulers and scheduler.isRunning():
+                scheduler.stop()
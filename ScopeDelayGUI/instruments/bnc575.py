@@ -373,11 +373,16 @@ NOT WORKING on this firmware:
 - Channel name style (CHA:, CHB:)
 """
 
+import copy
 import serial
 import time
+from collections import deque
+from dataclasses import dataclass, field
 from typing import Optional, Tuple, List, Dict, Any
 from enum import Enum
 
+from instruments.serial_transport import SerialTransport
+
 
 class SystemMode(Enum):
     """System T0 modes - from manual page 8-38"""
@@ -447,6 +452,60 @@ class ClockSource(Enum):
     EXT_100MHZ = "EXT100"
 
 
+@dataclass
+class PulseChannelState:
+    """Last confirmed settings of one output channel (None = unknown)"""
+    width: Optional[float] = None
+    delay: Optional[float] = None
+    enabled: Optional[bool] = None
+    polarity: Optional[Polarity] = None
+
+
+@dataclass
+class BNC575State:
+    """Shadow of the instrument settings the driver writes (None = unknown)"""
+    channels: Dict[int, PulseChannelState] = field(default_factory=dict)
+    period: Optional[float] = None
+    mode: Optional[SystemMode] = None
+    trigger_mode: Optional[TriggerMode] = None
+    trigger_level: Optional[float] = None
+    trigger_edge: Optional[TriggerEdge] = None
+
+    def __post_init__(self):
+        for ch in (1, 2, 3, 4):
+            self.channels.setdefault(ch, PulseChannelState())
+
+    def channel(self, ch: int) -> PulseChannelState:
+        return self.channels.setdefault(ch, PulseChannelState())
+
+
+@dataclass
+class CommandResult:
+    """Reply to one command sent through BNC575Controller.send_commands()"""
+    command: str
+    response: Optional[str] = None      # "ok", "?n", query value; None = not sent / no reply
+
+    @property
+    def answered(self) -> bool:
+        """The command was sent and a reply line came back"""
+        return self.response is not None
+
+    @property
+    def error_code(self) -> Optional[int]:
+        """n from a "?n" error reply, else None"""
+        if self.answered and self.response.startswith("?"):
+            try:
+                return int(self.response[1:])
+            except ValueError:
+                return -1
+        return None
+
+    @property
+    def ok(self) -> bool:
+        """Answered with anything but a "?n" error (unanswered counts as failed)"""
+        return self.answered and self.error_code is None
+
+
 class BNC575Controller:
     """
     Controller for BNC 575 Series Digital Delay/Pulse Generator
@@ -470,8 +529,13 @@ class BNC575Controller:
     """
     
     TERMINATOR = "\n"
-    TIMEOUT = 1.0
-    CMD_DELAY = 0.05  # 50ms between commands (was 20ms)
+    TIMEOUT = 1.0   # max wait for a reply line
+
+    # Max commands in flight in send_commands() (keeps the input buffer small)
+    PIPELINE_WINDOW = 8
+
+    # Default max age (s) of a read_snapshot() served from the shadow state
+    SNAPSHOT_TTL = 1.0
     
     # Channel mapping: index -> channel number
     # 0 = T0 (system), 1 = A, 2 = B, 3 = C, 4 = D, 5 = E, 6 = F, 7 = G, 8 = H
@@ -486,9 +550,16 @@ class BNC575Controller:
         self.port = port
         self.baudrate = baudrate
         self.serial: Optional[serial.Serial] = None
+        self.transport: Optional[SerialTransport] = None
         self._connected = False
         self._num_channels = 4  # Will detect on connect
         self._firmware_version = ""
+        self.last_results: List[CommandResult] = []
+        # Shadow of the instrument state; apply_settings() & co. only send
+        # what differs from it. Reset on connect/*RST/*RCL or by resync().
+        self.shadow = BNC575State()
+        self._snapshot_time: Optional[float] = None   # last full readback
+        self.snapshot_ttl = self.SNAPSHOT_TTL
     
     # ==================== CONNECTION ====================
     
@@ -502,6 +573,7 @@ class BNC575Controller:
         if not self.port:
             raise ValueError("No port specified")
         
+        self.resync()
         try:
             self.serial = serial.Serial(
                 port=self.port,
@@ -514,6 +586,7 @@ class BNC575Controller:
             time.sleep(0.5)
             self.serial.reset_input_buffer()
             self.serial.reset_output_buffer()
+            self.transport = SerialTransport(self.serial)
             
             # Test connection and get info
             idn = self.identify()
@@ -528,6 +601,9 @@ class BNC575Controller:
                 
         except Exception as e:
             self._connected = False
+            if self.transport:
+                self.transport.close()
+                self.transport = None
             if self.serial:
                 self.serial.close()
             raise ConnectionError(f"Failed to connect: {e}")
@@ -548,6 +624,9 @@ class BNC575Controller:
     
     def close(self):
         """Disconnect"""
+        if self.transport:
+            self.transport.close()
+            self.transport = None
         if self.serial and self.serial.is_open:
             try:
                 self.serial.close()
@@ -561,42 +640,211 @@ class BNC575Controller:
     # ==================== LOW-LEVEL COMMUNICATION ====================
     
     def _write_raw(self, command: str):
-        """Write command without reading response"""
+        """Write command without reading response (drops any stale reply)"""
         if not self.is_connected():
             raise ConnectionError("Not connected")
-        self.serial.reset_input_buffer()
-        self.serial.write((command + self.TERMINATOR).encode('ascii'))
-        self.serial.flush()
-        time.sleep(self.CMD_DELAY)
+        # No fixed delay: callers wait for the reply, which paces the next write
+        self.transport.clear()
+        self.transport.write((command + self.TERMINATOR).encode('ascii'))
     
     def _read_response(self) -> str:
-        """Read response until terminator or timeout"""
-        response = ""
-        start = time.time()
-        while (time.time() - start) < self.TIMEOUT:
-            if self.serial.in_waiting > 0:
-                chunk = self.serial.read(self.serial.in_waiting)
-                response += chunk.decode('ascii', errors='ignore')
-                if '\n' in response or '\r' in response:
-                    break
-            time.sleep(0.005)
-        return response.strip()
+        """Next reply line; returns as soon as it arrives, "" after TIMEOUT"""
+        return self.transport.readline(self.TIMEOUT) or ""
     
     def _command(self, cmd: str) -> bool:
         """Send command, expect 'ok' response"""
+        # False only for a "?n" error code; some commands may not respond
+        return self._command_result(cmd).error_code is None
+
+    def _command_result(self, cmd: str) -> CommandResult:
+        """Send command, return its reply (response=None if there was none)"""
         self._write_raw(cmd)
-        resp = self._read_response()
-        if resp.lower() == "ok":
-            return True
-        elif resp.startswith("?"):
-            # Error code
-            return False
-        return True  # Some commands may not respond
+        return CommandResult(cmd, self._read_response() or None)
     
     def _query(self, cmd: str) -> str:
         """Send query, return response"""
         self._write_raw(cmd)
         return self._read_response()
+
+    @staticmethod
+    def _reply_matches(command: str, reply: str) -> bool:
+        """
+        Plausible reply for command: "?n" for anything, "ok" for a setting,
+        a value (not "ok") for a query.
+        """
+        if reply.startswith("?"):
+            return True
+        is_query = command.rstrip().endswith("?")
+        return (reply.lower() != "ok") if is_query else (reply.lower() == "ok")
+
+    def send_commands(self, commands: List[str], window: int = None) -> List[CommandResult]:
+        """
+        Send commands back to back and match replies in order.
+
+        Every command (set or query) gets exactly one reply line, so no
+        per-command delay is needed: up to window (default PIPELINE_WINDOW)
+        commands are written ahead, and each reply is paired with the oldest command
+        still waiting (FIFO). A freed slot is refilled as soon as its
+        reply arrives.
+
+        If a reply does not arrive within TIMEOUT, or does not fit the
+        command it is paired with (e.g. "ok" to a query), the exchange is
+        out of step: sending stops, the shadow state is dropped (resync())
+        and every command not yet acknowledged keeps response=None (not
+        ok). Commands answered before that keep their replies.
+
+        Args:
+            commands: Commands/queries, without terminator
+            window: Max commands in flight; len(commands) sends them all
+                    in one write
+
+        Returns:
+            One CommandResult per command (also kept in self.last_results)
+        """
+        if not self.is_connected():
+            raise ConnectionError("Not connected")
+
+        window = window or self.PIPELINE_WINDOW
+        results = [CommandResult(cmd) for cmd in commands]
+        unsent = deque(results)
+        pending = deque()
+        self.transport.clear()
+
+        while unsent or pending:
+            if unsent and len(pending) < window:
+                batch = [unsent.popleft() for _ in range(min(len(unsent), window - len(pending)))]
+                self.transport.write("".join(r.command + self.TERMINATOR
+                                             for r in batch).encode('ascii'))
+                pending.extend(batch)
+
+            line = self.transport.readline(self.TIMEOUT)
+            if line is None or not self._reply_matches(pending[0].command, line):
+                # Lost or extra reply: nothing still pending can be trusted
+                self.resync()
+                self.transport.clear()
+                break
+            pending.popleft().response = line
+
+        self.last_results = results
+        return results
+
+    # ==================== SHADOW STATE ====================
+
+    @staticmethod
+    def _same(known, value) -> bool:
+        """Shadow value matches (floats compared at command precision)"""
+        if known is None:
+            return False
+        if isinstance(value, float):
+            return f"{known:.11e}" == f"{value:.11e}"
+        return known == value
+
+    @staticmethod
+    def _record(obj, attr: str, value, result: CommandResult) -> bool:
+        """
+        Store a written value in the shadow.
+
+        Only a confirmed reply caches the value; a rejected or unanswered
+        command leaves it unknown (None), so the next apply sends it again.
+
+        Returns:
+            Same rule as _command(): False only for a "?n" error
+        """
+        setattr(obj, attr, value if result.ok else None)
+        return result.error_code is None
+
+    def _stage(self, pending: list, obj, attr: str, value, command: str, force: bool):
+        """Queue command unless the shadow already holds value"""
+        if force or not self._same(getattr(obj, attr), value):
+            pending.append((command, obj, attr, value))
+
+    def _send_staged(self, pending: list, extra: List[str] = ()) -> bool:
+        """Send staged commands (+ extra unconditional ones) in one send_commands() call"""
+        commands = [c for c, *_ in pending] + list(extra)
+        if not commands:
+            self.last_results = []
+            return True
+        results = self.send_commands(commands)
+        for r, (_, obj, attr, value) in zip(results, pending):
+            self._record(obj, attr, value, r)
+        # Unanswered (or unsent) commands count as failed
+        return all(r.ok for r in results)
+
+    def resync(self):
+        """
+        Forget the shadow state so the next apply writes every parameter.
+
+        Use after the front panel was touched or the unit was power-cycled.
+        """
+        self.shadow = BNC575State()
+        self._snapshot_time = None
+
+    @staticmethod
+    def _parse_float(resp: str) -> Optional[float]:
+        try:
+            return float(resp)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _parse_enum(enum_cls, resp: str):
+        for m in enum_cls:
+            if resp.upper().startswith(m.value):
+                return m
+        return None
+
+    def read_snapshot(self, max_age: float = None, channels=(1, 2, 3, 4)) -> BNC575State:
+        """
+        Read all channel and T0 settings in one pipelined burst.
+
+        Queries width/delay/state/polarity of each channel plus T0 period,
+        system mode and trigger mode/level/edge. All queries go out in a
+        single write and the replies are matched in order (send_commands
+        with the window set to the whole list), so a cold read costs one
+        round trip plus the unit's processing time. The result also becomes
+        the shadow state. If the last full readback is younger than
+        max_age (default self.snapshot_ttl) and nothing has become unknown
+        since, the shadow is returned without touching the hardware.
+
+        Returns:
+            BNC575State copy; fields that did not parse are None
+        """
+        max_age = self.snapshot_ttl if max_age is None else max_age
+        if (self._snapshot_time is not None
+                and time.time() - self._snapshot_time < max_age
+                and self._shadow_complete(channels)):
+            return copy.deepcopy(self.shadow)
+
+        queries = [":PULSE0:PER?", ":PULSE0:MODE?", ":PULSE0:TRIG:MODE?",
+                   ":PULSE0:TRIG:LEV?", ":PULSE0:TRIG:LOG?"]
+        for ch in channels:
+            queries += [f":PULSE{ch}:WIDT?", f":PULSE{ch}:DEL?",
+                        f":PULSE{ch}:STATE?", f":PULSE{ch}:POL?"]
+        replies = [r.response or "" for r in self.send_commands(queries, window=len(queries))]
+
+        shadow = self.shadow
+        shadow.period = self._parse_float(replies[0])
+        shadow.mode = self._parse_enum(SystemMode, replies[1])
+        shadow.trigger_mode = self._parse_enum(TriggerMode, replies[2])
+        shadow.trigger_level = self._parse_float(replies[3])
+        shadow.trigger_edge = self._parse_enum(TriggerEdge, replies[4])
+        for i, ch in enumerate(channels):
+            width, delay, state, pol = replies[5 + 4 * i:9 + 4 * i]
+            c = shadow.channel(ch)
+            c.width = self._parse_float(width)
+            c.delay = self._parse_float(delay)
+            c.enabled = state in ("1", "ON") if state in ("0", "1", "ON", "OFF") else None
+            c.polarity = self._parse_enum(Polarity, pol)
+
+        self._snapshot_time = time.time()
+        return copy.deepcopy(shadow)
+
+    def _shadow_complete(self, channels) -> bool:
+        s = self.shadow
+        if None in (s.period, s.mode, s.trigger_mode, s.trigger_level, s.trigger_edge):
+            return False
+        return all(None not in (c.width, c.delay, c.enabled, c.polarity)
+                   for c in (s.channel(ch) for ch in channels))
     
     # ==================== IDENTIFICATION ====================
     
@@ -609,6 +857,7 @@ class BNC575Controller:
     
     def reset(self) -> bool:
         """Reset to defaults (*RST)"""
+        self.resync()
         return self._command("*RST")
     
     def get_firmware_version(self) -> str:
@@ -642,7 +891,8 @@ class BNC575Controller:
     
     def set_system_mode(self, mode: SystemMode) -> bool:
         """Set system mode: NORM, SING, BURS, DCYC"""
-        return self._command(f":PULSE0:MODE {mode.value}")
+        result = self._command_result(f":PULSE0:MODE {mode.value}")
+        return self._record(self.shadow, 'mode', mode, result)
     
     def get_system_mode(self) -> Optional[SystemMode]:
         """Get current system mode"""
@@ -654,7 +904,8 @@ class BNC575Controller:
     
     def set_period(self, period: float) -> bool:
         """Set T0 period in seconds (100ns to 5000s)"""
-        return self._command(f":PULSE0:PER {period:.11e}")
+        result = self._command_result(f":PULSE0:PER {period:.11e}")
+        return self._record(self.shadow, 'period', period, result)
     
     def get_period(self) -> float:
         """Get T0 period in seconds"""
@@ -707,7 +958,8 @@ class BNC575Controller:
     
     def set_trigger_mode(self, mode: TriggerMode) -> bool:
         """Set trigger mode: DIS, TRIG, DUAL"""
-        return self._command(f":PULSE0:TRIG:MODE {mode.value}")
+        result = self._command_result(f":PULSE0:TRIG:MODE {mode.value}")
+        return self._record(self.shadow, 'trigger_mode', mode, result)
     
     def get_trigger_mode(self) -> Optional[TriggerMode]:
         """Get trigger mode"""
@@ -720,7 +972,8 @@ class BNC575Controller:
     def set_trigger_level(self, level: float) -> bool:
         """Set trigger level (0.20V to 15V)"""
         level = max(0.20, min(15.0, level))
-        return self._command(f":PULSE0:TRIG:LEV {level:.3f}")
+        result = self._command_result(f":PULSE0:TRIG:LEV {level:.3f}")
+        return self._record(self.shadow, 'trigger_level', level, result)
     
     def get_trigger_level(self) -> float:
         """Get trigger level"""
@@ -732,7 +985,8 @@ class BNC575Controller:
     
     def set_trigger_edge(self, edge: TriggerEdge) -> bool:
         """Set trigger edge: RIS or FALL"""
-        return self._command(f":PULSE0:TRIG:LOG {edge.value}")
+        result = self._command_result(f":PULSE0:TRIG:LOG {edge.value}")
+        return self._record(self.shadow, 'trigger_edge', edge, result)
     
     def get_trigger_edge(self) -> Optional[TriggerEdge]:
         """Get trigger edge"""
@@ -771,7 +1025,8 @@ class BNC575Controller:
         """Enable/disable channel"""
         ch = self._resolve_channel(channel)
         state = "ON" if enabled else "OFF"
-        return self._command(f":PULSE{ch}:STATE {state}")
+        result = self._command_result(f":PULSE{ch}:STATE {state}")
+        return self._record(self.shadow.channel(ch), 'enabled', enabled, result)
     
     def get_channel_state(self, channel) -> bool:
         """Get channel enabled state"""
@@ -782,7 +1037,8 @@ class BNC575Controller:
     def set_channel_width(self, channel, width: float) -> bool:
         """Set channel width in seconds (10ns to 999.999s)"""
         ch = self._resolve_channel(channel)
-        return self._command(f":PULSE{ch}:WIDT {width:.11e}")
+        result = self._command_result(f":PULSE{ch}:WIDT {width:.11e}")
+        return self._record(self.shadow.channel(ch), 'width', width, result)
     
     def get_channel_width(self, channel) -> float:
         """Get channel width in seconds"""
@@ -796,7 +1052,8 @@ class BNC575Controller:
     def set_channel_delay(self, channel, delay: float) -> bool:
         """Set channel delay in seconds (-999.999s to 999.999s)"""
         ch = self._resolve_channel(channel)
-        return self._command(f":PULSE{ch}:DEL {delay:.11e}")
+        result = self._command_result(f":PULSE{ch}:DEL {delay:.11e}")
+        return self._record(self.shadow.channel(ch), 'delay', delay, result)
     
     def get_channel_delay(self, channel) -> float:
         """Get channel delay in seconds"""
@@ -810,7 +1067,8 @@ class BNC575Controller:
     def set_channel_polarity(self, channel, polarity: Polarity) -> bool:
         """Set channel polarity"""
         ch = self._resolve_channel(channel)
-        return self._command(f":PULSE{ch}:POL {polarity.value}")
+        result = self._command_result(f":PULSE{ch}:POL {polarity.value}")
+        return self._record(self.shadow.channel(ch), 'polarity', polarity, result)
     
     def get_channel_polarity(self, channel) -> Optional[Polarity]:
         """Get channel polarity"""
@@ -920,6 +1178,7 @@ class BNC575Controller:
         """Recall config from memory (0-12, 0=factory)"""
         if not 0 <= location <= 12:
             return False
+        self.resync()
         return self._command(f"*RCL {location}")
     
     def recall_defaults(self) -> bool:
@@ -976,30 +1235,33 @@ class BNC575Controller:
     # ==================== CONVENIENCE METHODS FOR MAIN_WINDOW.PY ====================
     
     def apply_settings(self, wA: float, dA: float, wB: float, dB: float,
-                       wC: float, dC: float, wD: float, dD: float) -> bool:
-        """Apply width/delay for channels A-D (main_window.py compatible)"""
-        success = True
-        success &= self.set_channel_delay(1, dA)
-        success &= self.set_channel_width(1, wA)
-        success &= self.set_channel_delay(2, dB)
-        success &= self.set_channel_width(2, wB)
-        success &= self.set_channel_delay(3, dC)
-        success &= self.set_channel_width(3, wC)
-        success &= self.set_channel_delay(4, dD)
-        success &= self.set_channel_width(4, wD)
-        return success
-    
-    def read_settings(self) -> Tuple[float, float, float, float, float, float, float, float]:
-        """Read width/delay for channels A-D (main_window.py compatible)"""
-        wA = self.get_channel_width(1)
-        dA = self.get_channel_delay(1)
-        wB = self.get_channel_width(2)
-        dB = self.get_channel_delay(2)
-        wC = self.get_channel_width(3)
-        dC = self.get_channel_delay(3)
-        wD = self.get_channel_width(4)
-        dD = self.get_channel_delay(4)
-        return (wA, dA, wB, dB, wC, dC, wD, dD)
+                       wC: float, dC: float, wD: float, dD: float,
+                       period: float = None, force: bool = False) -> bool:
+        """
+        Apply width/delay for channels A-D (main_window.py compatible)
+
+        Only values that differ from the shadow state are sent (all of
+        them with force=True), through send_commands(); per-command
+        replies are left in self.last_results.
+        """
+        pending = []
+        for ch, (w, d) in enumerate(((wA, dA), (wB, dB), (wC, dC), (wD, dD)), start=1):
+            state = self.shadow.channel(ch)
+            self._stage(pending, state, 'delay', d, f":PULSE{ch}:DEL {d:.11e}", force)
+            self._stage(pending, state, 'width', w, f":PULSE{ch}:WIDT {w:.11e}", force)
+        if period is not None:
+            self._stage(pending, self.shadow, 'period', period, f":PULSE0:PER {period:.11e}", force)
+        return self._send_staged(pending)
+    
+    def read_settings(self, max_age: float = None) -> Tuple[float, float, float, float, float, float, float, float]:
+        """Read width/delay for channels A-D (main_window.py compatible, via read_snapshot)"""
+        snap = self.read_snapshot(max_age)
+        values = []
+        for ch in (1, 2, 3, 4):
+            c = snap.channel(ch)
+            values.append(1e-6 if c.width is None else c.width)
+            values.append(0.0 if c.delay is None else c.delay)
+        return tuple(values)
     
     def fire_internal(self) -> bool:
         """Fire single internal pulse"""
@@ -1012,12 +1274,17 @@ class BNC575Controller:
         self.set_trigger_mode(TriggerMode.TRIGGERED)
         return self.run()
     
-    def arm_external_trigger(self, level: float = 2.5) -> bool:
-        """Arm for external trigger with level"""
-        self.set_trigger_mode(TriggerMode.TRIGGERED)
-        self.set_trigger_level(level)
-        self.set_trigger_edge(TriggerEdge.RISING)
-        return self.run()
+    def arm_external_trigger(self, level: float = 2.5, force: bool = False) -> bool:
+        """Arm for external trigger with level (unchanged trigger settings are not re-sent)"""
+        level = max(0.20, min(15.0, level))
+        pending = []
+        self._stage(pending, self.shadow, 'trigger_mode', TriggerMode.TRIGGERED,
+                    f":PULSE0:TRIG:MODE {TriggerMode.TRIGGERED.value}", force)
+        self._stage(pending, self.shadow, 'trigger_level', level,
+                    f":PULSE0:TRIG:LEV {level:.3f}", force)
+        self._stage(pending, self.shadow, 'trigger_edge', TriggerEdge.RISING,
+                    f":PULSE0:TRIG:LOG {TriggerEdge.RISING.value}", force)
+        return self._send_staged(pending, extra=[":PULSE0:STATE ON"])
     
     def disarm_trigger(self) -> bool:
         """Disarm trigger"""
@@ -1050,15 +1317,18 @@ class BNC575Controller:
         return True
     
     def configure_pulse(self, channel, delay: float, width: float,
-                        polarity: Polarity = Polarity.NORMAL, enabled: bool = True) -> bool:
-        """Configure complete pulse"""
+                        polarity: Polarity = Polarity.NORMAL, enabled: bool = True,
+                        force: bool = False) -> bool:
+        """Configure complete pulse (only parameters that changed are sent)"""
         ch = self._resolve_channel(channel)
-        success = True
-        success &= self.set_channel_delay(ch, delay)
-        success &= self.set_channel_width(ch, width)
-        success &= self.set_channel_polarity(ch, polarity)
-        success &= self.set_channel_state(ch, enabled)
-        return success
+        state = self.shadow.channel(ch)
+        pending = []
+        self._stage(pending, state, 'delay', delay, f":PULSE{ch}:DEL {delay:.11e}", force)
+        self._stage(pending, state, 'width', width, f":PULSE{ch}:WIDT {width:.11e}", force)
+        self._stage(pending, state, 'polarity', polarity, f":PULSE{ch}:POL {polarity.value}", force)
+        self._stage(pending, state, 'enabled', enabled,
+                    f":PULSE{ch}:STATE {'ON' if enabled else 'OFF'}", force)
+        return self._send_staged(pending)
     
     def configure_continuous(self, frequency: float) -> bool:
         """Configure continuous mode at frequency"""
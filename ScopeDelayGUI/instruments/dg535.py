@@ -90,14 +90,32 @@ Output Modes:
     1 = NIM
     2 = ECL
     3 = VAR (Variable)
+
+Shadow state:
+    self.state doubles as a shadow of the instrument. Delays and the
+    trigger mode are only re-sent when they differ from the last value
+    written since connect/resync (pass force=True to send anyway), so an
+    unchanged configure_pulse_A() + set_single_shot() costs no GPIB traffic.
+
+Batching:
+    Inside `with dg.batch():` GPIB commands are collected and sent as one
+    ';'-separated Prologix write when the block ends. Writes are not paced
+    by sleeps: _sync() waits for the adapter to answer "++addr", which it
+    only does after everything written before it has gone out on the bus,
+    and raises TimeoutError if the adapter does not answer. A single shot
+    (SS) is never joined with other commands: the writes before it are
+    synced first and SS goes out on its own line.
 """
 
 import time
 import serial
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from enum import IntEnum
 
+from instruments.serial_transport import SerialTransport
+
 
 class Channel(IntEnum):
     """DG535 Channel assignments per manual page viii"""
@@ -234,11 +252,19 @@ class DG535Controller:
     MIN_DELAY = 0.0
     DELAY_RESOLUTION = 5e-12  # 5 ps
 
+    # Longest ';'-joined command string sent in one write (DG535 input buffer)
+    MAX_BATCH_CHARS = 200
+
     def __init__(self, port: str = "COM4"):
         self.port = port
         self.ser: Optional[serial.Serial] = None
+        self.transport: Optional[SerialTransport] = None
         self.gpib_addr = 15
         self.state = DG535State()
+        # Shadow keys whose self.state value is known to be on the instrument
+        self._synced = set()
+        # Commands collected inside batch(), None when not batching
+        self._batch: Optional[List[str]] = None
 
     # =========================================================================
     # CONNECTION
@@ -259,8 +285,8 @@ class DG535Controller:
             self.port = port
         self.gpib_addr = gpib_addr
 
-        if self.ser and self.ser.is_open:
-            self.ser.close()
+        self.close()
+        self._synced.clear()
 
         self.ser = serial.Serial(
             port=self.port,
@@ -268,6 +294,7 @@ class DG535Controller:
             timeout=timeout
         )
         time.sleep(0.5)  # Allow serial to stabilize
+        self.transport = SerialTransport(self.ser)
 
         # Configure Prologix adapter
         self._write_raw("++mode 1")      # Controller mode
@@ -276,10 +303,17 @@ class DG535Controller:
         self._write_raw("++eoi 1")       # Enable EOI
         self._write_raw("++eos 1")       # LF terminator
 
-        time.sleep(0.2)
+        try:
+            self._sync()
+        except TimeoutError:
+            self.close()
+            raise
 
     def close(self):
         """Close serial connection."""
+        if self.transport:
+            self.transport.close()
+            self.transport = None
         if self.ser and self.ser.is_open:
             self.ser.close()
             self.ser = None
@@ -293,11 +327,81 @@ class DG535Controller:
     # =========================================================================
 
     def _write_raw(self, cmd: str):
-        """Write raw command to serial port."""
+        """Write raw command to serial port (no pacing, see _sync)."""
         if not self.ser:
             raise RuntimeError("DG535 not connected")
         self.ser.write((cmd + "\r").encode())
-        time.sleep(0.05)
+
+    def _sync(self, timeout: Optional[float] = None):
+        """
+        Wait until the Prologix adapter has sent everything written so far.
+
+        The adapter handles input in order, so its reply to "++addr" means
+        all earlier GPIB writes are done. Deferred to the end of a batch.
+
+        Raises:
+            TimeoutError: If the adapter does not answer within timeout
+                          (default: serial timeout). Nothing written since
+                          the last sync is known to have reached the DG535,
+                          so the shadow is cleared.
+        """
+        if self._batch is not None or not self.transport:
+            return
+        self.transport.clear()
+        self._write_raw("++addr")
+        if self.transport.readline(timeout or self.ser.timeout or 2.0) is None:
+            self._synced.clear()
+            raise TimeoutError("Prologix adapter did not answer (DG535 commands not confirmed)")
+
+    @contextmanager
+    def batch(self):
+        """
+        Collect GPIB commands and send them ';'-joined when the block ends.
+
+        Nested batch() blocks join the outer one. If the block raises,
+        nothing collected is sent.
+
+        A single shot (SS) is a barrier: the commands before it are sent
+        and synced first, then SS is sent on its own line and synced, so
+        the DG535 never fires before its configuration writes are done.
+        Raises TimeoutError if the adapter does not confirm a write.
+
+        Usage:
+            with dg.batch():
+                dg.configure_pulse_A(delay, width)
+                dg.set_single_shot()
+        """
+        if self._batch is not None:
+            yield
+            return
+
+        self._batch = []
+        try:
+            yield
+        except BaseException:
+            # Shadow entries recorded in the block were never sent
+            self._batch = None
+            self._synced.clear()
+            raise
+        commands, self._batch = self._batch, None
+
+        chunk = []
+        for cmd in commands:
+            if cmd == "SS":
+                if chunk:
+                    self._send_gpib(";".join(chunk))
+                    self._sync()
+                    chunk = []
+                self._send_gpib(cmd)
+                self._sync()
+                continue
+            if chunk and len(";".join(chunk + [cmd])) > self.MAX_BATCH_CHARS:
+                self._send_gpib(";".join(chunk))
+                chunk = []
+            chunk.append(cmd)
+        if chunk:
+            self._send_gpib(";".join(chunk))
+            self._sync()
 
     def _send_gpib(self, cmd: str):
         """
@@ -307,20 +411,22 @@ class DG535Controller:
         each character for some firmware versions. This implementation uses
         spaced format: "C L" instead of "CL".
         """
+        if self._batch is not None:
+            self._batch.append(cmd)
+            return
+
         # Insert spaces between characters as some firmware requires it
         spaced_cmd = " ".join(cmd)
         self._write_raw(spaced_cmd)
 
     def _query_gpib(self, cmd: str) -> str:
-        """Send query and read response."""
+        """Send query and return the reply line as soon as it arrives ("" on timeout)."""
+        if not self.transport:
+            return ""
+        self.transport.clear()
         self._send_gpib(cmd)
         self._write_raw("++read eoi")
-        time.sleep(0.1)
-
-        if self.ser:
-            response = self.ser.readline().decode(errors="ignore").strip()
-            return response
-        return ""
+        return self.transport.readline(self.ser.timeout or 2.0) or ""
 
     # =========================================================================
     # INITIALIZATION COMMANDS
@@ -338,11 +444,14 @@ class DG535Controller:
         self._send_gpib("CL")
         time.sleep(0.3)
         self.state = DG535State()
+        # CL puts delays and trigger mode at the DG535State defaults
+        self._synced = {("TM",)} | {("DT", ch) for ch in self.state.delays}
 
     def recall_defaults(self):
         """Recall factory default settings (RC 0)."""
         self._send_gpib("RC 0")
         time.sleep(0.2)
+        self._synced.clear()
         self.state = DG535State()
 
     # =========================================================================
@@ -410,7 +519,7 @@ class DG535Controller:
     # TRIGGER COMMANDS
     # =========================================================================
 
-    def set_trigger_mode(self, mode: TriggerMode):
+    def set_trigger_mode(self, mode: TriggerMode, force: bool = False) -> bool:
         """
         Set trigger mode (TM command).
 
@@ -420,9 +529,17 @@ class DG535Controller:
                 1 = External
                 2 = Single-Shot
                 3 = Burst
+            force: Send even if the shadow state already matches
+
+        Returns:
+            True if the command was sent
         """
+        if not force and ("TM",) in self._synced and self.state.trigger.mode == mode:
+            return False
         self._send_gpib(f"TM {int(mode)}")
         self.state.trigger.mode = mode
+        self._synced.add(("TM",))
+        return True
 
     def get_trigger_mode(self) -> TriggerMode:
         """Get current trigger mode."""
@@ -516,8 +633,12 @@ class DG535Controller:
         Fire single-shot trigger (SS command).
 
         Only works when trigger mode is set to Single-Shot (TM 2).
+        Returns once the adapter has put the command on the bus; raises
+        TimeoutError if the adapter does not confirm it. Inside batch()
+        it is sent after the batch's earlier commands are confirmed.
         """
         self._send_gpib("SS")
+        self._sync()
 
     def single_shot(self):
         """Alias for fire() - triggers a single timing cycle."""
@@ -527,7 +648,8 @@ class DG535Controller:
     # DELAY COMMANDS
     # =========================================================================
 
-    def set_delay(self, channel: int, reference: int, delay_sec: float):
+    def set_delay(self, channel: int, reference: int, delay_sec: float,
+                  force: bool = False) -> bool:
         """
         Set delay time for a channel (DT command).
 
@@ -535,17 +657,29 @@ class DG535Controller:
             channel: Channel to set (2=A, 3=B, 5=C, 6=D)
             reference: Reference channel (1=T0, 2=A, 3=B, 5=C, 6=D)
             delay_sec: Delay in seconds (0 to 999.999999999995)
+            force: Send even if the shadow state already matches
+
+        Returns:
+            True if the command was sent
 
         Examples:
             set_delay(Channel.A, Channel.T0, 1e-6)  # A = T0 + 1µs
             set_delay(Channel.B, Channel.A, 500e-9) # B = A + 500ns
         """
         delay_sec = max(self.MIN_DELAY, min(self.MAX_DELAY, delay_sec))
+        current = self.state.delays.get(channel)
+        if (not force and ("DT", channel) in self._synced and current is not None
+                and current.reference == reference
+                and f"{current.delay:.12E}" == f"{delay_sec:.12E}"):
+            return False
+
         self._send_gpib(f"DT {channel},{reference},{delay_sec:.12E}")
 
-        if channel in self.state.delays:
-            self.state.delays[channel].reference = reference
-            self.state.delays[channel].delay = delay_sec
+        if current is not None:
+            current.reference = reference
+            current.delay = delay_sec
+            self._synced.add(("DT", channel))
+        return True
 
     def get_delay(self, channel: int) -> Tuple[int, float]:
         """
@@ -708,32 +842,68 @@ class DG535Controller:
         location = max(0, min(9, location))
         self._send_gpib(f"RC {location}")
         time.sleep(0.2)
+        self._synced.clear()
 
     # =========================================================================
     # HIGH-LEVEL CONVENIENCE METHODS
     # =========================================================================
 
-    def configure_pulse_A(self, delay: float, width: float):
+    def configure_pulse_A(self, delay: float, width: float, force: bool = False) -> int:
         """
         Configure A-B as a pulse output.
 
         Sets A delay from T0, B delay from A (creating AB pulse).
+        Only the delays that changed are sent unless force=True.
 
         Args:
             delay: Pulse start time from T0 (seconds)
             width: Pulse width (seconds)
+
+        Returns:
+            Number of commands sent (0-2)
         """
-        self.set_delay(Channel.A, Channel.T0, delay)
-        self.set_delay(Channel.B, Channel.A, width)
+        with self.batch():
+            sent = self.set_delay(Channel.A, Channel.T0, delay, force)
+            sent += self.set_delay(Channel.B, Channel.A, width, force)
+        return sent
 
-    def configure_pulse_B(self, delay: float, width: float):
+    def configure_pulse_B(self, delay: float, width: float, force: bool = False) -> int:
         """Configure C-D as a pulse output (CD pulse)."""
-        self.set_delay(Channel.C, Channel.T0, delay)
-        self.set_delay(Channel.D, Channel.C, width)
+        with self.batch():
+            sent = self.set_delay(Channel.C, Channel.T0, delay, force)
+            sent += self.set_delay(Channel.D, Channel.C, width, force)
+        return sent
 
-    def set_single_shot(self):
+    def set_single_shot(self, force: bool = False) -> bool:
         """Set trigger mode to single-shot."""
-        self.set_trigger_mode(TriggerMode.SINGLE_SHOT)
+        return self.set_trigger_mode(TriggerMode.SINGLE_SHOT, force)
+
+    def resync(self, read_back: bool = False):
+        """
+        Drop the shadow state so the next setters write everything again.
+
+        Use after the front panel was touched or the instrument was
+        power-cycled. With read_back=True the delays and trigger mode are
+        queried instead and become the new shadow state.
+        """
+        self._synced.clear()
+        if not read_back:
+            return
+
+        # Only values that parse become known; the rest get rewritten
+        for ch in self.state.delays:
+            try:
+                ref, delay = self._query_gpib(f"DT {ch}").split(",")[:2]
+                self.state.delays[ch].reference = int(ref)
+                self.state.delays[ch].delay = float(delay)
+                self._synced.add(("DT", ch))
+            except ValueError:
+                pass
+        try:
+            self.state.trigger.mode = TriggerMode(int(self._query_gpib("TM")))
+            self._synced.add(("TM",))
+        except ValueError:
+            pass
 
     def set_internal_trigger(self, rate_hz: float = 1000.0):
         """Set to internal trigger mode with specified rate."""
@@ -744,34 +914,37 @@ class DG535Controller:
                              slope: TriggerSlope = TriggerSlope.RISING,
                              impedance: Impedance = Impedance.HIGH_Z):
         """Configure external trigger with all settings."""
-        self.set_trigger_mode(TriggerMode.EXTERNAL)
-        self.set_external_threshold(threshold)
-        self.set_external_slope(slope)
-        self.set_trigger_impedance(impedance)
+        with self.batch():
+            self.set_trigger_mode(TriggerMode.EXTERNAL)
+            self.set_external_threshold(threshold)
+            self.set_external_slope(slope)
+            self.set_trigger_impedance(impedance)
 
     def configure_ttl_output(self, channel: int, load_50ohm: bool = False,
                              inverted: bool = False):
         """Configure an output for TTL levels."""
-        self.set_output_mode(channel, OutputMode.TTL)
-        self.set_output_impedance(channel,
-                                  Impedance.OHM_50 if load_50ohm else Impedance.HIGH_Z)
-        self.set_output_polarity(channel,
-                                 Polarity.INVERTED if inverted else Polarity.NORMAL)
+        with self.batch():
+            self.set_output_mode(channel, OutputMode.TTL)
+            self.set_output_impedance(channel,
+                                      Impedance.OHM_50 if load_50ohm else Impedance.HIGH_Z)
+            self.set_output_polarity(channel,
+                                     Polarity.INVERTED if inverted else Polarity.NORMAL)
 
     def configure_var_output(self, channel: int, amplitude: float,
                              offset: float = 0.0, load_50ohm: bool = False):
         """Configure an output for variable levels."""
-        self.set_output_mode(channel, OutputMode.VAR)
-        self.set_output_impedance(channel,
-                                  Impedance.OHM_50 if load_50ohm else Impedance.HIGH_Z)
-        self.set_output_amplitude(channel, amplitude)
-        self.set_output_offset(channel, offset)
+        with self.batch():
+            self.set_output_mode(channel, OutputMode.VAR)
+            self.set_output_impedance(channel,
+                                      Impedance.OHM_50 if load_50ohm else Impedance.HIGH_Z)
+            self.set_output_amplitude(channel, amplitude)
+            self.set_output_offset(channel, offset)
 
     def arm_and_fire(self):
-        """Set to single-shot mode and fire."""
-        self.set_trigger_mode(TriggerMode.SINGLE_SHOT)
-        time.sleep(0.1)
-        self.fire()
+        """Set to single-shot mode, then fire once the mode change is confirmed."""
+        with self.batch():
+            self.set_trigger_mode(TriggerMode.SINGLE_SHOT)
+            self.fire()
 
     def get_state_snapshot(self) -> dict:
         """
@@ -4,17 +4,35 @@ Rigol DS7000/MSO7000 Series Oscilloscope Driver
 Based on Rigol DS7000-MSO7000 Programming Guide.
 
 This driver captures up to 4 channels of waveform data from a Rigol oscilloscope
-and returns properly scaled voltage/time arrays.
+and returns them as Waveform objects (raw ADC codes + preamble) that produce
+scaled voltage/time arrays on demand.
 """
 
-import pyvisa
 import numpy as np
 import time
 
+from instruments.visa_manager import get_session_pool
+from instruments.waveform import Waveform, SegmentedWaveform
+
 
 class RigolScope:
     """Driver for Rigol DS7000/MSO7000 series oscilloscopes."""
     
+    # Max points per :WAVeform:DATA? query in BYTE format (programming guide)
+    RAW_CHUNK_POINTS = 250000
+    
+    # Writes with these prefixes change acquisition/channel setup and
+    # invalidate the settings cache
+    SETTINGS_PREFIXES = (':CHAN', ':TIM', ':ACQ', ':WAV', ':AUT', '*RST', '*RCL')
+    
+    # Trigger wait: first status poll interval (the old fixed 100 ms poll),
+    # grows toward the latency target
+    MIN_POLL_INTERVAL = 0.1
+    # Upper bound for the latency target derived from the timebase
+    MAX_TRIGGER_LATENCY = 1.0
+    # Horizontal divisions on screen (acquisition time = 10 * s/div)
+    HORIZONTAL_DIVISIONS = 10
+    
     def __init__(self, resource_name: str = None):
         """
         Initialize connection to oscilloscope.
@@ -23,10 +41,38 @@ class RigolScope:
             resource_name: VISA resource string (e.g., 'USB0::0x1AB1::0x0514::DS7...::INSTR')
                           If None, will try to find first available Rigol scope.
         """
-        self.rm = pyvisa.ResourceManager()
         self.instr = None
         self.resource_name = resource_name
         
+        # Chunked RAW transfer: read memory in RAW_CHUNK_POINTS windows
+        # straight into one preallocated uint8 buffer
+        self.chunked_raw = True
+        self.chunk_points = self.RAW_CHUNK_POINTS
+        
+        # Optional progress callback: callback(channel, points_read, points_total)
+        self.progress_callback = None
+        
+        # Settings cache: skip redundant :WAVeform writes and reuse channel
+        # display state and memory depth between shots. Invalidated on
+        # reconnect, on settings writes through this driver, when the
+        # memory depth changes, or after settings_cache_ttl seconds.
+        # The preamble (scale/offset) is never cached: V/div, offset and
+        # timebase can change on the front panel without any depth change.
+        # Call invalidate_settings_cache() after front-panel changes.
+        self.settings_cache_enabled = True
+        self.settings_cache_ttl = None  # seconds, None = until invalidated
+        self.invalidate_settings_cache()
+        
+        # Worst-case delay between acquisition complete and wait_for_trigger()
+        # returning, in seconds. Lower = faster captures, busier USB link.
+        # None = the acquisition time from the timebase (see trigger_wait_latency)
+        self.trigger_latency = None
+        
+    @property
+    def rm(self):
+        """Shared VISA resource manager (pyvisa is loaded on first use)"""
+        return get_session_pool().rm
+        
     def connect(self, resource_name: str = None):
         """
         Connect to the oscilloscope.
@@ -37,31 +83,37 @@ class RigolScope:
         if resource_name:
             self.resource_name = resource_name
             
+        pool = get_session_pool()
         if not self.resource_name:
-            # Try to find a Rigol scope
-            resources = self.rm.list_resources()
-            for res in resources:
-                if '1AB1' in res:  # Rigol vendor ID
-                    self.resource_name = res
-                    break
+            # Try to find a Rigol scope (cached discovery, scans if empty)
+            self.resource_name = pool.find('1AB1')  # Rigol vendor ID
                     
         if not self.resource_name:
             raise RuntimeError("No Rigol oscilloscope found")
             
-        self.instr = self.rm.open_resource(self.resource_name)
-        self.instr.timeout = 30000  # 30 second timeout for large transfers
-        self.instr.read_termination = '\n'
-        self.instr.write_termination = '\n'
+        idn = []
+        
+        def setup(instr):
+            instr.timeout = 30000  # 30 second timeout for large transfers
+            instr.read_termination = '\n'
+            instr.write_termination = '\n'
+            # Verify connection
+            idn.append(instr.query('*IDN?'))
+            
+        # Uses the cached address for this scope's USB serial; re-scans
+        # only if that fails (e.g. re-enumerated after a cable bump)
+        self.instr = pool.open(self.resource_name, setup=setup)
+        self.resource_name = self.instr.resource_name
+        print(f"Connected to: {idn[-1].strip()}")
         
-        # Verify connection
-        idn = self.instr.query('*IDN?')
-        print(f"Connected to: {idn.strip()}")
+        self.invalidate_settings_cache()
         
     def disconnect(self):
         """Disconnect from the oscilloscope."""
         if self.instr:
-            self.instr.close()
+            get_session_pool().close(self.instr)
             self.instr = None
+        self.invalidate_settings_cache()
             
     def is_connected(self) -> bool:
         """Check if connected to oscilloscope."""
@@ -70,6 +122,62 @@ class RigolScope:
     def _write(self, cmd: str):
         """Send command to oscilloscope."""
         self.instr.write(cmd)
+        if cmd.upper().startswith(self.SETTINGS_PREFIXES):
+            self.invalidate_settings_cache()
+            
+    def _write_setting(self, header: str, value):
+        """
+        Send '<header> <value>' unless the cache says it is already set.
+        
+        Used for the per-read :WAVeform setup commands.
+        """
+        key = header.upper()
+        if self._cache_valid() and self._settings_cache.get(key) == value:
+            return
+        self.instr.write(f'{header} {value}')
+        self._settings_cache[key] = value
+        
+    # ==================== SETTINGS CACHE ====================
+    
+    def invalidate_settings_cache(self):
+        """Forget all cached settings and display state."""
+        self._settings_cache = {}
+        self._display_cache = {}
+        self._memory_depth = None
+        self._acquisition_time = None
+        self._cache_time = time.time()
+        
+    def _cache_valid(self) -> bool:
+        """True if cached values may be reused."""
+        if not self.settings_cache_enabled:
+            return False
+        if self.settings_cache_ttl is not None:
+            if (time.time() - self._cache_time) > self.settings_cache_ttl:
+                self.invalidate_settings_cache()
+                return False
+        return True
+        
+    def check_settings_changed(self) -> bool:
+        """
+        Detect a settings change with one :ACQuire:MDEPth? round trip.
+        
+        Called once per shot. If the memory depth differs from the cached
+        value the whole cache is dropped. Scale/offset changes (V/div,
+        timebase) need no detection: the preamble is re-read every shot.
+        Other front-panel changes (e.g. a channel switched off) are not
+        seen here; call invalidate_settings_cache() or set
+        settings_cache_ttl for those.
+        
+        Returns:
+            True if a change was detected (cache invalidated)
+        """
+        previous = self._memory_depth
+        depth = self._get_memory_depth(default=None, use_cache=False)
+        changed = previous is not None and depth != previous
+        if changed:
+            self.invalidate_settings_cache()
+        self._memory_depth = depth
+        return changed
         
     def _query(self, cmd: str) -> str:
         """Query oscilloscope and return response."""
@@ -115,6 +223,91 @@ class RigolScope:
         
         return data
         
+    def _tmc_payload(self, raw: bytes) -> memoryview:
+        """
+        Return the data portion of a TMC block as a zero-copy view.
+        
+        Same format as _parse_tmc_data, but avoids copying the payload.
+        """
+        if raw[0:1] != b'#':
+            raise ValueError(f"Invalid TMC header, expected '#', got {raw[0:1]}")
+            
+        n_digits = int(raw[1:2])
+        data_length = int(raw[2:2+n_digits])
+        header_length = 2 + n_digits
+        
+        return memoryview(raw)[header_length:header_length + data_length]
+        
+    def _get_memory_depth(self, default: int = 0, use_cache: bool = True) -> int:
+        """
+        Get the acquisition memory depth in points (:ACQuire:MDEPth?).
+        
+        Args:
+            default: Value returned if the scope reports AUTO or an invalid value
+            use_cache: Reuse the depth seen by check_settings_changed()
+        """
+        if use_cache and self._cache_valid() and self._memory_depth is not None:
+            return self._memory_depth
+        try:
+            depth = int(float(self._query(':ACQuire:MDEPth?')))
+        except (ValueError, TypeError):
+            return default
+        if self.settings_cache_enabled:
+            self._memory_depth = depth
+        return depth
+            
+    def _read_codes_chunked(self, channel: int, points: int,
+                            progress_callback=None, out: np.ndarray = None) -> np.ndarray:
+        """
+        Read RAW memory in :WAVeform:STARt/STOP windows into one buffer.
+        
+        Source, mode and format must already be set. Each window is at most
+        chunk_points long, so no single transfer hits the instrument limit
+        or the VISA timeout at deep memory settings.
+        
+        Args:
+            channel: Channel number (only used for progress reporting)
+            points: Total number of points to read (from the preamble)
+            progress_callback: Optional callback(channel, points_read, points_total)
+            out: Optional preallocated uint8 buffer of length `points` to fill
+            
+        Returns:
+            uint8 numpy array of length `points` with raw ADC codes
+            (a view of `out` if given)
+        """
+        codes = np.empty(points, dtype=np.uint8) if out is None else out
+        chunk = max(1, int(self.chunk_points))
+        
+        old_term = self.instr.read_termination
+        self.instr.read_termination = None
+        try:
+            pos = 0
+            while pos < points:
+                n = min(chunk, points - pos)
+                
+                # STARt/STOP are 1-based and inclusive
+                self._write_setting(':WAVeform:STARt', pos + 1)
+                self._write_setting(':WAVeform:STOP', pos + n)
+                self.instr.write(':WAVeform:DATA?')
+                
+                payload = self._tmc_payload(self.instr.read_raw())
+                got = min(len(payload), n)
+                codes[pos:pos + got] = np.frombuffer(payload, dtype=np.uint8, count=got)
+                
+                if got == 0:
+                    # Scope returned nothing - stop instead of spinning
+                    codes = codes[:pos]
+                    break
+                    
+                pos += got
+                
+                if progress_callback:
+                    progress_callback(channel, pos, points)
+        finally:
+            self.instr.read_termination = old_term
+            
+        return codes
+        
     def get_trigger_status(self) -> str:
         """
         Query current trigger status.
@@ -150,9 +343,13 @@ class RigolScope:
         Returns:
             True if channel is displayed, False otherwise
         """
+        if self._cache_valid() and channel in self._display_cache:
+            return self._display_cache[channel]
         try:
             resp = self._query(f':CHANnel{channel}:DISPlay?')
-            return resp in ('1', 'ON')
+            displayed = resp in ('1', 'ON')
+            self._display_cache[channel] = displayed
+            return displayed
         except:
             return False
     
@@ -169,7 +366,29 @@ class RigolScope:
                 displayed.append(ch)
         return displayed
         
-    def wait_for_trigger(self, timeout: float = 10.0, poll_interval: float = 0.1) -> bool:
+    def trigger_wait_latency(self) -> float:
+        """
+        Default latency target for the trigger/recording waits.
+        
+        self.trigger_latency if set, otherwise the acquisition time
+        (HORIZONTAL_DIVISIONS * :TIMebase:MAIN:SCALe?) clamped to
+        [MIN_POLL_INTERVAL, MAX_TRIGGER_LATENCY]: polling much faster than
+        the scope can acquire only adds USB traffic. The timebase is
+        cached with the other settings.
+        """
+        if self.trigger_latency is not None:
+            return self.trigger_latency
+        if self._acquisition_time is None or not self._cache_valid():
+            try:
+                scale = float(self._query(':TIMebase:MAIN:SCALe?'))
+                self._acquisition_time = scale * self.HORIZONTAL_DIVISIONS
+            except (ValueError, TypeError):
+                self._acquisition_time = 0.0
+        return min(self.MAX_TRIGGER_LATENCY,
+                   max(self.MIN_POLL_INTERVAL, self._acquisition_time))
+        
+    def wait_for_trigger(self, timeout: float = 10.0, poll_interval: float = None,
+                         latency: float = None) -> bool:
         """
         Wait for the oscilloscope to trigger and stop.
         
@@ -179,26 +398,42 @@ class RigolScope:
             RUN   - Running (auto trigger mode acquiring)
             AUTO  - Auto triggered
             STOP  - Stopped
+        
+        By default the status is polled with an adaptive backoff: the first
+        polls are MIN_POLL_INTERVAL apart (the old fixed interval) and the
+        interval doubles up to the latency target, so a long wait costs at
+        most one query per `latency` seconds. The default target is the
+        acquisition time (see trigger_wait_latency()).
             
         Args:
             timeout: Maximum time to wait in seconds
-            poll_interval: Time between status checks in seconds
+            poll_interval: Fixed time between status checks in seconds
+                           (disables the adaptive backoff)
+            latency: Latency target in seconds (max poll interval),
+                     None for trigger_wait_latency()
             
         Returns:
             True if triggered successfully, False if timeout
         """
-        start_time = time.time()
+        if latency is None:
+            latency = self.trigger_wait_latency()
+        interval = poll_interval or min(self.MIN_POLL_INTERVAL, latency)
+        deadline = time.monotonic() + timeout
         
-        while (time.time() - start_time) < timeout:
+        while True:
             status = self.get_trigger_status()
             
             # STOP or TD means acquisition is complete and ready to read
             if status in ('STOP', 'TD'):
                 return True
-                
-            time.sleep(poll_interval)
             
-        return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+                
+            time.sleep(min(interval, remaining))
+            if poll_interval is None:
+                interval = min(interval * 2, latency)
         
     def _get_waveform_preamble(self) -> dict:
         """
@@ -215,11 +450,14 @@ class RigolScope:
             yincrement: voltage per LSB
             yorigin: vertical offset in ADC counts
             yreference: ADC reference value (128 for NORMAL mode)
+            
+        Always queried: the scale/offset fields follow front-panel V/div,
+        offset and timebase changes, which nothing else detects.
         """
         response = self._query(':WAVeform:PREamble?')
         parts = response.split(',')
         
-        return {
+        preamble = {
             'format': int(parts[0]),
             'type': int(parts[1]),
             'points': int(parts[2]),
@@ -232,7 +470,9 @@ class RigolScope:
             'yreference': float(parts[9]),
         }
         
-    def _read_channel_data(self, channel: int) -> tuple:
+        return preamble
+        
+    def _read_channel_data(self, channel: int) -> Waveform:
         """
         Read waveform data from a single channel.
         
@@ -240,17 +480,17 @@ class RigolScope:
             channel: Channel number (1-4)
             
         Returns:
-            Tuple of (time_array, voltage_array) as numpy arrays
+            Waveform (unpacks as (time_array, voltage_array))
         """
         # Set waveform source to the specified channel
-        self._write(f':WAVeform:SOURce CHANnel{channel}')
+        self._write_setting(':WAVeform:SOURce', f'CHANnel{channel}')
         
         # Set to NORMAL mode (read screen data) 
         # Use RAW mode if you need full memory depth
-        self._write(':WAVeform:MODE NORMal')
+        self._write_setting(':WAVeform:MODE', 'NORMal')
         
         # Set byte format for data transfer
-        self._write(':WAVeform:FORMat BYTE')
+        self._write_setting(':WAVeform:FORMat', 'BYTE')
         
         # Get the preamble with scaling factors
         preamble = self._get_waveform_preamble()
@@ -258,27 +498,12 @@ class RigolScope:
         # Read the waveform data
         raw_data = self._query_binary(':WAVeform:DATA?')
         
-        # Convert bytes to numpy array
-        raw_values = np.frombuffer(raw_data, dtype=np.uint8)
+        # Keep raw codes; voltage/time are computed on demand
+        # voltage = (raw_value - yreference - yorigin) * yincrement
+        # time = xorigin + index * xincrement
+        return Waveform(raw_data, preamble, channel)
         
-        # Convert to voltage using preamble parameters
-        # Formula: voltage = (raw_value - yreference - yorigin) * yincrement
-        yinc = preamble['yincrement']
-        yorig = preamble['yorigin']
-        yref = preamble['yreference']
-        
-        voltage = (raw_values.astype(float) - yref - yorig) * yinc
-        
-        # Generate time array
-        # Formula: time = xorigin + index * xincrement
-        xinc = preamble['xincrement']
-        xorig = preamble['xorigin']
-        
-        time_array = xorig + np.arange(len(voltage)) * xinc
-        
-        return time_array, voltage
-        
-    def _read_channel_data_raw(self, channel: int, start: int = 1, stop: int = None) -> tuple:
+    def _read_channel_data_raw(self, channel: int, start: int = 1, stop: int = None) -> Waveform:
         """
         Read waveform data from internal memory (RAW mode).
         
@@ -290,45 +515,42 @@ class RigolScope:
             stop: Stop point (if None, reads all available)
             
         Returns:
-            Tuple of (time_array, voltage_array) as numpy arrays
+            Waveform (unpacks as (time_array, voltage_array))
         """
         # Set waveform source to the specified channel
-        self._write(f':WAVeform:SOURce CHANnel{channel}')
+        self._write_setting(':WAVeform:SOURce', f'CHANnel{channel}')
         
         # Set to RAW mode (read internal memory)
-        self._write(':WAVeform:MODE RAW')
+        self._write_setting(':WAVeform:MODE', 'RAW')
         
         # Set byte format for data transfer
-        self._write(':WAVeform:FORMat BYTE')
-        
-        # Set start and stop points if specified
-        self._write(f':WAVeform:STARt {start}')
-        if stop is not None:
-            self._write(f':WAVeform:STOP {stop}')
+        self._write_setting(':WAVeform:FORMat', 'BYTE')
+        
+        if self.chunked_raw and start == 1 and stop is None:
+            # Full memory depth: read in windows into a preallocated buffer
+            self._write_setting(':WAVeform:STARt', 1)
+            preamble = self._get_waveform_preamble()
+            points = self._get_memory_depth(default=preamble['points'])
+            raw_values = self._read_codes_chunked(
+                channel, points, self.progress_callback
+            )
+        else:
+            # Set start and stop points if specified
+            self._write_setting(':WAVeform:STARt', start)
+            if stop is not None:
+                self._write_setting(':WAVeform:STOP', stop)
+                
+            # Get the preamble with scaling factors
+            preamble = self._get_waveform_preamble()
             
-        # Get the preamble with scaling factors
-        preamble = self._get_waveform_preamble()
-        
-        # Read the waveform data
-        raw_data = self._query_binary(':WAVeform:DATA?')
-        
-        # Convert bytes to numpy array
-        raw_values = np.frombuffer(raw_data, dtype=np.uint8)
-        
-        # Convert to voltage using preamble parameters
-        yinc = preamble['yincrement']
-        yorig = preamble['yorigin']
-        yref = preamble['yreference']
-        
-        voltage = (raw_values.astype(float) - yref - yorig) * yinc
-        
-        # Generate time array
-        xinc = preamble['xincrement']
-        xorig = preamble['xorigin']
-        
-        time_array = xorig + np.arange(len(voltage)) * xinc
+            # Read the waveform data
+            raw_data = self._query_binary(':WAVeform:DATA?')
+            
+            # Convert bytes to numpy array
+            raw_values = np.frombuffer(raw_data, dtype=np.uint8)
         
-        return time_array, voltage
+        # Keep raw codes (1 byte/sample); scaling is applied lazily
+        return Waveform(raw_values, preamble, channel)
         
     def capture_two_channels(self, ch1: int = 1, ch2: int = 2) -> tuple:
         """
@@ -342,15 +564,15 @@ class RigolScope:
             ch2: Second channel number (default: 2)
             
         Returns:
-            Tuple of ((t1, v1), (t2, v2)) where each is numpy arrays
+            Tuple of (wf1, wf2) Waveforms; each unpacks as (t, v)
         """
         # Read channel 1
-        t1, v1 = self._read_channel_data(ch1)
+        wf1 = self._read_channel_data(ch1)
         
         # Read channel 2
-        t2, v2 = self._read_channel_data(ch2)
+        wf2 = self._read_channel_data(ch2)
         
-        return (t1, v1), (t2, v2)
+        return wf1, wf2
     
     # def capture_four_channels(self, ch1: int = 1, ch2: int = 2, 
     #                            ch3: int = 3, ch4: int = 4) -> tuple:
@@ -420,7 +642,7 @@ class RigolScope:
         
         Reads the full memory depth (RAW mode) from all specified channels.
         The scope will be stopped before reading to ensure data stability.
-        If a channel is not displayed, returns empty arrays for that channel.
+        If a channel is not displayed, returns an empty Waveform for that channel.
         
         Args:
             ch1: First channel number (default: 1)
@@ -429,25 +651,28 @@ class RigolScope:
             ch4: Fourth channel number (default: 4)
             
         Returns:
-            Tuple of ((t1, v1), (t2, v2), (t3, v3), (t4, v4)) where each is numpy arrays
+            Tuple of 4 Waveforms; each unpacks as (t, v)
         """
         # Stop acquisition to ensure data is stable for RAW mode reading
         self.stop()
         
+        # One round trip to detect settings changes since the last shot
+        if self.settings_cache_enabled:
+            self.check_settings_changed()
+        
         results = []
         for ch in [ch1, ch2, ch3, ch4]:
             try:
                 # Check if channel is displayed before trying to read
                 if self.is_channel_displayed(ch):
-                    t, v = self._read_channel_data_raw(ch)
-                    results.append((t, v))
+                    results.append(self._read_channel_data_raw(ch))
                 else:
-                    # Channel not displayed, return empty arrays
-                    results.append((np.array([]), np.array([])))
+                    # Channel not displayed, return empty waveform
+                    results.append(Waveform.empty(ch))
             except Exception as e:
-                # If channel read fails, return empty arrays
+                # If channel read fails, return empty waveform
                 print(f"[RIGOL] Warning: Could not read channel {ch}: {e}")
-                results.append((np.array([]), np.array([])))
+                results.append(Waveform.empty(ch))
         
         return tuple(results)
     def capture_channels(self, channels: list = None) -> tuple:
@@ -461,7 +686,7 @@ class RigolScope:
             channels: List of channel numbers to capture (default: [1, 2, 3, 4])
             
         Returns:
-            Tuple of (t, v) pairs for each channel
+            Tuple of Waveforms, one per channel
         """
         if channels is None:
             channels = [1, 2, 3, 4]
@@ -469,22 +694,26 @@ class RigolScope:
         # Stop acquisition to ensure data is stable for RAW mode reading
         self.stop()
         
+        # One round trip to detect settings changes since the last shot
+        if self.settings_cache_enabled:
+            self.check_settings_changed()
+        
         results = []
         for ch in channels:
             try:
                 if self.is_channel_displayed(ch):
-                    t, v = self._read_channel_data_raw(ch)
-                    results.append((t, v))
+                    results.append(self._read_channel_data_raw(ch))
                 else:
-                    results.append((np.array([]), np.array([])))
+                    results.append(Waveform.empty(ch))
             except Exception as e:
                 print(f"[RIGOL] Warning: Could not read channel {ch}: {e}")
-                results.append((np.array([]), np.array([])))
+                results.append(Waveform.empty(ch))
         
         return tuple(results)
         
     def wait_and_capture(self, ch1: int = 1, ch2: int = 2,
-                         timeout: float = 300.0) -> tuple:
+                         timeout: float = 300.0, latency: float = None,
+                         arm: bool = True) -> tuple:
         """
         Arm single trigger, wait for acquisition, then capture two channels.
         
@@ -494,18 +723,21 @@ class RigolScope:
             ch1: First channel number (default: 1)
             ch2: Second channel number (default: 2)
             timeout: Maximum time to wait for trigger in seconds
+            latency: Trigger-wait latency target in seconds (see wait_for_trigger)
+            arm: If False, skip :SINGle (scope already armed by the caller)
             
         Returns:
-            Tuple of ((t1, v1), (t2, v2)) where each is numpy arrays
+            Tuple of (wf1, wf2) Waveforms; each unpacks as (t, v)
             
         Raises:
             TimeoutError: If trigger doesn't occur within timeout
         """
         # Arm single trigger
-        self.single()
+        if arm:
+            self.single()
         
         # Wait for trigger and acquisition to complete
-        if not self.wait_for_trigger(timeout=timeout):
+        if not self.wait_for_trigger(timeout=timeout, latency=latency):
             raise TimeoutError(f"Trigger timeout after {timeout} seconds")
             
         # Capture both channels
@@ -513,29 +745,201 @@ class RigolScope:
     
     def wait_and_capture_four(self, ch1: int = 1, ch2: int = 2,
                                ch3: int = 3, ch4: int = 4,
-                               timeout: float = 300.0) -> tuple:
+                               timeout: float = 300.0, latency: float = None,
+                               arm: bool = True) -> tuple:
         """
         Arm single trigger, wait for acquisition, then capture four channels.
         
         Args:
             ch1-ch4: Channel numbers (default: 1, 2, 3, 4)
             timeout: Maximum time to wait for trigger in seconds
+            latency: Trigger-wait latency target in seconds (see wait_for_trigger)
+            arm: If False, skip :SINGle (scope already armed by the caller)
             
         Returns:
-            Tuple of ((t1, v1), (t2, v2), (t3, v3), (t4, v4)) where each is numpy arrays
+            Tuple of 4 Waveforms; each unpacks as (t, v)
             
         Raises:
             TimeoutError: If trigger doesn't occur within timeout
         """
         # Arm single trigger
-        self.single()
+        if arm:
+            self.single()
         
         # Wait for trigger and acquisition to complete
-        if not self.wait_for_trigger(timeout=timeout):
+        if not self.wait_for_trigger(timeout=timeout, latency=latency):
             raise TimeoutError(f"Trigger timeout after {timeout} seconds")
             
         # Capture all four channels
         return self.capture_four_channels(ch1, ch2, ch3, ch4)
+        
+    # ==================== SEGMENTED ACQUISITION ====================
+    #
+    # Waveform recording (:RECord:WRECord) stores one frame per trigger in
+    # segmented memory, so a BNC575 burst is captured with no transfer gaps
+    # between pulses. The frames are read back after the burst with
+    # :RECord:WREPlay:FCURrent selecting the frame for :WAVeform:DATA?.
+    
+    def get_max_segments(self) -> int:
+        """Maximum number of frames at the current memory depth (:RECord:WRECord:FMAX?)."""
+        return int(float(self._query(':RECord:WRECord:FMAX?')))
+        
+    def configure_segments(self, segments: int, interval: float = None):
+        """
+        Enable waveform recording of `segments` frames.
+        
+        Args:
+            segments: Number of frames (one per trigger)
+            interval: Minimum time between recorded frames in seconds,
+                      None to leave the scope setting unchanged
+                      
+        Raises:
+            ValueError: If segments exceeds get_max_segments()
+        """
+        self._write(':RECord:WRECord:ENABle ON')
+        max_segments = self.get_max_segments()
+        if not 1 <= segments <= max_segments:
+            raise ValueError(f"segments must be 1..{max_segments}, got {segments}")
+        self._write(f':RECord:WRECord:FRAMes {int(segments)}')
+        if interval is not None:
+            self._write(f':RECord:WRECord:INTerval {interval}')
+        # Recording can change memory depth and preambles
+        self.invalidate_settings_cache()
+        
+    def disable_segments(self):
+        """Turn waveform recording off (back to single acquisitions)."""
+        self._write(':RECord:WRECord:ENABle OFF')
+        self.invalidate_settings_cache()
+        
+    def arm_segments(self):
+        """Start acquiring and recording; recording stops after the last frame."""
+        self._write(':RUN')
+        self._write(':RECord:WRECord:OPERate RUN')
+        
+    def wait_for_segments(self, timeout: float = 10.0, latency: float = None) -> bool:
+        """
+        Wait until recording has stopped (all frames captured).
+        
+        Polls :RECord:WRECord:OPERate? with the same adaptive backoff as
+        wait_for_trigger().
+        
+        Returns:
+            True when recording finished, False on timeout
+        """
+        if latency is None:
+            latency = self.trigger_wait_latency()
+        interval = min(self.MIN_POLL_INTERVAL, latency)
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            if self._query(':RECord:WRECord:OPERate?').upper().startswith('STOP'):
+                return True
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+                
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, latency)
+            
+    def read_segments(self, channels=(1,), segments: int = None,
+                      period: float = None) -> dict:
+        """
+        Read recorded frames into one (segments, points) array per channel.
+        
+        Frames are read back to back into preallocated arrays; per frame
+        only :RECord:WREPlay:FCURrent changes, all :WAVeform settings and
+        the preamble are reused from the first frame. The DS7000 has no
+        multi-frame :WAVeform transfer (:WAVeform:DATA? always returns the
+        current replay frame), so this is one data query per frame and
+        channel rather than one bulk read.
+        
+        Segment times are nominal (SegmentedWaveform.nominal_times): segment
+        i is at i * period. The DS7000 does not report per-frame trigger
+        times over SCPI, so pass the burst period when the trigger rate is
+        known (e.g. the BNC575 burst frequency); otherwise the recording
+        interval is used.
+        
+        Args:
+            channels: Channel numbers to read
+            segments: Frames to read (default: the configured frame count)
+            period: Seconds between segments, None for the recording interval
+            
+        Returns:
+            Dict of channel -> SegmentedWaveform
+            
+        Raises:
+            RuntimeError: If a frame returns fewer points than the memory
+                          depth (no padding with fake samples)
+        """
+        self.stop()
+        
+        if segments is None:
+            segments = int(float(self._query(':RECord:WRECord:FRAMes?')))
+        if period is None:
+            period = float(self._query(':RECord:WRECord:INTerval?'))
+        nominal_times = np.arange(segments, dtype=np.float64) * period
+        
+        self._write_setting(':WAVeform:MODE', 'RAW')
+        self._write_setting(':WAVeform:FORMat', 'BYTE')
+        self._write_setting(':WAVeform:STARt', 1)
+        
+        preambles = {}
+        buffers = {}
+        for ch in channels:
+            self._write_setting(':WAVeform:SOURce', f'CHANnel{ch}')
+            preambles[ch] = self._get_waveform_preamble()
+            points = self._get_memory_depth(default=preambles[ch]['points'])
+            buffers[ch] = np.empty((segments, points), dtype=np.uint8)
+            
+        for frame in range(segments):
+            # Frames are numbered from 1
+            self.instr.write(f':RECord:WREPlay:FCURrent {frame + 1}')
+            for ch in channels:
+                self._write_setting(':WAVeform:SOURce', f'CHANnel{ch}')
+                row = buffers[ch][frame]
+                got = len(self._read_codes_chunked(ch, len(row), out=row))
+                if got < len(row):
+                    raise RuntimeError(f"Short read on CH{ch} frame {frame + 1}: "
+                                       f"{got} of {len(row)} points")
+                if self.progress_callback:
+                    self.progress_callback(ch, (frame + 1) * len(row), segments * len(row))
+                
+        return {ch: SegmentedWaveform(buffers[ch], nominal_times, preambles[ch], ch)
+                for ch in channels}
+        
+    def acquire_segments(self, channels=(1,), segments: int = 10,
+                         timeout: float = 60.0, latency: float = None,
+                         period: float = None, interval: float = None) -> dict:
+        """
+        Record a burst of `segments` triggers and read it back.
+        
+        Configure the scope, arm once, wait for all frames, then read them
+        (see read_segments). Recording is left enabled for the next burst;
+        call disable_segments() to go back to single acquisitions.
+        
+        Args:
+            channels: Channel numbers to read
+            segments: Number of frames (one per trigger)
+            timeout: Maximum time to wait for all frames in seconds
+            latency: Wait latency target in seconds (see wait_for_trigger)
+            period: Seconds between segments for nominal_times
+            interval: Minimum recording interval (see configure_segments)
+            
+        Returns:
+            Dict of channel -> SegmentedWaveform
+            
+        Raises:
+            TimeoutError: If the frames are not all recorded within timeout
+        """
+        self.configure_segments(segments, interval)
+        self.arm_segments()
+        
+        if not self.wait_for_segments(timeout=timeout, latency=latency):
+            self._write(':RECord:WRECord:OPERate STOP')
+            raise TimeoutError(f"Segmented acquisition timeout after {timeout} seconds")
+            
+        return self.read_segments(channels, segments, period)
 
 
 # Convenience function for quick testing
@@ -0,0 +1,109 @@
+# instruments/serial_transport.py
+"""
+Line-oriented serial transport with a background reader thread.
+
+The reader thread blocks in serial.read() and pushes every terminated
+line into a queue as soon as it arrives, so a driver waiting for a reply
+wakes up when the instrument answers instead of on a polling/sleep tick.
+
+Usage:
+    transport = SerialTransport(ser)
+    transport.clear()                   # drop stale replies
+    transport.write(b":PULSE1:WIDT?\\n")
+    reply = transport.readline(timeout=1.0)   # None on timeout
+    transport.close()                   # stops the thread, not the port
+"""
+
+import queue
+import threading
+import time
+from typing import Optional
+
+
+class SerialTransport:
+    """
+    Owns the read side of an open serial.Serial.
+
+    Lines are split on CR and/or LF; empty lines are dropped. Writes go
+    straight to the port from the caller's thread.
+    """
+
+    TERMINATORS = (0x0A, 0x0D)
+
+    def __init__(self, ser, encoding: str = 'ascii'):
+        """
+        Args:
+            ser: Open serial.Serial (its timeout bounds how long close() waits)
+            encoding: Used to decode received lines
+        """
+        self.ser = ser
+        self.encoding = encoding
+        self._lines = queue.Queue()
+        self._buf = bytearray()
+        self._buf_lock = threading.Lock()
+        self._running = True
+        self._thread = threading.Thread(target=self._reader, name="SerialTransport", daemon=True)
+        self._thread.start()
+
+    def _reader(self):
+        while self._running:
+            try:
+                chunk = self.ser.read(self.ser.in_waiting or 1)
+            except Exception:
+                # Port closed or device gone
+                break
+            if not chunk:
+                continue
+            with self._buf_lock:
+                self._buf.extend(chunk)
+                self._split_lines()
+
+    def _split_lines(self):
+        start = 0
+        for i, b in enumerate(self._buf):
+            if b in self.TERMINATORS:
+                if i > start:
+                    line = self._buf[start:i].decode(self.encoding, errors='ignore').strip()
+                    if line:
+                        self._lines.put(line)
+                start = i + 1
+        del self._buf[:start]
+
+    @property
+    def alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def write(self, data: bytes):
+        self.ser.write(data)
+        self.ser.flush()
+
+    def readline(self, timeout: float) -> Optional[str]:
+        """Next received line, or None if nothing arrives within timeout (s)."""
+        try:
+            return self._lines.get(timeout=max(0.0, timeout))
+        except queue.Empty:
+            return None
+
+    def readline_until(self, deadline: float) -> Optional[str]:
+        """readline() with an absolute time.time() deadline."""
+        return self.readline(deadline - time.time())
+
+    def clear(self):
+        """Discard received lines and any partial line (replaces reset_input_buffer)."""
+        with self._buf_lock:
+            self._buf.clear()
+            while True:
+                try:
+                    self._lines.get_nowait()
+                except queue.Empty:
+                    break
+
+    def close(self):
+        """Stop the reader thread (the port itself is closed by the driver)."""
+        self._running = False
+        try:
+            self.ser.cancel_read()
+        except Exception:
+            pass
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
@@ -0,0 +1,217 @@
+# instruments/visa_manager.py
+"""
+Process-wide VISA session pool.
+
+Opening a ResourceManager loads the VISA library and starts a session,
+which is slow and only needs to happen once. pyvisa itself is imported
+on first use, so GUI startup does not pay for it before a scope is
+actually connected.
+
+Discovery (list_resources) can take seconds on USB, so the pool keeps a
+cache of USB serial number -> resource string. It is seeded from the
+saved Rigol*_VISA entries and updated on every successful open. A
+re-scan happens only when opening the cached address fails, e.g. after
+a cable bump re-enumerates the scope under a new address.
+
+Usage:
+    pool = get_session_pool()
+    pool.seed(["USB0::0x1AB1::0x0514::DS7A232900210::0::INSTR"])
+    instr = pool.open("USB0::0x1AB1::0x0514::DS7A232900210::0::INSTR",
+                      setup=lambda instr: instr.query("*IDN?"))
+    ...
+    pool.close(instr)
+"""
+
+import threading
+from typing import Callable, Iterable, Optional
+
+
+def usb_serial(resource_name: str) -> Optional[str]:
+    """
+    Serial number field of a USB VISA resource string.
+
+    'USB0::0x1AB1::0x0514::DS7A232900210::0::INSTR' -> 'DS7A232900210'
+
+    Returns:
+        The serial, or None for non-USB resources
+    """
+    if not resource_name:
+        return None
+    parts = resource_name.split('::')
+    if not parts[0].upper().startswith('USB') or len(parts) < 4:
+        return None
+    return parts[3]
+
+
+def usb_vendor(resource_name: str) -> Optional[str]:
+    """Vendor ID of a USB VISA resource string ('1AB1' for Rigol), upper case"""
+    if usb_serial(resource_name) is None:
+        return None
+    return resource_name.split('::')[1].upper().replace('0X', '')
+
+
+class VisaSessionPool:
+    """
+    Shared ResourceManager, open sessions and USB discovery cache.
+
+    Thread-safe: scopes connect from parallel worker threads.
+    """
+
+    def __init__(self):
+        self._rm = None
+        self._lock = threading.RLock()
+        self._resources = {}    # USB serial -> resource string
+        self._sessions = {}     # USB serial (or resource string) -> open instrument
+
+    @property
+    def rm(self):
+        """Shared pyvisa.ResourceManager, created (and pyvisa imported) on first use"""
+        with self._lock:
+            if self._rm is None:
+                import pyvisa
+                self._rm = pyvisa.ResourceManager()
+            return self._rm
+
+    @staticmethod
+    def _key(resource_name: str) -> str:
+        return usb_serial(resource_name) or resource_name
+
+    # ------------------------------------------------------------------
+    # Discovery cache
+    # ------------------------------------------------------------------
+    def seed(self, resource_names: Iterable[str]):
+        """Add known resource strings to the cache (no VISA I/O)"""
+        with self._lock:
+            for name in resource_names:
+                serial = usb_serial(name)
+                if serial:
+                    self._resources.setdefault(serial, name)
+
+    def rescan(self) -> list:
+        """
+        Run list_resources() and rebuild the cache from what is on the bus
+        (devices that were not found are forgotten).
+
+        Returns:
+            All resource strings found
+        """
+        found = list(self.rm.list_resources())
+        with self._lock:
+            self._resources = {usb_serial(name): name for name in found
+                               if usb_serial(name)}
+        return found
+
+    def resolve(self, resource_name: str) -> str:
+        """Current cached address for resource_name's USB serial (no VISA I/O)"""
+        with self._lock:
+            return self._resources.get(usb_serial(resource_name), resource_name)
+
+    def find(self, vendor: str) -> Optional[str]:
+        """
+        First resource of a USB vendor (e.g. '1AB1'), from the cache if any,
+        otherwise from a scan.
+        """
+        vendor = vendor.upper()
+        with self._lock:
+            for name in self._resources.values():
+                if usb_vendor(name) == vendor:
+                    return name
+        for name in self.rescan():
+            if vendor in name.upper():
+                return name
+        return None
+
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+    def open(self, resource_name: str, setup: Callable = None):
+        """
+        Open a session at the cached address, re-scanning once on failure.
+
+        Any session the pool still holds for the same device (e.g. a dead
+        handle from before a cable bump) is closed first.
+
+        Args:
+            resource_name: VISA resource string (its USB serial is the cache key)
+            setup: Optional setup(instr) run after opening (attributes, *IDN?);
+                   an exception here counts as a failed open
+
+        Returns:
+            The open pyvisa resource; instr.resource_name is the address used
+        """
+        key = self._key(resource_name)
+        self._drop(key)
+
+        address = self.resolve(resource_name)
+        try:
+            instr = self._open_at(address, setup)
+        except Exception as first_error:
+            serial = usb_serial(resource_name)
+            if serial is None:
+                raise
+            found = [name for name in self.rescan() if usb_serial(name) == serial]
+            if not found:
+                raise RuntimeError(f"VISA device {serial} not found") from first_error
+            address = found[0]
+            instr = self._open_at(address, setup)
+
+        with self._lock:
+            serial = usb_serial(address)
+            if serial:
+                self._resources[serial] = address
+            self._sessions[key] = instr
+        return instr
+
+    def _open_at(self, address: str, setup: Optional[Callable]):
+        instr = self.rm.open_resource(address)
+        try:
+            if setup is not None:
+                setup(instr)
+        except Exception:
+            try:
+                instr.close()
+            except Exception:
+                pass
+            raise
+        return instr
+
+    def close(self, instr):
+        """Close a session opened by open()"""
+        with self._lock:
+            for key, session in list(self._sessions.items()):
+                if session is instr:
+                    del self._sessions[key]
+        instr.close()
+
+    def _drop(self, key: str):
+        with self._lock:
+            stale = self._sessions.pop(key, None)
+        if stale is not None:
+            try:
+                stale.close()
+            except Exception:
+                pass
+
+    def close_all(self):
+        """Close every open session (the ResourceManager stays open)"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for instr in sessions:
+            try:
+                instr.close()
+            except Exception:
+                pass
+
+
+_pool = VisaSessionPool()
+
+
+def get_session_pool() -> VisaSessionPool:
+    """The process-wide VisaSessionPool"""
+    return _pool
+
+
+def get_resource_manager():
+    """Shared pyvisa.ResourceManager, created (and pyvisa imported) on first call"""
+    return _pool.rm
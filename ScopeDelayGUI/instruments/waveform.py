@@ -0,0 +1,202 @@
+"""
+Compact waveform container for Rigol captures.
+
+Stores the raw uint8 ADC codes plus the preamble scaling factors and
+produces voltage/time arrays on demand (whole record or a slice).
+One byte per sample instead of 16 for a float64 time + voltage pair.
+"""
+
+import numpy as np
+
+
+class Waveform:
+    """
+    Raw ADC codes + preamble for one channel.
+
+    Scaling (per the DS7000 programming guide):
+        voltage = (code - yreference - yorigin) * yincrement
+        time    = xorigin + index * xincrement
+
+    For backward compatibility a Waveform unpacks like the old (t, v)
+    tuple:  t, v = waveform
+    """
+
+    __slots__ = ('codes', 'xincrement', 'xorigin', 'xreference',
+                 'yincrement', 'yorigin', 'yreference', 'channel', 'preamble')
+
+    def __init__(self, codes, preamble: dict = None, channel: int = 0):
+        """
+        Args:
+            codes: uint8 array (or bytes) of raw ADC codes
+            preamble: Dict from RigolScope._get_waveform_preamble()
+            channel: Source channel number (1-4), 0 if unknown
+        """
+        preamble = preamble or {}
+        if isinstance(codes, (bytes, bytearray, memoryview)):
+            codes = np.frombuffer(codes, dtype=np.uint8)
+        self.codes = np.asarray(codes, dtype=np.uint8)
+        self.xincrement = float(preamble.get('xincrement', 1.0))
+        self.xorigin = float(preamble.get('xorigin', 0.0))
+        self.xreference = float(preamble.get('xreference', 0.0))
+        self.yincrement = float(preamble.get('yincrement', 1.0))
+        self.yorigin = float(preamble.get('yorigin', 0.0))
+        self.yreference = float(preamble.get('yreference', 0.0))
+        self.channel = channel
+        self.preamble = dict(preamble)
+
+    @classmethod
+    def empty(cls, channel: int = 0) -> 'Waveform':
+        """Return a zero-length waveform (channel not displayed / failed)."""
+        return cls(np.empty(0, dtype=np.uint8), channel=channel)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self):
+        # Allows: t, v = waveform
+        yield self.time()
+        yield self.voltage()
+
+    def __repr__(self) -> str:
+        return f"Waveform(channel={self.channel}, points={len(self)})"
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the raw codes."""
+        return self.codes.nbytes
+
+    def _slice(self, start: int, stop: int):
+        n = len(self.codes)
+        start, stop, _ = slice(start, stop).indices(n)
+        return start, max(start, stop)
+
+    def voltage(self, start: int = 0, stop: int = None, dtype=np.float64) -> np.ndarray:
+        """
+        Scaled voltage for samples [start, stop).
+
+        Args:
+            start: First sample index (0-based)
+            stop: End index (exclusive), None for end of record
+            dtype: Output dtype (float32 halves memory for plotting)
+        """
+        start, stop = self._slice(start, stop)
+        out = self.codes[start:stop].astype(dtype)
+        out -= self.yreference + self.yorigin
+        out *= self.yincrement
+        return out
+
+    def time(self, start: int = 0, stop: int = None, dtype=np.float64) -> np.ndarray:
+        """
+        Time axis for samples [start, stop).
+
+        Args:
+            start: First sample index (0-based)
+            stop: End index (exclusive), None for end of record
+            dtype: Output dtype
+        """
+        start, stop = self._slice(start, stop)
+        out = np.arange(start, stop, dtype=dtype)
+        out *= self.xincrement
+        out += self.xorigin
+        return out
+
+    def time_at(self, index: int) -> float:
+        """Time of a single sample index."""
+        return self.xorigin + index * self.xincrement
+
+    def index_at(self, t: float) -> int:
+        """Nearest sample index for a time value (clamped to the record)."""
+        if len(self.codes) == 0 or self.xincrement == 0:
+            return 0
+        i = int(round((t - self.xorigin) / self.xincrement))
+        return max(0, min(len(self.codes) - 1, i))
+
+
+class SegmentedWaveform:
+    """
+    Raw ADC codes for N acquisitions of one channel (segmented memory).
+
+    codes is a (segments, points) uint8 array; all segments share one
+    preamble (same settings for the whole burst) and therefore one time
+    axis. nominal_times[i] is the expected start of segment i in seconds,
+    relative to segment 0 (i * trigger period); it is not a measured
+    trigger time.
+    """
+
+    __slots__ = ('codes', 'nominal_times', 'preamble', 'channel')
+
+    def __init__(self, codes, nominal_times=None, preamble: dict = None, channel: int = 0):
+        """
+        Args:
+            codes: (segments, points) uint8 array of raw ADC codes
+            nominal_times: Expected per-segment times in seconds (default: all zero)
+            preamble: Dict from RigolScope._get_waveform_preamble()
+            channel: Source channel number (1-4), 0 if unknown
+        """
+        self.codes = np.asarray(codes, dtype=np.uint8)
+        if nominal_times is None:
+            nominal_times = np.zeros(len(self.codes))
+        self.nominal_times = np.asarray(nominal_times, dtype=np.float64)
+        self.preamble = dict(preamble or {})
+        self.channel = channel
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index) -> Waveform:
+        return self.segment(index)
+
+    def __repr__(self) -> str:
+        segments, points = self.codes.shape
+        return f"SegmentedWaveform(channel={self.channel}, segments={segments}, points={points})"
+
+    @property
+    def points(self) -> int:
+        """Samples per segment."""
+        return self.codes.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the raw codes."""
+        return self.codes.nbytes
+
+    def segment(self, index: int) -> Waveform:
+        """One segment as a Waveform (shares the codes, no copy)."""
+        return Waveform(self.codes[index], self.preamble, self.channel)
+
+    def voltage(self, dtype=np.float64) -> np.ndarray:
+        """Scaled voltage for all segments, shape (segments, points)."""
+        out = self.codes.astype(dtype)
+        out -= self.preamble.get('yreference', 0.0) + self.preamble.get('yorigin', 0.0)
+        out *= self.preamble.get('yincrement', 1.0)
+        return out
+
+    def time(self, dtype=np.float64) -> np.ndarray:
+        """Time axis shared by every segment, length points."""
+        out = np.arange(self.points, dtype=dtype)
+        out *= self.preamble.get('xincrement', 1.0)
+        out += self.preamble.get('xorigin', 0.0)
+        return out
+
+
+def as_time_voltage(channel_data, dtype=np.float64) -> tuple:
+    """
+    Return (time, voltage) arrays for a Waveform or an old-style (t, v) tuple.
+
+    Lets plotting/export code accept either representation.
+    """
+    if isinstance(channel_data, Waveform):
+        return channel_data.time(dtype=dtype), channel_data.voltage(dtype=dtype)
+    if channel_data is None:
+        return np.array([]), np.array([])
+    t, v = channel_data
+    return np.asarray(t), np.asarray(v)
+
+
+def channel_points(channel_data) -> int:
+    """Number of samples in a Waveform or an old-style (t, v) tuple."""
+    if isinstance(channel_data, Waveform):
+        return len(channel_data)
+    if channel_data is None:
+        return 0
+    return len(channel_data[0])
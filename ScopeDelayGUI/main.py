@@ -1,8 +1,11 @@
+from utils.startup_timer import startup   # first: starts the startup clock
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QFont
 from gui.main_window import ScopeDelayMainWindow
 import sys
 
+startup.mark("imports")
+
 
 
 if __name__ == "__main__":
@@ -19,6 +22,7 @@ if __name__ == "__main__":
             color: black;
         }
     """)
+    startup.mark("QApplication")
 
     window = ScopeDelayMainWindow()
     window.show()
@@ -0,0 +1,69 @@
+# tests/test_lod_curve.py
+import numpy as np
+import pytest
+
+pytest.importorskip("pyqtgraph")
+
+from gui.lod_curve import MinMaxPyramid
+
+
+def test_small_record_has_no_levels():
+    x = np.arange(100.0)
+    pyramid = MinMaxPyramid(x, np.sin(x))
+    assert pyramid.levels == []
+    xs, ys = pyramid.render(0, 99, 800)
+    np.testing.assert_array_equal(xs, x)
+
+
+def test_empty_record():
+    pyramid = MinMaxPyramid(np.empty(0), np.empty(0))
+    assert len(pyramid) == 0
+    assert pyramid.bounds(0) == (None, None)
+    xs, ys = pyramid.render(0, 1, 800)
+    assert len(xs) == len(ys) == 0
+
+
+def test_levels_cover_record():
+    n = 100_003   # not a multiple of FACTOR
+    y = np.random.default_rng(0).normal(size=n)
+    pyramid = MinMaxPyramid(np.arange(n, dtype=float), y)
+    for size, mins, maxs in pyramid.levels:
+        assert len(mins) == len(maxs) == -(-n // size)
+        assert mins.min() == y.min()
+        assert maxs.max() == y.max()
+    assert len(pyramid.levels[-1][1]) <= MinMaxPyramid.MIN_BUCKETS
+
+
+def test_bounds():
+    x = np.linspace(-1.0, 1.0, 10_000)
+    y = np.cos(x * 20)
+    pyramid = MinMaxPyramid(x, y)
+    assert pyramid.bounds(0) == (-1.0, 1.0)
+    assert pyramid.bounds(1) == pytest.approx((y.min(), y.max()))
+
+
+def test_render_is_decimated_and_keeps_spikes():
+    n = 1_000_000
+    x = np.arange(n, dtype=float)
+    y = np.zeros(n)
+    y[123_457] = 5.0     # single-sample spike
+    y[876_543] = -3.0
+    pyramid = MinMaxPyramid(x, y)
+
+    xs, ys = pyramid.render(0, n - 1, 1000)
+    assert len(xs) == len(ys)
+    assert len(xs) <= 4 * 2 * 1000 + 4
+    assert ys.max() == 5.0
+    assert ys.min() == -3.0
+
+
+def test_render_zoomed_returns_raw_samples():
+    n = 1_000_000
+    x = np.arange(n, dtype=float)
+    y = np.sin(x / 1000)
+    pyramid = MinMaxPyramid(x, y)
+
+    xs, ys = pyramid.render(5000, 5500, 1000)
+    # One extra sample past each edge
+    np.testing.assert_array_equal(xs, x[4999:5502])
+    np.testing.assert_array_equal(ys, y[4999:5502])
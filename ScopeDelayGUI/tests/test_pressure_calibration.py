@@ -0,0 +1,96 @@
+# tests/test_pressure_calibration.py
+import json
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PyQt6")
+
+import utils.pressure_stream_worker as psw
+from utils.pressure_stream_worker import PressureCalibration
+
+FIELDS = ('RAW_TABLE', 'PSI_TABLE', 'CAL_N', 'RAW_SAT', 'PSI_SAT',
+          'RAW_MIN', 'PSI_MIN', 'MA_MIN', 'MA_MAX', 'MA_PSI_FULL')
+
+VALID = {
+    "raw_table": [1000, 2000, 3000],
+    "psi_table": [0.0, 10.0, 30.0],
+    "ma_psi_full": 100.0,
+}
+
+
+@pytest.fixture(autouse=True)
+def restore_calibration():
+    """load() changes class attributes; put the built-in tables back"""
+    saved = {name: getattr(PressureCalibration, name) for name in FIELDS}
+    yield
+    for name, value in saved.items():
+        setattr(PressureCalibration, name, value)
+
+
+def write_json(tmp_path, data, name="cal.json"):
+    path = tmp_path / name
+    path.write_text(data if isinstance(data, str) else json.dumps(data))
+    return str(path)
+
+
+def builtin():
+    return {name: getattr(PressureCalibration, name) for name in FIELDS}
+
+
+def test_load_valid(tmp_path):
+    PressureCalibration.load(write_json(tmp_path, VALID))
+    assert PressureCalibration.RAW_TABLE == [1000, 2000, 3000]
+    assert PressureCalibration.CAL_N == 3
+    # Optional limits default to the table ends
+    assert PressureCalibration.RAW_SAT == 3000
+    assert PressureCalibration.PSI_SAT == 30.0
+    assert PressureCalibration.RAW_MIN == 1000
+    assert PressureCalibration.MA_PSI_FULL == 100.0
+    assert PressureCalibration.raw_to_psi(1500) == pytest.approx(5.0)
+    assert PressureCalibration.mA_to_psi(12.0) == pytest.approx(50.0)
+
+
+@pytest.mark.parametrize("data, error", [
+    ("{not json", ValueError),
+    ({"raw_table": [1, 2]}, KeyError),
+    ({"raw_table": [1, 2, 3], "psi_table": [0.0, 1.0]}, ValueError),
+    ({"raw_table": [1], "psi_table": [0.0]}, ValueError),
+    ({"raw_table": [3, 2, 1], "psi_table": [0.0, 1.0, 2.0]}, ValueError),
+    ({"raw_table": ["a", "b"], "psi_table": [0.0, 1.0]}, ValueError),
+    ({"raw_table": 5, "psi_table": [0.0, 1.0]}, ValueError),
+    (dict(VALID, psi_sat="high"), ValueError),
+])
+def test_bad_file_keeps_current_tables(tmp_path, data, error):
+    before = builtin()
+    with pytest.raises(error):
+        PressureCalibration.load(write_json(tmp_path, data))
+    assert builtin() == before
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(OSError):
+        PressureCalibration.load(str(tmp_path / "missing.json"))
+
+
+def test_load_default_without_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(psw, "CALIBRATION_FILE", str(tmp_path / "missing.json"))
+    before = builtin()
+    assert PressureCalibration.load_default() is False
+    assert builtin() == before
+
+
+def test_load_default_with_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(psw, "CALIBRATION_FILE", write_json(tmp_path, VALID))
+    assert PressureCalibration.load_default() is True
+    assert PressureCalibration.RAW_TABLE == VALID["raw_table"]
+
+
+def test_array_matches_scalar():
+    raw = np.array([0, 10969, 11000, 20000, 33333, 45515, 45516, 60000])
+    expected = [PressureCalibration.raw_to_psi(int(r)) for r in raw]
+    np.testing.assert_allclose(PressureCalibration.raw_to_psi_array(raw), expected)
+
+    mA = np.array([0.0, 4.0, 7.5, 12.0, 20.0, 25.0])
+    expected = [PressureCalibration.mA_to_psi(float(m)) for m in mA]
+    np.testing.assert_allclose(PressureCalibration.mA_to_psi_array(mA), expected)
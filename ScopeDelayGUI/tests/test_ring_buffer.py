@@ -0,0 +1,77 @@
+# tests/test_ring_buffer.py
+import numpy as np
+import pytest
+
+from utils.ring_buffer import RingBuffer
+
+
+def test_empty():
+    buf = RingBuffer(4, width=2)
+    assert len(buf) == 0
+    assert buf.last() is None
+    assert buf.view().shape == (0, 2)
+    t, v = buf.columns()
+    assert len(t) == len(v) == 0
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        RingBuffer(0)
+
+
+def test_append_keeps_time_order_across_wrap():
+    buf = RingBuffer(3, width=2)
+    for i in range(7):
+        buf.append((i, 10 * i))
+    assert len(buf) == 3
+    np.testing.assert_array_equal(buf.view(), [[4, 40], [5, 50], [6, 60]])
+    np.testing.assert_array_equal(buf.last(), [6, 60])
+
+
+def test_scalar_rows():
+    buf = RingBuffer(3)
+    for i in range(5):
+        buf.append(i)
+    (values,) = buf.columns()
+    np.testing.assert_array_equal(values, [2, 3, 4])
+
+
+@pytest.mark.parametrize("first, second", [(2, 2), (2, 5), (0, 10), (5, 1)])
+def test_extend_matches_append(first, second):
+    rows = np.arange(2 * (first + second), dtype=float).reshape(-1, 2)
+    a = RingBuffer(4, width=2)
+    b = RingBuffer(4, width=2)
+    for row in rows:
+        a.append(row)
+    b.extend(rows[:first])
+    b.extend(rows[first:])
+    assert len(a) == len(b)
+    np.testing.assert_array_equal(a.view(), b.view())
+
+
+def test_extend_longer_than_capacity():
+    buf = RingBuffer(3)
+    buf.extend(np.arange(10))
+    np.testing.assert_array_equal(buf.columns()[0], [7, 8, 9])
+
+
+def test_columns_views_change_copies_do_not():
+    buf = RingBuffer(3, width=2)
+    buf.extend([[0, 0], [1, 1], [2, 2]])
+    view_t, _ = buf.columns()
+    copy_t, _ = buf.columns(copy=True)
+    buf.append((3, 3))
+    buf.append((4, 4))
+    # A full-buffer view is a slice of the backing store, which is
+    # rewritten in place as rows arrive
+    assert not np.array_equal(view_t, [0, 1, 2])
+    np.testing.assert_array_equal(copy_t, [0, 1, 2])
+
+
+def test_clear():
+    buf = RingBuffer(3)
+    buf.extend([1, 2, 3])
+    buf.clear()
+    assert len(buf) == 0
+    buf.append(9)
+    np.testing.assert_array_equal(buf.columns()[0], [9])
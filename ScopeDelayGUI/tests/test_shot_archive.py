@@ -0,0 +1,112 @@
+# tests/test_shot_archive.py
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from instruments.waveform import Waveform
+from utils.shot_archive import load_channel, load_shot, save_shot
+
+PREAMBLE = {
+    'format': 0, 'type': 2, 'points': 1000, 'count': 1,
+    'xincrement': 1e-9, 'xorigin': -5e-7, 'xreference': 0.0,
+    'yincrement': 0.01, 'yorigin': 0.0, 'yreference': 128.0,
+}
+
+
+def make_captures():
+    rng = np.random.default_rng(0)
+    return {
+        scope_id: tuple(
+            Waveform(rng.integers(0, 256, 1000, dtype=np.uint8), PREAMBLE, ch)
+            for ch in (1, 2, 3, 4)
+        )
+        for scope_id in (2, 1)
+    }
+
+
+def assert_same(a: Waveform, b: Waveform):
+    assert a.channel == b.channel
+    np.testing.assert_array_equal(a.codes, b.codes)
+    for name, value in PREAMBLE.items():
+        assert b.preamble[name] == pytest.approx(value)
+    t_a, v_a = a
+    t_b, v_b = b
+    np.testing.assert_allclose(t_a, t_b)
+    np.testing.assert_allclose(v_a, v_b)
+
+
+@pytest.fixture(params=[".npz", ".h5"])
+def archive_path(request, tmp_path):
+    if request.param == ".h5":
+        pytest.importorskip("h5py")
+    return tmp_path / f"shot{request.param}"
+
+
+@pytest.mark.parametrize("compression", [True, False])
+def test_round_trip(archive_path, compression):
+    captures = make_captures()
+    when = datetime(2025, 12, 16, 11, 32, 49)
+    settings = {"dg535": {"delayA": 1e-6, "widthA": 2e-6}}
+
+    written = save_shot(archive_path, captures, settings=settings,
+                        timestamp=when, compression=compression)
+    assert written == str(archive_path)
+
+    shot = load_shot(archive_path)
+    assert shot.timestamp == when
+    assert shot.settings == settings
+    assert shot.scope_ids == [1, 2]
+    for scope_id, waveforms in captures.items():
+        assert len(shot.data[scope_id]) == len(waveforms)
+        for a, b in zip(waveforms, shot.data[scope_id]):
+            assert_same(a, b)
+
+
+def test_npz_keeps_exact_filename(tmp_path):
+    # np.savez would append .npz to a bare name
+    path = tmp_path / "shot.bin"
+    assert save_shot(path, make_captures()) == str(path)
+    assert path.exists()
+    assert load_shot(path).scope_ids == [1, 2]
+
+
+def test_empty_channel(archive_path):
+    captures = {1: (Waveform(np.arange(10, dtype=np.uint8), PREAMBLE, 1),
+                    Waveform.empty(2), None)}
+    save_shot(archive_path, captures)
+
+    waveforms = load_shot(archive_path).data[1]
+    assert [len(w) for w in waveforms] == [10, 0, 0]
+    assert [w.channel for w in waveforms] == [1, 2, 3]
+
+
+def test_time_voltage_pairs_rejected(tmp_path):
+    t = np.linspace(0, 1, 10)
+    with pytest.raises(TypeError):
+        save_shot(tmp_path / "shot.npz", {1: ((t, t),)})
+
+
+def test_load_channel_range(archive_path):
+    captures = make_captures()
+    save_shot(archive_path, captures)
+    full = captures[2][2]
+
+    part = load_channel(archive_path, 2, 3, start=100, stop=250)
+    assert part.channel == 3
+    np.testing.assert_array_equal(part.codes, full.codes[100:250])
+    # The time axis of the slice lines up with the full record
+    np.testing.assert_allclose(part.time(), full.time(100, 250))
+    np.testing.assert_allclose(part.voltage(), full.voltage(100, 250))
+
+
+def test_load_channel_whole_record(archive_path):
+    captures = make_captures()
+    save_shot(archive_path, captures)
+    assert_same(captures[1][0], load_channel(archive_path, 1, 1))
+
+
+def test_load_channel_missing(archive_path):
+    save_shot(archive_path, make_captures())
+    with pytest.raises(KeyError):
+        load_channel(archive_path, 3, 1)
@@ -0,0 +1,40 @@
+"""
+Shot Archive Worker - Non-blocking export of a shot to HDF5/NPZ.
+"""
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from utils.shot_archive import save_shot
+
+
+class ArchiveExportWorker(QThread):
+    """
+    Worker thread for writing a binary shot archive (see utils.shot_archive).
+
+    captures is scope_id -> tuple of Waveforms; the raw codes are written
+    as-is, so this is far faster and smaller than the CSV export.
+    """
+
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+    def __init__(self, captures: dict, filename: str, settings: dict = None,
+                 timestamp=None, compression: bool = True, parent=None):
+        super().__init__(parent)
+        self.captures = dict(captures)
+        self.filename = filename
+        self.settings = settings or {}
+        self.timestamp = timestamp
+        self.compression = compression
+
+    def run(self):
+        try:
+            self.progress.emit(5)
+            path = save_shot(self.filename, self.captures, settings=self.settings,
+                             timestamp=self.timestamp, compression=self.compression)
+            self.progress.emit(100)
+            self.finished.emit(path)
+
+        except Exception as e:
+            self.error.emit(str(e))
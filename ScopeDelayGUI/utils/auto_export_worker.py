@@ -0,0 +1,88 @@
+"""
+Auto-Export Worker - Saves retained scope captures in the background.
+
+Used when the main window closes: writes a binary shot archive first (fast,
+complete) and then one CSV per scope, so a bounded wait on close never
+leaves the data unsaved.
+"""
+
+import os
+from datetime import datetime
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from instruments.waveform import channel_points
+from utils.csv_export_worker import write_scope_csv
+from utils.shot_archive import hdf5_available, save_shot
+
+
+class AutoExportWorker(QThread):
+    """
+    Worker thread that exports every retained scope capture.
+
+    Files (in output_dir):
+        scopes_auto_<timestamp>.h5 (.npz without h5py) - all scopes, raw codes
+        rigol<N>_auto_<timestamp>.csv                  - one per scope
+
+    Signals:
+        file_saved: Emitted with each filename as it is written
+        finished: Emitted with the list of all written files
+        error: Emitted with an error message (export continues with next file)
+    """
+
+    # Signal: (filename)
+    file_saved = pyqtSignal(str)
+
+    # Signal: (list of filenames)
+    finished = pyqtSignal(list)
+
+    # Signal: (error_message)
+    error = pyqtSignal(str)
+
+    def __init__(self, captures: dict, output_dir: str = ".", settings: dict = None,
+                 write_csv: bool = True, parent=None):
+        """
+        Args:
+            captures: scope_id -> tuple of Waveforms (or (t, v) pairs)
+            output_dir: Directory for the exported files
+            settings: Instrument settings stored in the archive
+            write_csv: Also write one CSV per scope after the archive
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.captures = dict(captures)
+        self.output_dir = output_dir
+        self.settings = settings or {}
+        self.write_csv = write_csv
+        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # Readable after wait() even if queued signals never get delivered
+        self.saved_files = []
+
+    def _saved(self, filename: str):
+        self.saved_files.append(filename)
+        self.file_saved.emit(filename)
+
+    def run(self):
+        captures = {sid: data for sid, data in self.captures.items()
+                    if data is not None and any(channel_points(ch) for ch in data)}
+
+        if captures:
+            ext = ".h5" if hdf5_available() else ".npz"
+            archive = os.path.join(self.output_dir, f"scopes_auto_{self.timestamp}{ext}")
+            try:
+                self._saved(save_shot(archive, captures, settings=self.settings))
+            except Exception as e:
+                # (t, v)-only captures cannot be archived; CSV still works
+                self.error.emit(f"{archive}: {e}")
+
+        if self.write_csv:
+            for scope_id in sorted(captures):
+                filename = os.path.join(self.output_dir,
+                                        f"rigol{scope_id}_auto_{self.timestamp}.csv")
+                try:
+                    self._saved(write_scope_csv(filename, captures[scope_id]))
+                except Exception as e:
+                    self.error.emit(f"{filename}: {e}")
+
+        self.finished.emit(list(self.saved_files))
@@ -187,7 +187,7 @@ class CaptureSingleWorker(QThread):
     error = pyqtSignal(str, str)
 
     def __init__(self, scope, scope_name: str, timeout: float = 300.0, 
-                 four_channel: bool = False, parent=None):
+                 four_channel: bool = False, latency: float = None, parent=None):
         """
         Initialize the capture worker.
 
@@ -196,6 +196,8 @@ class CaptureSingleWorker(QThread):
             scope_name: Name identifier for this scope (e.g., 'R1', 'R2', 'R3')
             timeout: Capture timeout in seconds
             four_channel: If True, capture 4 channels; otherwise capture 2
+            latency: Trigger-wait latency target in seconds, None for the
+                     scope's trigger_wait_latency()
             parent: Parent QObject
         """
         super().__init__(parent)
@@ -203,6 +205,7 @@ class CaptureSingleWorker(QThread):
         self.scope_name = scope_name
         self.timeout = timeout
         self.four_channel = four_channel
+        self.latency = latency
 
     def run(self):
         """Execute the capture operation with full memory depth (RAW mode)."""
@@ -210,14 +213,15 @@ class CaptureSingleWorker(QThread):
             if self.four_channel:
                 # Wait for trigger and capture all four channels (full memory)
                 data = self.scope.wait_and_capture_four(
-                    ch1=1, ch2=2, ch3=3, ch4=4, timeout=self.timeout
+                    ch1=1, ch2=2, ch3=3, ch4=4, timeout=self.timeout,
+                    latency=self.latency
                 )
                 # Emit 4-channel signal
                 self.finished_four.emit(data, self.scope_name)
             else:
                 # Wait for trigger and capture two channels (full memory, legacy)
                 (t1, v1), (t2, v2) = self.scope.wait_and_capture(
-                    ch1=1, ch2=2, timeout=self.timeout
+                    ch1=1, ch2=2, timeout=self.timeout, latency=self.latency
                 )
                 # Emit 2-channel signal
                 self.finished.emit((t1, v1), (t2, v2), self.scope_name)
@@ -246,7 +250,8 @@ class CaptureFourChannelWorker(QThread):
     # Signal: (error_message, scope_name)
     error = pyqtSignal(str, str)
     
-    def __init__(self, scope, scope_name: str, timeout: float = 300.0, parent=None):
+    def __init__(self, scope, scope_name: str, timeout: float = 300.0,
+                 latency: float = None, parent=None):
         """
         Initialize the 4-channel capture worker.
 
@@ -254,19 +259,23 @@ class CaptureFourChannelWorker(QThread):
             scope: RigolScope instance (must already be connected)
             scope_name: Name identifier for this scope
             timeout: Capture timeout in seconds (default: 5 minutes)
+            latency: Trigger-wait latency target in seconds, None for the
+                     scope's trigger_wait_latency()
             parent: Parent QObject
         """
         super().__init__(parent)
         self.scope = scope
         self.scope_name = scope_name
         self.timeout = timeout
+        self.latency = latency
         
     def run(self):
         """Execute the 4-channel capture operation (trigger + full memory)."""
         try:
             # Wait for trigger and capture all four channels with full memory depth
             data = self.scope.wait_and_capture_four(
-                ch1=1, ch2=2, ch3=3, ch4=4, timeout=self.timeout
+                ch1=1, ch2=2, ch3=3, ch4=4, timeout=self.timeout,
+                latency=self.latency
             )
             self.finished.emit(data, self.scope_name)
             
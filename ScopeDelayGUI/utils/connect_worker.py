@@ -0,0 +1,130 @@
+"""
+Worker thread for parallel instrument bring-up.
+
+Opens every instrument at the same time (one thread per device), so
+startup costs as long as the slowest device instead of the sum of all
+connect sleeps, *IDN? round trips and timeouts. Each device reports as
+soon as it finishes, so its lamp can be updated right away.
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+@dataclass
+class DeviceJob:
+    """
+    One device to bring up.
+
+    Attributes:
+        name: Key reported back in device_done (e.g. "DG535", "Rigol1_VISA")
+        func: Blocking connect function; its return value is reported
+        timeout: Seconds before the device is reported as failed
+        cleanup: Called (no arguments, in the job's thread) if func finishes
+                 after the timeout, to close whatever it opened
+    """
+    name: str
+    func: Callable
+    timeout: float = 5.0
+    cleanup: Optional[Callable] = None
+
+
+class DeviceConnectWorker(QThread):
+    """
+    Runs DeviceJob.func for all jobs concurrently.
+
+    Connect functions must not touch widgets; they run in plain daemon
+    threads. A job that exceeds its timeout is reported as failed; its
+    thread is left to finish on its own (a blocking serial/VISA open
+    cannot be interrupted). When it does finish, DeviceJob.cleanup is run
+    so the device is not left open behind a "Timed out" lamp, and
+    device_late reports it.
+
+    Signals:
+        device_done: (name, ok, result or error message) per device
+        device_late: (name, message) when a timed-out job finishes
+        all_done: Emitted once with the total elapsed time in seconds
+    """
+
+    # Signal: (name, ok, result / error message)
+    device_done = pyqtSignal(str, bool, object)
+
+    # Signal: (name, message)
+    device_late = pyqtSignal(str, str)
+
+    # Signal: (elapsed_seconds)
+    all_done = pyqtSignal(float)
+
+    def __init__(self, jobs, parent=None):
+        """
+        Args:
+            jobs: List of DeviceJob
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.jobs = list(jobs)
+
+    def run(self):
+        start = time.time()
+        results = queue.Queue()
+        lock = threading.Lock()
+        finished = set()    # names whose result is in (or through) the queue
+        timed_out = set()   # names already reported as "Timed out"
+
+        def run_job(job):
+            try:
+                outcome = (job.name, True, job.func())
+            except Exception as e:
+                outcome = (job.name, False, str(e))
+            with lock:
+                late = job.name in timed_out
+                if not late:
+                    finished.add(job.name)
+                    results.put(outcome)
+            if late:
+                self._cleanup_late(job, outcome[1], outcome[2])
+
+        deadlines = {}
+        for job in self.jobs:
+            deadlines[job.name] = time.time() + job.timeout
+            threading.Thread(target=run_job, args=(job,), name=f"connect-{job.name}",
+                             daemon=True).start()
+
+        while deadlines:
+            wait = max(0.0, min(deadlines.values()) - time.time())
+            try:
+                name, ok, result = results.get(timeout=wait)
+            except queue.Empty:
+                now = time.time()
+                for name in [n for n, d in deadlines.items() if d <= now]:
+                    with lock:
+                        if name in finished:
+                            # Result arrived just now; picked up next pass
+                            continue
+                        timed_out.add(name)
+                    del deadlines[name]
+                    self.device_done.emit(name, False, "Timed out")
+                continue
+
+            if name in deadlines:
+                del deadlines[name]
+                self.device_done.emit(name, ok, result)
+
+        self.all_done.emit(time.time() - start)
+
+    def _cleanup_late(self, job, ok, result):
+        """Close a device whose connect finished after it was reported as timed out"""
+        outcome = "connected" if ok else f"failed ({result})"
+        if job.cleanup is None:
+            self.device_late.emit(job.name, f"{outcome} after timeout")
+            return
+        try:
+            job.cleanup()
+            self.device_late.emit(job.name, f"{outcome} after timeout - closed")
+        except Exception as e:
+            self.device_late.emit(job.name, f"{outcome} after timeout - close failed: {e}")
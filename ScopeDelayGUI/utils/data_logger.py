@@ -1,9 +1,13 @@
 # utils/data_logger.py
 import csv
+import os
+import queue
 import threading
 from datetime import datetime
 from pathlib import Path
 
+from utils.telemetry_log import TelemetryLog
+
 
 class DataLogger:
     """
@@ -21,8 +25,31 @@ class DataLogger:
     - BNC575_ARM: BNC575 armed (param1=trigger_level)
     - SCOPE_CAPTURE: Scope capture (param1=scope_id)
     - SCOPE_ALL: All scopes captured
+
+    The log_* methods only put the event on a queue; a background writer
+    thread keeps the file open, writes in batches, flushes every batch and
+    fsyncs every FSYNC_INTERVAL seconds. If the queue is full (writer
+    stalled) events are dropped and counted rather than blocking the caller.
+    A failed write (disk full, drive removed) does not stop the writer: the
+    batch is counted in write_failures, write_error holds the message until
+    a write succeeds again, and the loss is noted in the log once it does.
+
+    Events with a fixed schema are also written to a typed binary log in
+    experiment_log_<timestamp>_telemetry/ (see utils.telemetry_log).
     """
 
+    # Max events waiting for the writer (bounds memory if the disk stalls)
+    MAX_QUEUE = 100000
+
+    # Max rows written per batch
+    BATCH_SIZE = 1000
+
+    # Writer wakes up at least this often (seconds)
+    FLUSH_INTERVAL = 0.25
+
+    # os.fsync() at most this often (seconds)
+    FSYNC_INTERVAL = 2.0
+
     def __init__(self, log_dir="logs"):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
@@ -30,16 +57,32 @@ class DataLogger:
         # Create new log file with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file = self.log_dir / f"experiment_log_{timestamp}.csv"
-
-        # Thread lock for safe concurrent logging
-        self.lock = threading.Lock()
+        self.telemetry_dir = self.log_dir / f"experiment_log_{timestamp}_telemetry"
+        self.telemetry = TelemetryLog(self.telemetry_dir)
 
         # Start time for relative timestamps
         self.start_time = datetime.now()
 
+        # Events queued for the writer thread; dropped counts overflow
+        self._queue = queue.Queue(maxsize=self.MAX_QUEUE)
+        self.dropped = 0
+        self._dropped_reported = 0
+
+        # Events lost to write errors; write_error is the current error
+        # message (None while writes succeed)
+        self.write_failures = 0
+        self._failures_reported = 0
+        self.write_error = None
+        self._last_write_error = ""
+
         # Initialize CSV file with header
         self._init_log_file()
 
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="DataLoggerWriter", daemon=True
+        )
+        self._writer_thread.start()
+
         print(f"[DataLogger] Logging to: {self.log_file}")
 
     def _init_log_file(self):
@@ -63,25 +106,155 @@ class DataLogger:
         elapsed = datetime.now() - self.start_time
         return elapsed.total_seconds()
 
-    def _log_event(self, event_type, source, param1='', param2='', param3='', param4='', notes=''):
-        """Internal method to log an event"""
-        with self.lock:
-            timestamp = self._get_timestamp()
-            datetime_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-
-            with open(self.log_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    f"{timestamp:.6f}",
-                    datetime_str,
-                    event_type,
-                    source,
-                    param1,
-                    param2,
-                    param3,
-                    param4,
-                    notes
-                ])
+    def _log_event(self, event_type, source, param1='', param2='', param3='', param4='', notes='',
+                   values=None):
+        """
+        Internal method to log an event (non-blocking enqueue).
+
+        values: typed field values for the binary telemetry log, in
+        telemetry_log.SCHEMAS order (None = CSV only)
+        """
+        try:
+            self._queue.put_nowait(
+                (datetime.now(), event_type, source, param1, param2, param3, param4, notes, values)
+            )
+        except queue.Full:
+            self.dropped += 1
+
+    # ================================================================
+    # Background Writer
+    # ================================================================
+    def _format_row(self, event):
+        """Convert a queued event to a CSV row (runs on the writer thread)"""
+        when, event_type, source, param1, param2, param3, param4, notes, values = event
+        timestamp = (when - self.start_time).total_seconds()
+        if values is not None:
+            self.telemetry.append(event_type, timestamp, values)
+        return [
+            f"{timestamp:.6f}",
+            when.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+            event_type,
+            source,
+            param1,
+            param2,
+            param3,
+            param4,
+            notes
+        ]
+
+    def _writer_loop(self):
+        """Drain the queue in batches into the open CSV file"""
+        f = writer = None
+        last_fsync = datetime.now()
+        running = True
+
+        while running:
+            try:
+                batch = [self._queue.get(timeout=self.FLUSH_INTERVAL)]
+            except queue.Empty:
+                batch = []
+
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            events = []
+            waiters = []
+            for item in batch:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    events.append(item)
+
+            try:
+                if f is None:
+                    # (Re)open after startup or a failed batch
+                    f = open(self.log_file, 'a', newline='')
+                    writer = csv.writer(f)
+
+                rows = [self._format_row(event) for event in events]
+                rows += self._loss_rows()
+
+                if rows:
+                    writer.writerows(rows)
+                    f.flush()
+                    self.telemetry.flush()
+
+                if (datetime.now() - last_fsync).total_seconds() >= self.FSYNC_INTERVAL or not running:
+                    for fd in [f.fileno()] + self.telemetry.fileno_all():
+                        os.fsync(fd)
+                    last_fsync = datetime.now()
+
+                self._write_ok()
+            except Exception as e:
+                # Disk full, drive removed, ...: count the batch as lost and
+                # keep draining so log_* callers never back up
+                self._write_failed(e, len(events))
+                if f is not None:
+                    try:
+                        f.close()
+                    except Exception:
+                        pass
+                    f = writer = None
+
+            for event in waiters:
+                event.set()
+
+        try:
+            if f is not None:
+                f.close()
+            self.telemetry.close()
+        except Exception as e:
+            self._write_failed(e, 0)
+
+    def _loss_rows(self):
+        """ERROR rows for events dropped (queue full) or lost (write errors) since the last report"""
+        rows = []
+        if self.dropped != self._dropped_reported:
+            lost = self.dropped - self._dropped_reported
+            rows.append(self._format_row((
+                datetime.now(), 'ERROR', 'DataLogger', '', '', '', '',
+                f"Log queue full - {lost} events dropped", None
+            )))
+        if self.write_failures != self._failures_reported:
+            lost = self.write_failures - self._failures_reported
+            rows.append(self._format_row((
+                datetime.now(), 'ERROR', 'DataLogger', '', '', '', '',
+                f"Write error ({self._last_write_error}) - {lost} events may not have been written", None
+            )))
+        return rows
+
+    def _write_ok(self):
+        """A batch (including its loss rows) reached the file"""
+        self._dropped_reported = self.dropped
+        self._failures_reported = self.write_failures
+        if self.write_error is not None:
+            print(f"[DataLogger] Writing to {self.log_file} again")
+            self.write_error = None
+
+    def _write_failed(self, error, lost):
+        """Record a failed batch; reported once per outage, not per batch"""
+        self.write_failures += lost
+        self._last_write_error = f"{type(error).__name__}: {error}"
+        if self.write_error is None:
+            print(f"[DataLogger ERROR] Cannot write {self.log_file}: {self._last_write_error}")
+        self.write_error = self._last_write_error
+
+    def flush(self, timeout=5.0):
+        """
+        Wait until every event logged so far is written to the file.
+
+        Returns:
+            True if flushed, False on timeout or while writes are failing
+            (see write_error)
+        """
+        done = threading.Event()
+        self._queue.put(done, timeout=timeout)
+        return done.wait(timeout) and self.write_error is None
 
     # ================================================================
     # Arduino / SF6 Logging
@@ -93,7 +266,8 @@ class DataLogger:
             source='Arduino',
             param1=f"{ch0_psi:.3f}",
             param2=f"{ch1_psi:.3f}",
-            param3=f"{ch2_psi:.3f}"
+            param3=f"{ch2_psi:.3f}",
+            values=(ch0_psi, ch1_psi, ch2_psi)
         )
 
     def log_arduino_switch(self, switch_index, state):
@@ -103,7 +277,8 @@ class DataLogger:
             source='Arduino',
             param1=switch_index,
             param2=state,
-            notes=f"DO{switch_index:02d} {'ON' if state else 'OFF'}"
+            notes=f"DO{switch_index:02d} {'ON' if state else 'OFF'}",
+            values=(switch_index, bool(state))
         )
 
     # ================================================================
@@ -118,7 +293,8 @@ class DataLogger:
             param2=f"{ma:.3f}",
             param3='1' if hv_on else '0',
             param4='1' if fault else '0',
-            notes=f"HV={'ON' if hv_on else 'OFF'}, Fault={'YES' if fault else 'NO'}"
+            notes=f"HV={'ON' if hv_on else 'OFF'}, Fault={'YES' if fault else 'NO'}",
+            values=(unit_id, kv, ma, bool(hv_on), bool(fault))
         )
 
     def log_wj_command(self, unit_id, command, value=''):
@@ -128,7 +304,8 @@ class DataLogger:
             source=f'WJ{unit_id}',
             param1=command,
             param2=value,
-            notes=f"{command} {value}"
+            notes=f"{command} {value}",
+            values=(unit_id, str(command).encode()[:16], str(value).encode()[:16])
         )
 
     # ================================================================
@@ -141,7 +318,8 @@ class DataLogger:
             source='DG535',
             param1=f"{delay_a:.9e}",
             param2=f"{width_a:.9e}",
-            notes=f"Delay={delay_a:.3e}s, Width={width_a:.3e}s"
+            notes=f"Delay={delay_a:.3e}s, Width={width_a:.3e}s",
+            values=(delay_a, width_a)
         )
 
     def log_dg535_config(self, delay_a, width_a):
@@ -151,7 +329,8 @@ class DataLogger:
             source='DG535',
             param1=f"{delay_a:.9e}",
             param2=f"{width_a:.9e}",
-            notes=f"Configured: Delay={delay_a:.3e}s, Width={width_a:.3e}s"
+            notes=f"Configured: Delay={delay_a:.3e}s, Width={width_a:.3e}s",
+            values=(delay_a, width_a)
         )
 
     # ================================================================
@@ -163,7 +342,8 @@ class DataLogger:
             event_type='BNC575_PULSE',
             source='BNC575',
             param1=mode,
-            notes=settings if settings else mode
+            notes=settings if settings else mode,
+            values=(str(mode).encode()[:16],)
         )
 
     def log_bnc575_arm(self, trigger_level):
@@ -172,7 +352,8 @@ class DataLogger:
             event_type='BNC575_ARM',
             source='BNC575',
             param1=f"{trigger_level:.3f}",
-            notes=f"Armed for EXT trigger at {trigger_level}V"
+            notes=f"Armed for EXT trigger at {trigger_level}V",
+            values=(trigger_level,)
         )
 
     def log_bnc575_config(self, wa, da, wb, db, wc, dc, wd, dd):
@@ -185,7 +366,8 @@ class DataLogger:
             param2=f"{da:.9e}",
             param3=f"{wb:.9e}",
             param4=f"{db:.9e}",
-            notes=settings
+            notes=settings,
+            values=(wa, da, wb, db, wc, dc, wd, dd)
         )
 
     # ================================================================
@@ -199,7 +381,8 @@ class DataLogger:
             param1=scope_id,
             param2=num_points_ch1,
             param3=num_points_ch2,
-            notes=f"Rigol #{scope_id} captured (CH1:{num_points_ch1} pts, CH2:{num_points_ch2} pts)"
+            notes=f"Rigol #{scope_id} captured (CH1:{num_points_ch1} pts, CH2:{num_points_ch2} pts)",
+            values=(scope_id, num_points_ch1, num_points_ch2)
         )
 
     def log_scope_all_capture(self):
@@ -207,7 +390,8 @@ class DataLogger:
         self._log_event(
             event_type='SCOPE_ALL',
             source='ALL_SCOPES',
-            notes='Master trigger - all scopes captured'
+            notes='Master trigger - all scopes captured',
+            values=()
         )
 
     def log_scope_arm(self, scope_id):
@@ -216,7 +400,8 @@ class DataLogger:
             event_type='SCOPE_ARM',
             source=f'Rigol{scope_id}',
             param1=scope_id,
-            notes=f"Rigol #{scope_id} armed (SINGLE mode)"
+            notes=f"Rigol #{scope_id} armed (SINGLE mode)",
+            values=(scope_id,)
         )
 
     # ================================================================
@@ -257,6 +442,12 @@ class DataLogger:
         """Return the current log file path"""
         return str(self.log_file)
 
-    def close(self):
-        """Close logger (placeholder for future cleanup if needed)"""
+    def close(self, timeout=5.0):
+        """Write out queued events, fsync and stop the writer thread"""
+        if self._writer_thread.is_alive():
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+            self._writer_thread.join(timeout)
         print(f"[DataLogger] Log saved to: {self.log_file}")
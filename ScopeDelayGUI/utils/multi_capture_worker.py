@@ -0,0 +1,125 @@
+"""
+Worker thread for concurrent multi-scope capture.
+
+Reads every connected oscilloscope at the same time (one thread per VISA
+session) so a three-scope shot costs one transfer time instead of three.
+Results are gathered into a single ScopeShot and emitted once.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+@dataclass
+class ScopeShot:
+    """
+    Container for one multi-scope shot.
+
+    Attributes:
+        timestamp: Wall-clock time the capture was started
+        data: scope_id -> ((t1,v1), (t2,v2), (t3,v3), (t4,v4))
+        errors: scope_id -> error message for scopes that failed
+        elapsed: Total capture time in seconds
+        settings: Instrument settings in use for the shot (DG535, BNC575)
+    """
+    timestamp: datetime = field(default_factory=datetime.now)
+    data: Dict[int, tuple] = field(default_factory=dict)
+    errors: Dict[int, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+    settings: dict = field(default_factory=dict)
+
+    @property
+    def scope_ids(self) -> list:
+        """Scope IDs that returned data, in ascending order."""
+        return sorted(self.data.keys())
+
+    @property
+    def ok(self) -> bool:
+        """True if every requested scope returned data."""
+        return not self.errors
+
+
+class MultiScopeCaptureWorker(QThread):
+    """
+    Worker thread that captures 4 channels from several scopes in parallel.
+
+    Each scope gets its own thread for wait_and_capture_four(), so all
+    scopes wait for their trigger at the same time and the RAW transfers
+    overlap. The GUI thread is never blocked.
+
+    Signals:
+        finished: Emitted once with the ScopeShot when all scopes are done
+        scope_done: Emitted as each scope finishes with (scope_id, data)
+        error: Emitted per failed scope with (error_message, scope_id)
+    """
+
+    # Signal: (ScopeShot)
+    finished = pyqtSignal(object)
+
+    # Signal: (scope_id, 4-channel data tuple)
+    scope_done = pyqtSignal(int, object)
+
+    # Signal: (error_message, scope_id)
+    error = pyqtSignal(str, int)
+
+    def __init__(self, scopes: dict, timeout: float = 300.0, latency: float = None,
+                 arm: bool = False, settings: dict = None, parent=None):
+        """
+        Initialize the multi-scope capture worker.
+
+        Args:
+            scopes: Dict of scope_id -> RigolScope (must already be connected
+                    and armed)
+            timeout: Capture timeout in seconds, applied to each scope
+            latency: Trigger-wait latency target in seconds, None for each
+                     scope's trigger_wait_latency()
+            arm: If True, send :SINGle to each scope before waiting
+                 (default False: the shot sequence arms the scopes itself)
+            settings: Instrument settings to record in the ScopeShot
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.scopes = dict(scopes)
+        self.timeout = timeout
+        self.latency = latency
+        self.arm = arm
+        self.settings = dict(settings or {})
+
+    def _capture_one(self, scope):
+        """Capture one scope; runs in a pool thread."""
+        return scope.wait_and_capture_four(
+            ch1=1, ch2=2, ch3=3, ch4=4, timeout=self.timeout,
+            latency=self.latency, arm=self.arm
+        )
+
+    def run(self):
+        """Capture all scopes concurrently and emit one ScopeShot."""
+        shot = ScopeShot(settings=self.settings)
+        start = time.time()
+
+        if not self.scopes:
+            self.finished.emit(shot)
+            return
+
+        with ThreadPoolExecutor(max_workers=len(self.scopes)) as pool:
+            futures = {
+                pool.submit(self._capture_one, scope): scope_id
+                for scope_id, scope in self.scopes.items()
+            }
+            for future in as_completed(futures):
+                scope_id = futures[future]
+                try:
+                    data = future.result()
+                    shot.data[scope_id] = data
+                    self.scope_done.emit(scope_id, data)
+                except Exception as e:
+                    shot.errors[scope_id] = str(e)
+                    self.error.emit(str(e), scope_id)
+
+        shot.elapsed = time.time() - start
+        self.finished.emit(shot)
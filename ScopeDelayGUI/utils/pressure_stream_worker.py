@@ -9,13 +9,25 @@ Parses the DATA format: DATA,count,mA0,mA1,raw2,voltage
 
 Converts raw ADC to PSI using linear interpolation with calibration table.
 Converts mA0, mA1 to PSI using standard 4-20mA to 0-200 PSI mapping.
+
+The worker reads everything waiting on the port at once, splits complete
+lines out of a byte buffer and parses each batch together, emitting one
+PressureBatch (NumPy arrays) per read instead of two signals per sample.
 """
 
 from PyQt6.QtCore import QThread, pyqtSignal
+import json
+import os
 import time
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
+
+
+# Default calibration file (see PressureCalibration.load_default)
+CALIBRATION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pressure_calibration.json")
+
 
 @dataclass
 class PressureData:
@@ -30,12 +42,46 @@ class PressureData:
     voltage: float   # Output voltage to regulator
 
 
+@dataclass
+class PressureBatch:
+    """All samples parsed from one serial read (equal-length arrays)."""
+    count: np.ndarray     # Arduino sample counter
+    mA0: np.ndarray
+    mA1: np.ndarray
+    psi0: np.ndarray
+    psi1: np.ndarray
+    raw_adc: np.ndarray
+    psi2: np.ndarray
+    voltage: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.count)
+
+    def latest(self) -> PressureData:
+        """Last sample of the batch as a PressureData."""
+        return PressureData(
+            count=int(self.count[-1]),
+            mA0=float(self.mA0[-1]),
+            mA1=float(self.mA1[-1]),
+            psi0=float(self.psi0[-1]),
+            psi1=float(self.psi1[-1]),
+            raw_adc=int(self.raw_adc[-1]),
+            psi2=float(self.psi2[-1]),
+            voltage=float(self.voltage[-1])
+        )
+
+
 class PressureCalibration:
     """
     Pressure sensor calibration using linear interpolation.
 
     Converts raw ADC values to PSI using a calibration table.
     Values outside the table range are clamped.
+
+    The *_array methods convert a whole batch with np.interp/np.clip.
+    Tables can be replaced from a JSON file with load(); the application
+    calls load_default() at startup for pressure_calibration.json next to
+    this module. Until then (or if that fails) the built-in tables apply.
     """
 
     # Calibration table: raw ADC -> PSI
@@ -51,6 +97,106 @@ class PressureCalibration:
     RAW_MIN = 10969
     PSI_MIN = 0.0
 
+    # 4-20mA sensors (AI0, AI1)
+    MA_MIN = 4.0
+    MA_MAX = 20.0
+    MA_PSI_FULL = 200.0
+
+    @classmethod
+    def load(cls, path: str = CALIBRATION_FILE):
+        """
+        Load calibration tables from a JSON file.
+
+        Format (all keys except raw_table/psi_table optional):
+            {"raw_table": [...], "psi_table": [...],
+             "raw_sat": 45516, "psi_sat": 79.5,
+             "raw_min": 10969, "psi_min": 0.0,
+             "ma_min": 4.0, "ma_max": 20.0, "ma_psi_full": 200.0}
+
+        Every value is parsed before any is applied, so a bad file leaves
+        the current calibration untouched.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not valid JSON, a value does not
+                parse, or the tables are mismatched / raw is not increasing
+            KeyError: If raw_table or psi_table is missing
+        """
+        with open(path) as f:
+            cal = json.load(f)
+
+        try:
+            raw = [int(x) for x in cal["raw_table"]]
+            psi = [float(x) for x in cal["psi_table"]]
+            values = {
+                'RAW_SAT': int(cal.get("raw_sat", raw[-1] if raw else 0)),
+                'PSI_SAT': float(cal.get("psi_sat", psi[-1] if psi else 0.0)),
+                'RAW_MIN': int(cal.get("raw_min", raw[0] if raw else 0)),
+                'PSI_MIN': float(cal.get("psi_min", psi[0] if psi else 0.0)),
+                'MA_MIN': float(cal.get("ma_min", cls.MA_MIN)),
+                'MA_MAX': float(cal.get("ma_max", cls.MA_MAX)),
+                'MA_PSI_FULL': float(cal.get("ma_psi_full", cls.MA_PSI_FULL)),
+            }
+        except (TypeError, AttributeError) as e:
+            raise ValueError(f"Malformed calibration file ({path}): {e}") from e
+        if len(raw) != len(psi) or len(raw) < 2:
+            raise ValueError(f"Calibration tables must have equal length >= 2 ({path})")
+        if any(b < a for a, b in zip(raw, raw[1:])):
+            raise ValueError(f"raw_table must be increasing ({path})")
+
+        cls.RAW_TABLE = raw
+        cls.PSI_TABLE = psi
+        cls.CAL_N = len(raw)
+        for name, value in values.items():
+            setattr(cls, name, value)
+
+    @classmethod
+    def load_default(cls) -> bool:
+        """
+        Load CALIBRATION_FILE if it exists.
+
+        Returns:
+            True if loaded, False if there is no file (built-in tables kept)
+
+        Raises:
+            Same as load(); the built-in tables stay in effect
+        """
+        if not os.path.exists(CALIBRATION_FILE):
+            return False
+        cls.load(CALIBRATION_FILE)
+        return True
+
+    @classmethod
+    def raw_to_psi_array(cls, raw) -> np.ndarray:
+        """
+        Convert an array of raw ADC values to PSI (same clamping as raw_to_psi).
+
+        Args:
+            raw: Array-like of raw ADC values
+
+        Returns:
+            float64 array of PSI
+        """
+        raw = np.asarray(raw, dtype=np.float64)
+        psi = np.interp(raw, cls.RAW_TABLE, cls.PSI_TABLE)
+        psi = np.where(raw >= cls.RAW_SAT, cls.PSI_SAT, psi)
+        return np.where(raw <= cls.RAW_MIN, cls.PSI_MIN, psi)
+
+    @classmethod
+    def mA_to_psi_array(cls, mA) -> np.ndarray:
+        """
+        Convert an array of 4-20mA readings to PSI (same clamping as mA_to_psi).
+
+        Args:
+            mA: Array-like of currents in milliamps
+
+        Returns:
+            float64 array of PSI
+        """
+        mA = np.asarray(mA, dtype=np.float64)
+        scale = cls.MA_PSI_FULL / (cls.MA_MAX - cls.MA_MIN)
+        return np.clip((mA - cls.MA_MIN) * scale, 0.0, cls.MA_PSI_FULL)
+
     @classmethod
     def raw_to_psi(cls, raw: int) -> float:
         """
@@ -90,8 +236,8 @@ class PressureCalibration:
         # Fallback (shouldn't reach here with valid data)
         return cls.PSI_SAT
 
-    @staticmethod
-    def mA_to_psi(mA: float) -> float:
+    @classmethod
+    def mA_to_psi(cls, mA: float) -> float:
         """
         Convert 4-20mA current reading to PSI (0-200 PSI range).
 
@@ -101,26 +247,32 @@ class PressureCalibration:
         Returns:
             Pressure in PSI
         """
-        if mA < 4.0:
+        if mA < cls.MA_MIN:
             return 0.0
-        if mA > 20.0:
-            return 200.0
-        return (mA - 4.0) * 12.5  # (mA - 4) / 16 * 200
+        if mA > cls.MA_MAX:
+            return cls.MA_PSI_FULL
+        # (mA - 4) / 16 * 200
+        return (mA - cls.MA_MIN) * cls.MA_PSI_FULL / (cls.MA_MAX - cls.MA_MIN)
 
 
 class PressureStreamWorker(QThread):
     """
     Background worker for streaming pressure sensor data from Arduino.
 
-    Continuously reads serial data, parses the DATA format, performs
-    PSI calibration, and emits signals with converted values.
+    Reads all bytes waiting on the serial port at once, parses every
+    complete DATA line in the batch, performs PSI calibration, and emits
+    once per batch.
 
     Signals:
-        data_signal(psi0, psi1, psi2, voltage): Emitted with all PSI values
-        raw_data_signal(mA0, mA1, raw_adc, psi2, voltage): Raw data with calibrated PSI
+        batch_signal(PressureBatch): All samples from one read, as arrays
+        data_signal(psi0, psi1, psi2, voltage): Latest sample of each batch
+        raw_data_signal(mA0, mA1, raw_adc, psi2, voltage): Latest sample, raw values
         error_signal(str): Emitted on errors
     """
 
+    # Signal with every sample of a batch: PressureBatch
+    batch_signal = pyqtSignal(object)
+
     # Signal with all PSI values: psi0, psi1, psi2 (calibrated), voltage
     data_signal = pyqtSignal(float, float, float, float)
 
@@ -130,6 +282,9 @@ class PressureStreamWorker(QThread):
     # Error signal
     error_signal = pyqtSignal(str)
 
+    # Drop buffered bytes if no line ending shows up within this many bytes
+    MAX_BUFFER = 65536
+
     def __init__(self, arduino):
         """
         Initialize the stream worker.
@@ -140,7 +295,9 @@ class PressureStreamWorker(QThread):
         super().__init__()
         self.arduino = arduino
         self.running = True
-        self.poll_interval = 0.002  # 2ms polling interval
+
+        # Bytes received after the last complete line
+        self._buffer = bytearray()
 
         # Latest parsed data (thread-safe access via property)
         self._latest_data: Optional[PressureData] = None
@@ -166,64 +323,104 @@ class PressureStreamWorker(QThread):
             self._latest_data.voltage
         )
 
+    def _read_lines(self, ser) -> list:
+        """
+        Read everything waiting on the port and return the complete lines.
+
+        Blocks for at most the port timeout when nothing is waiting, so the
+        loop never spins. A trailing partial line stays in the buffer.
+        """
+        waiting = ser.in_waiting
+        self._buffer += ser.read(waiting or 1)
+
+        end = self._buffer.rfind(b"\n")
+        if end < 0:
+            if len(self._buffer) > self.MAX_BUFFER:
+                self._buffer.clear()
+            return []
+
+        complete = bytes(self._buffer[:end])
+        del self._buffer[:end + 1]
+        return complete.split(b"\n")
+
+    @staticmethod
+    def parse_lines(lines) -> Optional[PressureBatch]:
+        """
+        Parse DATA lines (bytes or str): DATA,count,mA0,mA1,raw2,voltage
+
+        Malformed lines are skipped. Returns None if no line parsed.
+        """
+        rows = []
+        for line in lines:
+            if isinstance(line, str):
+                line = line.encode()
+            line = line.strip()
+            if line.startswith(b"DATA,"):
+                parts = line.split(b",")
+                if len(parts) >= 6:
+                    rows.append(parts[1:6])
+
+        if not rows:
+            return None
+
+        try:
+            values = np.array(rows, dtype=np.float64)
+        except ValueError:
+            # At least one bad field - parse row by row and drop the bad ones
+            good = []
+            for row in rows:
+                try:
+                    good.append([float(x) for x in row])
+                except ValueError:
+                    pass
+            if not good:
+                return None
+            values = np.array(good, dtype=np.float64)
+
+        count, mA0, mA1, raw, voltage = values.T
+        raw_adc = raw.astype(np.int64)
+
+        return PressureBatch(
+            count=count.astype(np.int64),
+            mA0=mA0,
+            mA1=mA1,
+            psi0=PressureCalibration.mA_to_psi_array(mA0),
+            psi1=PressureCalibration.mA_to_psi_array(mA1),
+            raw_adc=raw_adc,
+            psi2=PressureCalibration.raw_to_psi_array(raw_adc),
+            voltage=voltage
+        )
+
     def run(self):
-        """Main worker loop - reads and parses serial data."""
+        """Main worker loop - reads and parses serial data in batches."""
         try:
             while self.running:
                 # Check if Arduino is connected
-                if not self.arduino.serial:
+                ser = self.arduino.serial
+                if not ser:
                     time.sleep(0.05)
                     continue
 
-                # Read a line from serial
                 try:
-                    line = self.arduino.serial.readline().decode(errors="ignore").strip()
+                    lines = self._read_lines(ser)
                 except Exception as e:
                     self.error_signal.emit(f"Serial read error: {e}")
+                    self._buffer.clear()
                     time.sleep(0.1)
                     continue
 
-                # Parse DATA format: DATA,count,mA0,mA1,raw2,voltage
-                if line.startswith("DATA,"):
-                    try:
-                        parts = line.split(",")
-                        if len(parts) >= 6:
-                            _, count_str, mA0_str, mA1_str, raw2_str, voltage_str = parts[:6]
-
-                            count = int(count_str)
-                            mA0 = float(mA0_str)
-                            mA1 = float(mA1_str)
-                            raw_adc = int(raw2_str)
-                            voltage = float(voltage_str)
-
-                            # Convert mA0, mA1 to PSI (4-20mA -> 0-200 PSI)
-                            psi0 = PressureCalibration.mA_to_psi(mA0)
-                            psi1 = PressureCalibration.mA_to_psi(mA1)
-
-                            # Convert raw ADC to PSI using calibration table
-                            psi2 = PressureCalibration.raw_to_psi(raw_adc)
-
-                            # Store latest data
-                            self._latest_data = PressureData(
-                                count=count,
-                                mA0=mA0,
-                                mA1=mA1,
-                                psi0=psi0,
-                                psi1=psi1,
-                                raw_adc=raw_adc,
-                                psi2=psi2,
-                                voltage=voltage
-                            )
-
-                            # Emit signals
-                            self.data_signal.emit(psi0, psi1, psi2, voltage)
-                            self.raw_data_signal.emit(mA0, mA1, raw_adc, psi2, voltage)
-
-                    except (ValueError, IndexError):
-                        # Malformed line, skip it
-                        pass
-
-                time.sleep(self.poll_interval)
+                batch = self.parse_lines(lines)
+                if batch is None:
+                    continue
+
+                latest = batch.latest()
+                self._latest_data = latest
+
+                # Emit once per batch
+                self.batch_signal.emit(batch)
+                self.data_signal.emit(latest.psi0, latest.psi1, latest.psi2, latest.voltage)
+                self.raw_data_signal.emit(latest.mA0, latest.mA1, latest.raw_adc,
+                                          latest.psi2, latest.voltage)
 
         except Exception as e:
             self.error_signal.emit(f"Stream worker error: {e}")
@@ -260,3 +457,29 @@ def mA_to_psi(mA: float) -> float:
         Pressure in PSI
     """
     return PressureCalibration.mA_to_psi(mA)
+
+
+def raw_adc_to_psi_array(raw) -> np.ndarray:
+    """
+    Convert an array of raw ADC values to PSI (e.g. reprocessing a log).
+
+    Args:
+        raw: Array-like of raw ADC values
+
+    Returns:
+        float64 array of PSI
+    """
+    return PressureCalibration.raw_to_psi_array(raw)
+
+
+def mA_to_psi_array(mA) -> np.ndarray:
+    """
+    Convert an array of 4-20mA currents to PSI (0-200 PSI range).
+
+    Args:
+        mA: Array-like of currents in milliamps
+
+    Returns:
+        float64 array of PSI
+    """
+    return PressureCalibration.mA_to_psi_array(mA)
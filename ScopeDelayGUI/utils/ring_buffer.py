@@ -0,0 +1,89 @@
+# utils/ring_buffer.py
+"""
+Fixed-size circular buffer backed by a preallocated NumPy array.
+
+Each row is stored twice (at i and i + capacity), so the last N rows in
+time order are always one contiguous slice: view() returns it without
+copying, and nothing is reallocated however long the stream runs.
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Circular buffer of rows with `width` columns.
+
+    Usage:
+        buf = RingBuffer(3000, width=3)     # columns: t, kV, mA
+        buf.append((t, kv, ma))
+        t, kv, ma = buf.columns()            # ordered, zero-copy views
+        t, kv, ma = buf.columns(copy=True)   # snapshot for consumers that keep it
+    """
+
+    def __init__(self, capacity: int, width: int = 1, dtype=np.float64):
+        """
+        Args:
+            capacity: Max rows kept (oldest are overwritten)
+            width: Values per row
+            dtype: Storage dtype
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.width = width
+        self._data = np.zeros((2 * capacity, width), dtype=dtype)
+        self._head = 0      # next write position (0..capacity-1)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, row):
+        """Add one row (sequence of `width` values, or a scalar if width == 1)."""
+        i = self._head
+        self._data[i] = row
+        self._data[i + self.capacity] = row
+        self._head = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def extend(self, rows):
+        """Add many rows at once (array of shape (n, width) or (n,))."""
+        rows = np.asarray(rows, dtype=self._data.dtype).reshape(-1, self.width)
+        if len(rows) > self.capacity:
+            rows = rows[-self.capacity:]
+        n = len(rows)
+        pos = (self._head + np.arange(n)) % self.capacity
+        self._data[pos] = rows
+        self._data[pos + self.capacity] = rows
+        self._head = (self._head + n) % self.capacity
+        self._count = min(self._count + n, self.capacity)
+
+    def view(self) -> np.ndarray:
+        """Rows oldest -> newest as an (n, width) view (valid until the next write)."""
+        if self._count < self.capacity:
+            return self._data[:self._count]
+        return self._data[self._head:self._head + self.capacity]
+
+    def columns(self, copy: bool = False) -> tuple:
+        """
+        Tuple of per-column 1-D arrays, oldest -> newest.
+
+        Args:
+            copy: Return independent copies. The default views are
+                  overwritten in place by later appends, so anything that
+                  keeps the arrays (e.g. pyqtgraph setData) must copy.
+        """
+        v = self.view()
+        return tuple(v[:, i].copy() if copy else v[:, i] for i in range(self.width))
+
+    def last(self):
+        """Newest row, or None if empty."""
+        if self._count == 0:
+            return None
+        return self._data[(self._head - 1) % self.capacity]
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
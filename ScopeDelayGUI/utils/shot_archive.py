@@ -0,0 +1,297 @@
+"""
+Binary shot archive - one file per shot, raw scope codes + settings.
+
+Stores the raw uint8 ADC codes and preamble of every captured channel,
+the scope IDs and the DG535/BNC575 settings in use for the shot. Voltage
+and time are rebuilt on load from the preamble (see instruments.waveform),
+so nothing is lost compared to the CSV export at ~1/16 of the size.
+
+Two container formats, picked from the file extension:
+    .h5 / .hdf5 - HDF5 via h5py (chunked, gzip-compressed datasets,
+                  partial reads with load_channel())
+    .npz        - NumPy zip archive (no extra dependency)
+
+Layout (HDF5):
+    /                   attrs: format_version, timestamp, settings (JSON)
+    /scope<id>/ch<n>    uint8 codes, attrs: channel + preamble fields
+
+Layout (NPZ):
+    meta                JSON string: format_version, timestamp, settings
+    scope<id>_ch<n>     uint8 codes
+    scope<id>_ch<n>_pre float64 preamble (PREAMBLE_FIELDS order)
+
+Usage:
+    save_shot("shot_001.h5", {1: wfs1, 2: wfs2}, settings=settings)
+    shot = load_shot("shot_001.h5")
+    t, v = shot.data[1][0]      # scope 1, CH1
+"""
+
+import importlib.util
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+from instruments.waveform import Waveform
+
+
+def _h5py():
+    """
+    Import h5py on first use (keeps it off the GUI startup path).
+
+    Returns:
+        The h5py module, or None if not installed (HDF5 support is
+        optional, .npz always works)
+    """
+    try:
+        import h5py
+    except ImportError:
+        return None
+    return h5py
+
+
+def hdf5_available() -> bool:
+    """True if h5py is installed (checked without importing it)"""
+    return importlib.util.find_spec('h5py') is not None
+
+
+FORMAT_VERSION = 1
+
+# Preamble fields stored per channel, in :WAVeform:PREamble? order
+PREAMBLE_FIELDS = ('format', 'type', 'points', 'count',
+                   'xincrement', 'xorigin', 'xreference',
+                   'yincrement', 'yorigin', 'yreference')
+
+HDF5_EXTENSIONS = ('.h5', '.hdf5')
+ARCHIVE_EXTENSIONS = HDF5_EXTENSIONS + ('.npz',)
+
+# HDF5 chunk length in samples (1M-point record -> 16 chunks)
+CHUNK_POINTS = 65536
+
+
+@dataclass
+class ArchivedShot:
+    """
+    One shot loaded from an archive.
+
+    Attributes:
+        timestamp: Time the shot was captured
+        data: scope_id -> tuple of Waveforms (one per channel)
+        settings: Instrument settings saved with the shot (DG535, BNC575, ...)
+        path: File the shot was loaded from
+    """
+    timestamp: datetime = None
+    data: Dict[int, tuple] = field(default_factory=dict)
+    settings: dict = field(default_factory=dict)
+    path: str = ""
+
+    @property
+    def scope_ids(self) -> list:
+        """Scope IDs in the archive, in ascending order."""
+        return sorted(self.data.keys())
+
+
+def _is_hdf5(filename) -> bool:
+    return Path(filename).suffix.lower() in HDF5_EXTENSIONS
+
+
+def _as_waveform(channel_data, channel: int) -> Waveform:
+    """Archives hold raw codes only; (t, v) tuples cannot be stored."""
+    if isinstance(channel_data, Waveform):
+        return channel_data
+    if channel_data is None:
+        return Waveform.empty(channel)
+    raise TypeError("Shot archives store raw Waveform captures, not (t, v) arrays")
+
+
+def _preamble_array(wf: Waveform) -> np.ndarray:
+    return np.array([wf.preamble.get(name, getattr(wf, name, 0.0))
+                     for name in PREAMBLE_FIELDS], dtype=np.float64)
+
+
+def _preamble_dict(values) -> dict:
+    pre = dict(zip(PREAMBLE_FIELDS, (float(v) for v in values)))
+    for name in ('format', 'type', 'points', 'count'):
+        pre[name] = int(pre[name])
+    return pre
+
+
+def save_shot(filename, captures: dict, settings: dict = None,
+              timestamp: datetime = None, compression: bool = True,
+              level: int = 4) -> str:
+    """
+    Write one shot to a binary archive.
+
+    Args:
+        filename: Output path (.h5/.hdf5 for HDF5, anything else -> .npz)
+        captures: scope_id -> tuple of Waveforms (2 or 4 channels)
+        settings: JSON-serialisable dict of instrument settings
+        timestamp: Shot time (default: now)
+        compression: Compress the waveform data
+        level: gzip level for HDF5 (0-9)
+
+    Returns:
+        Path of the written file
+    """
+    timestamp = timestamp or datetime.now()
+    settings = settings or {}
+
+    if _is_hdf5(filename):
+        return _save_hdf5(filename, captures, settings, timestamp, compression, level)
+    return _save_npz(filename, captures, settings, timestamp, compression)
+
+
+def _save_hdf5(filename, captures, settings, timestamp, compression, level) -> str:
+    h5py = _h5py()
+    if h5py is None:
+        raise ImportError("h5py is required for .h5 archives (pip install h5py), "
+                          "or save as .npz")
+
+    with h5py.File(filename, 'w') as f:
+        f.attrs['format_version'] = FORMAT_VERSION
+        f.attrs['timestamp'] = timestamp.isoformat()
+        f.attrs['settings'] = json.dumps(settings, default=str)
+
+        for scope_id in sorted(captures):
+            group = f.create_group(f"scope{scope_id}")
+            group.attrs['scope_id'] = int(scope_id)
+            for i, channel_data in enumerate(captures[scope_id], start=1):
+                wf = _as_waveform(channel_data, i)
+                n = len(wf)
+                opts = {}
+                if n:
+                    opts['chunks'] = (min(n, CHUNK_POINTS),)
+                    if compression:
+                        opts['compression'] = 'gzip'
+                        opts['compression_opts'] = level
+                ds = group.create_dataset(f"ch{i}", data=wf.codes, **opts)
+                ds.attrs['channel'] = wf.channel or i
+                for name, value in zip(PREAMBLE_FIELDS, _preamble_array(wf)):
+                    ds.attrs[name] = value
+
+    return str(filename)
+
+
+def _save_npz(filename, captures, settings, timestamp, compression) -> str:
+    arrays = {}
+    channels = {}
+    for scope_id in sorted(captures):
+        channels[str(scope_id)] = []
+        for i, channel_data in enumerate(captures[scope_id], start=1):
+            wf = _as_waveform(channel_data, i)
+            key = f"scope{scope_id}_ch{i}"
+            arrays[key] = wf.codes
+            arrays[f"{key}_pre"] = _preamble_array(wf)
+            channels[str(scope_id)].append(wf.channel or i)
+
+    meta = {
+        'format_version': FORMAT_VERSION,
+        'timestamp': timestamp.isoformat(),
+        'settings': settings,
+        'channels': channels,
+    }
+    arrays['meta'] = np.array(json.dumps(meta, default=str))
+
+    # np.savez appends .npz if missing; write through a file object so the
+    # returned path is exactly the one given
+    with open(filename, 'wb') as f:
+        if compression:
+            np.savez_compressed(f, **arrays)
+        else:
+            np.savez(f, **arrays)
+
+    return str(filename)
+
+
+def load_shot(filename) -> ArchivedShot:
+    """
+    Load a shot archive written by save_shot().
+
+    Args:
+        filename: .h5/.hdf5 or .npz archive
+
+    Returns:
+        ArchivedShot with one Waveform tuple per scope
+    """
+    if _is_hdf5(filename):
+        return _load_hdf5(filename)
+    return _load_npz(filename)
+
+
+def _load_hdf5(filename) -> ArchivedShot:
+    h5py = _h5py()
+    if h5py is None:
+        raise ImportError("h5py is required to read .h5 archives (pip install h5py)")
+
+    shot = ArchivedShot(path=str(filename))
+    with h5py.File(filename, 'r') as f:
+        shot.timestamp = datetime.fromisoformat(f.attrs['timestamp'])
+        shot.settings = json.loads(f.attrs['settings'])
+
+        for name, group in f.items():
+            scope_id = int(group.attrs['scope_id'])
+            keys = sorted(group.keys(), key=lambda k: int(k[2:]))
+            shot.data[scope_id] = tuple(_read_hdf5_channel(group[k]) for k in keys)
+
+    return shot
+
+
+def _read_hdf5_channel(ds, start: int = 0, stop: int = None) -> Waveform:
+    pre = _preamble_dict(ds.attrs[name] for name in PREAMBLE_FIELDS)
+    codes = ds[start:stop]
+    if start:
+        # Keep the time axis right for a partial read
+        pre['xorigin'] += start * pre['xincrement']
+    return Waveform(codes, pre, int(ds.attrs['channel']))
+
+
+def _load_npz(filename) -> ArchivedShot:
+    shot = ArchivedShot(path=str(filename))
+    with np.load(filename, allow_pickle=False) as npz:
+        meta = json.loads(str(npz['meta']))
+        shot.timestamp = datetime.fromisoformat(meta['timestamp'])
+        shot.settings = meta.get('settings', {})
+
+        for scope_key, channel_numbers in meta['channels'].items():
+            scope_id = int(scope_key)
+            waveforms = []
+            for i, channel in enumerate(channel_numbers, start=1):
+                key = f"scope{scope_id}_ch{i}"
+                waveforms.append(Waveform(npz[key], _preamble_dict(npz[f"{key}_pre"]), channel))
+            shot.data[scope_id] = tuple(waveforms)
+
+    return shot
+
+
+def load_channel(filename, scope_id: int, channel: int,
+                 start: int = 0, stop: int = None) -> Waveform:
+    """
+    Load one channel (optionally a sample range) without reading the rest.
+
+    HDF5 archives only decompress the chunks covering [start, stop);
+    NPZ archives load the whole channel and slice it.
+
+    Args:
+        filename: Archive path
+        scope_id: Scope ID (1-3)
+        channel: Channel number (1-4)
+        start: First sample index
+        stop: End sample index (exclusive), None for end of record
+    """
+    if _is_hdf5(filename):
+        h5py = _h5py()
+        if h5py is None:
+            raise ImportError("h5py is required to read .h5 archives (pip install h5py)")
+        with h5py.File(filename, 'r') as f:
+            return _read_hdf5_channel(f[f"scope{scope_id}/ch{channel}"], start, stop)
+
+    with np.load(filename, allow_pickle=False) as npz:
+        key = f"scope{scope_id}_ch{channel}"
+        pre = _preamble_dict(npz[f"{key}_pre"])
+        codes = npz[key][start:stop]
+    if start:
+        pre['xorigin'] += start * pre['xincrement']
+    return Waveform(codes, pre, channel)
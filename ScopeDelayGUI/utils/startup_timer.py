@@ -0,0 +1,55 @@
+# utils/startup_timer.py
+"""
+Startup phase timing.
+
+main.py imports this module before anything else, so the clock starts
+before PyQt6, pyqtgraph and the GUI modules are loaded. Each mark()
+records the time since the previous mark; report() formats the phases
+for the log panel once the GUI is up.
+
+Usage:
+    from utils.startup_timer import startup
+    startup.mark("imports")
+    ...
+    for line in startup.report():
+        print(line)
+"""
+
+import time
+
+
+class StartupTimer:
+    """Records named startup phases and their durations"""
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self._last = self.t0
+        self.phases = []   # (label, seconds)
+
+    def mark(self, label: str) -> float:
+        """
+        End the current phase.
+
+        Returns:
+            Duration of the phase in seconds
+        """
+        now = time.perf_counter()
+        dt = now - self._last
+        self.phases.append((label, dt))
+        self._last = now
+        return dt
+
+    def elapsed(self) -> float:
+        """Seconds since the timer started"""
+        return time.perf_counter() - self.t0
+
+    def report(self) -> list:
+        """One line per phase plus a total line"""
+        width = max((len(label) for label, _ in self.phases), default=0)
+        lines = [f"{label:<{width}}  {dt * 1000:8.1f} ms" for label, dt in self.phases]
+        lines.append(f"{'total':<{width}}  {(self._last - self.t0) * 1000:8.1f} ms")
+        return lines
+
+
+# Process-wide timer, started when main.py first imports this module
+startup = StartupTimer()
@@ -0,0 +1,157 @@
+# utils/telemetry_log.py
+"""
+Typed binary telemetry log, written alongside the experiment_log CSV.
+
+Each event type gets its own file of fixed-size little-endian records
+(one NumPy structured dtype per type), so a single type can be loaded
+with one np.fromfile() call instead of re-parsing the text log:
+
+    logs/experiment_log_<ts>_telemetry/
+        schema.json         event type -> [[field, dtype], ...]
+        ARDUINO_PSI.bin     t, ch0, ch1, ch2
+        WJ_VOLTAGE.bin      t, unit, kv, ma, hv_on, fault
+        ...
+
+Every record starts with `t`, seconds since the logger started (same
+clock as the CSV timestamp_sec column). Events without a schema (INFO,
+ERROR, custom) stay in the CSV only.
+
+Loading:
+    psi = load_telemetry("logs/experiment_log_..._telemetry", "ARDUINO_PSI")
+    psi["t"], psi["ch0"]
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+
+# Event type -> record fields after `t`
+SCHEMAS = {
+    'ARDUINO_PSI':    [('ch0', '<f4'), ('ch1', '<f4'), ('ch2', '<f4')],
+    'ARDUINO_SWITCH': [('index', '<i2'), ('state', 'u1')],
+    'WJ_VOLTAGE':     [('unit', 'u1'), ('kv', '<f4'), ('ma', '<f4'),
+                       ('hv_on', 'u1'), ('fault', 'u1')],
+    'WJ_COMMAND':     [('unit', 'u1'), ('command', 'S16'), ('value', 'S16')],
+    'DG535_PULSE':    [('delay_a', '<f8'), ('width_a', '<f8')],
+    'DG535_CONFIG':   [('delay_a', '<f8'), ('width_a', '<f8')],
+    'BNC575_PULSE':   [('mode', 'S16')],
+    'BNC575_ARM':     [('trigger_level', '<f4')],
+    'BNC575_CONFIG':  [('wa', '<f8'), ('da', '<f8'), ('wb', '<f8'), ('db', '<f8'),
+                       ('wc', '<f8'), ('dc', '<f8'), ('wd', '<f8'), ('dd', '<f8')],
+    'SCOPE_CAPTURE':  [('scope_id', 'u1'), ('points_ch1', '<i4'), ('points_ch2', '<i4')],
+    'SCOPE_ALL':      [],
+    'SCOPE_ARM':      [('scope_id', 'u1')],
+}
+
+DTYPES = {name: np.dtype([('t', '<f8')] + fields) for name, fields in SCHEMAS.items()}
+
+SCHEMA_FILE = 'schema.json'
+
+
+class TelemetryLog:
+    """
+    Appends typed records to one .bin file per event type.
+
+    append() only buffers; flush() converts each buffer to a structured
+    array and appends it with a single write. Not thread-safe - used from
+    the DataLogger writer thread only.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._buffers = {}
+        self._files = {}
+
+        schema = {name: [[f, dt.descr[i][1]] for i, f in enumerate(dt.names)]
+                  for name, dt in DTYPES.items()}
+        with open(self.directory / SCHEMA_FILE, 'w') as f:
+            json.dump(schema, f, indent=2)
+
+    def append(self, event_type, t, values) -> bool:
+        """
+        Buffer one record.
+
+        Args:
+            event_type: Key of SCHEMAS
+            t: Seconds since logger start
+            values: Field values in SCHEMAS order
+
+        Returns:
+            False if the event type has no schema (not logged)
+        """
+        if event_type not in DTYPES:
+            return False
+        self._buffers.setdefault(event_type, []).append((t, *values))
+        return True
+
+    def flush(self):
+        """Write all buffered records"""
+        for event_type, records in self._buffers.items():
+            if not records:
+                continue
+            f = self._files.get(event_type)
+            if f is None:
+                f = open(self.directory / f"{event_type}.bin", 'ab')
+                self._files[event_type] = f
+            self._to_array(records, DTYPES[event_type]).tofile(f)
+            f.flush()
+            records.clear()
+
+    @staticmethod
+    def _to_array(records, dtype):
+        """Convert buffered tuples, dropping any record that does not fit the schema"""
+        try:
+            return np.array(records, dtype=dtype)
+        except (TypeError, ValueError):
+            good = []
+            for record in records:
+                try:
+                    np.array([record], dtype=dtype)
+                    good.append(record)
+                except (TypeError, ValueError):
+                    pass
+            return np.array(good, dtype=dtype)
+
+    def fileno_all(self):
+        """File descriptors of the open .bin files (for fsync)"""
+        return [f.fileno() for f in self._files.values()]
+
+    def close(self):
+        self.flush()
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+
+def load_telemetry(directory, event_type=None):
+    """
+    Load a telemetry directory written by TelemetryLog.
+
+    Args:
+        directory: The *_telemetry directory
+        event_type: Load one type only (e.g. 'ARDUINO_PSI'); None for all
+
+    Returns:
+        Structured array for one type, or dict of event type -> array
+    """
+    directory = Path(directory)
+    with open(directory / SCHEMA_FILE) as f:
+        schema = json.load(f)
+    dtypes = {name: np.dtype([tuple(field) for field in fields])
+              for name, fields in schema.items()}
+
+    def load(name):
+        path = directory / f"{name}.bin"
+        if not path.exists():
+            return np.empty(0, dtype=dtypes[name])
+        # Ignore a partial trailing record (e.g. after a crash mid-write)
+        count = path.stat().st_size // dtypes[name].itemsize
+        return np.fromfile(path, dtype=dtypes[name], count=count)
+
+    if event_type is not None:
+        return load(event_type)
+    return {name: load(name) for name in dtypes
+            if (directory / f"{name}.bin").exists()}
@@ -0,0 +1,223 @@
+# utils/wj_scheduler.py
+"""
+Per-port I/O scheduler for a WJ high-voltage supply.
+
+One WJScheduler thread owns each WJPowerSupply and is the only code that
+touches its serial port. Everything else submits jobs:
+
+    SAFETY   - HV off, reset (jump ahead of everything queued)
+    COMMAND  - setpoints, HV on, on-demand readback, connect/close
+    POLL     - telemetry query, run only when the queue is idle
+
+Jobs at the same priority run in submission order. A job already on the
+wire is never interrupted, so an HV-off waits at most one transaction.
+
+Polling is adaptive (WJPollPolicy): fast while HV is on or the readings
+are moving, slow when idle, and a reading is only emitted when it moved
+outside the deadband, the HV/fault state changed, or the heartbeat is due.
+
+Usage:
+    sched = WJScheduler(wj, policy=WJPollPolicy(idle_interval=1.0))
+    sched.new_data.connect(on_sample)          # (t, kV, mA) per emitted reading
+    sched.start()
+    resp = sched.call(wj.hv_off_pulse, priority=WJScheduler.SAFETY)
+    future = sched.submit(wj.set_program, 20.0, 1.0)
+"""
+
+import itertools
+import queue
+import time
+from concurrent.futures import Future
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+class WJPollPolicy:
+    """
+    Poll rate and change-only emission for WJ telemetry.
+
+    Fast polling while HV is on, after a command, or while kV/mA are still
+    moving (for `active_hold` seconds after the last change); slow polling
+    otherwise. should_emit() drops readings unchanged within the deadband,
+    but always passes an HV/fault change and at least one reading every
+    `heartbeat` seconds.
+    """
+
+    def __init__(self, fast_interval=0.05, idle_interval=1.0,
+                 kv_deadband=0.05, ma_deadband=0.005,
+                 heartbeat=5.0, active_hold=5.0):
+        """
+        Args:
+            fast_interval: Poll interval while active (s)
+            idle_interval: Poll interval while idle (s)
+            kv_deadband: kV change treated as "unchanged"
+            ma_deadband: mA change treated as "unchanged"
+            heartbeat: Max seconds between emitted readings (0 = emit all)
+            active_hold: Seconds to stay fast after the last change/command
+        """
+        self.fast_interval = fast_interval
+        self.idle_interval = idle_interval
+        self.kv_deadband = kv_deadband
+        self.ma_deadband = ma_deadband
+        self.heartbeat = heartbeat
+        self.active_hold = active_hold
+
+        self._last = None           # (kv, ma, hv_on, fault) last emitted
+        self._last_emit = 0.0
+        self._active_until = 0.0
+        self._hv_on = False
+
+    def kick(self, now=None):
+        """Poll fast for a while (call after sending a command)."""
+        now = time.monotonic() if now is None else now
+        self._active_until = max(self._active_until, now + self.active_hold)
+
+    def interval(self, now=None) -> float:
+        """Seconds until the next poll."""
+        now = time.monotonic() if now is None else now
+        if self._hv_on or now < self._active_until:
+            return self.fast_interval
+        return self.idle_interval
+
+    def should_emit(self, data: dict, now=None) -> bool:
+        """
+        Record an R-packet reading; True if it should be emitted.
+
+        Args:
+            data: WJPowerSupply.query() result with kv/ma/hv_on/fault
+        """
+        now = time.monotonic() if now is None else now
+        kv, ma = data["kv"], data["ma"]
+        hv_on, fault = bool(data.get("hv_on")), bool(data.get("fault"))
+        self._hv_on = hv_on
+
+        last = self._last
+        changed = (last is None
+                   or abs(kv - last[0]) > self.kv_deadband
+                   or abs(ma - last[1]) > self.ma_deadband
+                   or (hv_on, fault) != last[2:])
+        if changed:
+            self.kick(now)
+        elif self.heartbeat and now - self._last_emit < self.heartbeat:
+            return False
+
+        self._last = (kv, ma, hv_on, fault)
+        self._last_emit = now
+        return True
+
+
+class WJScheduler(QThread):
+    new_data = pyqtSignal(float, float, float)   # time, kV, mA
+    status = pyqtSignal(dict)                    # full query() dict per emitted reading
+    reply = pyqtSignal(dict)                     # poll replies other than R packets (errors)
+
+    # Priorities (lower runs first)
+    SAFETY = 0
+    COMMAND = 1
+    POLL = 2
+
+    # Default wait for call()
+    CALL_TIMEOUT = 5.0
+
+    def __init__(self, wj, policy=None, parent=None):
+        """
+        Args:
+            wj: WJPowerSupply owned by this scheduler
+            policy: WJPollPolicy (default: 50 ms active / 1 s idle)
+        """
+        super().__init__(parent)
+        self.wj = wj
+        self.policy = policy or WJPollPolicy()
+        self.polling = True
+        self.running = True
+        self.t0 = time.time()
+
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+
+    # ------------------------------------------------------------------
+    # Job submission (any thread)
+    # ------------------------------------------------------------------
+    def submit(self, func, *args, priority=COMMAND, **kwargs) -> Future:
+        """
+        Queue func(*args, **kwargs) to run on the port thread.
+
+        Returns:
+            Future resolving to func's return value (or its exception)
+        """
+        future = Future()
+        if not self.isRunning():
+            # Not started (or already stopped) - nothing else owns the port
+            self._run_job(future, func, args, kwargs)
+            return future
+        self._queue.put((priority, next(self._seq), future, func, args, kwargs))
+        return future
+
+    def call(self, func, *args, priority=COMMAND, timeout=None, **kwargs):
+        """
+        submit() and wait for the result.
+
+        Raises:
+            Whatever func raised; concurrent.futures.TimeoutError on timeout
+        """
+        future = self.submit(func, *args, priority=priority, **kwargs)
+        return future.result(self.CALL_TIMEOUT if timeout is None else timeout)
+
+    # ------------------------------------------------------------------
+    # Port thread
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _run_job(future, func, args, kwargs):
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+    def run(self):
+        next_poll = time.monotonic()
+        while self.running:
+            wait = max(0.0, next_poll - time.monotonic())
+            try:
+                priority, _, future, func, args, kwargs = self._queue.get(timeout=wait)
+            except queue.Empty:
+                self._poll()
+                next_poll = time.monotonic() + self.policy.interval()
+                continue
+
+            if future is None:      # stop() sentinel
+                break
+            self._run_job(future, func, args, kwargs)
+
+            # A command may start a ramp: poll fast, starting now
+            if priority < self.POLL:
+                self.policy.kick()
+                next_poll = time.monotonic()
+
+        # Fail anything still queued so callers are not left waiting
+        while True:
+            try:
+                _, _, future, *_ = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if future is not None and future.set_running_or_notify_cancel():
+                future.set_exception(RuntimeError("WJ scheduler stopped"))
+
+    def _poll(self):
+        if not self.polling or not self.wj.is_connected:
+            return
+        try:
+            data = self.wj.query()
+        except Exception:
+            return
+        if data.get("type") != "R" or "kv" not in data:
+            self.reply.emit(data)
+        elif self.policy.should_emit(data):
+            self.status.emit(data)
+            self.new_data.emit(time.time() - self.t0, data["kv"], data["ma"])
+
+    def stop(self):
+        self.running = False
+        self._queue.put((-1, -1, None, None, (), {}))
+        self.wait()